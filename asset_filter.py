@@ -0,0 +1,108 @@
+import collections
+import os
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+# Opt-in request filter for talent search pages: avatars, demo audio, web fonts and
+# third-party analytics are never used by the automation, but they keep the network busy.
+# Only requests made while a tab is on a matching page are filtered, so login/SSO and
+# job pages load normally. Installed per context with context.route, which covers CDP,
+# persistent and bundled-browser launches alike.
+#   VOICES_BLOCK_ASSETS       1 = enable (--block-assets in invite_all.py)
+#   VOICES_ASSET_ALLOW_HOSTS  extra comma-separated hosts treated as first-party (e.g. a CDN)
+#   VOICES_ASSET_PAGES        comma-separated URL substrings where filtering applies (default /talents/search)
+# Blocked requests are never downloaded, so their size is unknown; the report counts requests
+# (by resource type) rather than bytes.
+BLOCK_ASSETS = os.environ.get("VOICES_BLOCK_ASSETS", "0").lower() in {"1", "true", "yes", "on"}
+FIRST_PARTY_HOSTS = ("voices.com",) + tuple(
+    h.strip().lower() for h in os.environ.get("VOICES_ASSET_ALLOW_HOSTS", "").split(",") if h.strip()
+)
+FILTER_PAGES = tuple(
+    p.strip().lower() for p in os.environ.get("VOICES_ASSET_PAGES", "/talents/search").split(",") if p.strip()
+)
+# Never needed, even from first-party hosts
+BLOCKED_TYPES = {"image", "media", "font"}
+# First-party types the search page needs to render cards and run its UI
+ALLOWED_TYPES = {"document", "script", "xhr", "fetch", "stylesheet", "websocket", "eventsource", "manifest", "other"}
+
+
+def _first_party(url: str) -> bool:
+    host = (urlparse(url).hostname or "").lower()
+    return any(host == h or host.endswith("." + h) for h in FIRST_PARTY_HOSTS)
+
+
+def should_block(resource_type: str, url: str) -> bool:
+    if resource_type in BLOCKED_TYPES:
+        return True
+    if not _first_party(url):
+        # Third-party: only a top-level navigation gets through (e.g. an SSO redirect)
+        return resource_type != "document"
+    return resource_type not in ALLOWED_TYPES
+
+
+class AssetFilter:
+    def __init__(self):
+        self._blocked: Dict[int, collections.Counter] = {}
+        self._allowed: Dict[int, int] = {}
+        self.total_blocked = 0
+
+    async def install(self, context) -> bool:
+        try:
+            await context.route("**/*", self._handle)
+            return True
+        except Exception as e:
+            print(f"[warn] Could not install the asset filter: {e}")
+            return False
+
+    async def _handle(self, route):
+        request = route.request
+        try:
+            page = request.frame.page
+            page_url = (page.url or "").lower()
+        except Exception:
+            page, page_url = None, ""
+        # The first navigation of a tab has no URL yet; the target decides for documents
+        if request.resource_type == "document" and request.is_navigation_request():
+            page_url = request.url.lower()
+        active = page is not None and any(p in page_url for p in FILTER_PAGES)
+        if active and should_block(request.resource_type, request.url):
+            self._blocked.setdefault(id(page), collections.Counter())[request.resource_type] += 1
+            self.total_blocked += 1
+            try:
+                await route.abort("blockedbyclient")
+            except Exception:
+                pass
+            return
+        if page is not None:
+            self._allowed[id(page)] = self._allowed.get(id(page), 0) + 1
+        try:
+            await route.continue_()
+        except Exception:
+            pass
+
+    def take_report(self, page) -> dict:
+        """Blocked/allowed request counts for page since the previous report (then reset)."""
+        blocked = self._blocked.pop(id(page), collections.Counter())
+        allowed = self._allowed.pop(id(page), 0)
+        return {"blocked": sum(blocked.values()), "blocked_by_type": dict(blocked), "allowed": allowed}
+
+
+_FILTER: Optional[AssetFilter] = None
+
+
+def get_filter() -> Optional[AssetFilter]:
+    return _FILTER
+
+
+async def install_asset_filter(context, enabled: Optional[bool] = None) -> Optional[AssetFilter]:
+    """Route context requests through the filter when enabled (default VOICES_BLOCK_ASSETS)."""
+    global _FILTER
+    if not (BLOCK_ASSETS if enabled is None else enabled):
+        return None
+    if _FILTER is None:
+        _FILTER = AssetFilter()
+    return _FILTER if await _FILTER.install(context) else None
+
+
+def take_page_report(page) -> Optional[dict]:
+    return _FILTER.take_report(page) if _FILTER is not None else None
@@ -0,0 +1,366 @@
+import atexit
+import glob
+import gzip
+import hashlib
+import json
+import os
+import queue
+import re
+import shutil
+import signal
+import threading
+import time
+from typing import Dict, Iterator, List, Optional
+
+# Background JSONL event writer shared by the scripts. log_event callers only enqueue;
+# a daemon thread batches the writes so logging never blocks the browser-driving loop.
+#   VOICES_LOG_FLUSH_INTERVAL  seconds between batched writes (default 0.5)
+#   VOICES_LOG_QUEUE_SIZE      max queued events before new ones are dropped (default 10000)
+LOG_FLUSH_INTERVAL = float(os.environ.get("VOICES_LOG_FLUSH_INTERVAL", 0.5))
+LOG_QUEUE_SIZE = int(os.environ.get("VOICES_LOG_QUEUE_SIZE", 10000))
+# Rotation: the live file is capped; older segments become "<log>.<timestamp>.gz".
+#   VOICES_LOG_MAX_BYTES        rotate once the live file would exceed this (default 20 MB; 0 = never)
+#   VOICES_LOG_BACKUPS          compressed segments to keep (default 20; 0 = keep all)
+#   VOICES_LOG_ROTATE_ON_START  "1" to start every run with a fresh live file
+LOG_MAX_BYTES = int(os.environ.get("VOICES_LOG_MAX_BYTES", 20 * 1024 * 1024))
+LOG_BACKUPS = int(os.environ.get("VOICES_LOG_BACKUPS", 20))
+LOG_ROTATE_ON_START = os.environ.get("VOICES_LOG_ROTATE_ON_START", "0").lower() in {"1", "true", "yes", "on"}
+# Large artifacts (outerHTML dumps, page HTML, screenshots) are written once to
+# "<log>.blobs/<aa>/<sha256>.<ext>" and events carry only the "sha256:<hex>" reference.
+#   VOICES_BLOB_MIN_BYTES  artifacts smaller than this stay inline in the event (default 256)
+BLOB_MIN_BYTES = int(os.environ.get("VOICES_BLOB_MIN_BYTES", 256))
+
+
+_SEGMENT_RE = re.compile(r"\.(\d{8}-\d{6}-\d{3})(?:-(\d+))?\.gz$")
+
+
+def rotated_segments(path: str) -> List[str]:
+    """Compressed segments of path, oldest first."""
+    def _key(name: str):
+        m = _SEGMENT_RE.search(name)
+        return (m.group(1), int(m.group(2) or 0)) if m else ("", 0)
+    segs = [g for g in glob.glob(glob.escape(path) + ".*.gz") if _SEGMENT_RE.search(g)]
+    return sorted(segs, key=_key)
+
+
+def rotate(path: str, backups: int = LOG_BACKUPS) -> Optional[str]:
+    """Move the live file aside as a gzip segment and prune old segments.
+    Returns the new segment path (None if there was nothing to rotate).
+    """
+    try:
+        if not os.path.exists(path) or os.path.getsize(path) == 0:
+            return None
+    except OSError:
+        return None
+    now = time.time()
+    stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(now)) + f"-{int(now * 1000) % 1000:03d}"
+    seg = f"{path}.{stamp}.gz"
+    n = 1
+    while os.path.exists(seg):
+        seg = f"{path}.{stamp}-{n}.gz"
+        n += 1
+    tmp = seg[:-3] + ".tmp"
+    os.replace(path, tmp)
+    try:
+        with open(tmp, "rb") as src, gzip.open(seg, "wb") as dst:
+            shutil.copyfileobj(src, dst)
+        os.remove(tmp)
+    except Exception:
+        # Keep the data even if compression failed
+        try:
+            os.replace(tmp, seg[:-3])
+        except Exception:
+            pass
+    if backups > 0:
+        for old in rotated_segments(path)[:-backups]:
+            try:
+                os.remove(old)
+            except Exception:
+                pass
+    return seg
+
+
+def iter_events(path: str, include_rotated: bool = True) -> Iterator[dict]:
+    """Stream events oldest-first across the compressed segments and the live file.
+    Reads line by line, so memory use is constant regardless of log size.
+    """
+    files = (rotated_segments(path) if include_rotated else []) + [path]
+    for f in files:
+        try:
+            opener = gzip.open if f.endswith(".gz") else open
+            with opener(f, "rt", encoding="utf-8", errors="replace") as fh:
+                for line in fh:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        evt = json.loads(line)
+                    except Exception:
+                        continue
+                    if isinstance(evt, dict):
+                        yield evt
+        except FileNotFoundError:
+            continue
+
+
+_BLOBS_STORED = set()
+_BLOBS_LOCK = threading.Lock()
+
+
+def blob_dir(log_path: str) -> str:
+    return log_path + ".blobs"
+
+
+def store_blob(log_path: str, data, ext: str = "bin") -> Optional[str]:
+    """Write data (str or bytes) to the log's content-addressed store unless it is
+    already there, and return its "sha256:<hex>" reference (None on failure).
+    """
+    if not log_path or data is None:
+        return None
+    try:
+        raw = data.encode("utf-8") if isinstance(data, str) else bytes(data)
+        digest = hashlib.sha256(raw).hexdigest()
+        ref = "sha256:" + digest
+        key = (log_path, digest)
+        with _BLOBS_LOCK:
+            if key in _BLOBS_STORED:
+                return ref
+        folder = os.path.join(blob_dir(log_path), digest[:2])
+        dest = os.path.join(folder, f"{digest}.{ext.lstrip('.') or 'bin'}")
+        if not os.path.exists(dest):
+            os.makedirs(folder, exist_ok=True)
+            tmp = f"{dest}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp, "wb") as fh:
+                fh.write(raw)
+            os.replace(tmp, dest)
+        with _BLOBS_LOCK:
+            _BLOBS_STORED.add(key)
+        return ref
+    except Exception:
+        return None
+
+
+def blob_path(log_path: str, ref: str) -> Optional[str]:
+    """Resolve a "sha256:<hex>" reference to the stored file, if present."""
+    digest = str(ref or "").split(":", 1)[-1].lower()
+    if not re.fullmatch(r"[0-9a-f]{64}", digest):
+        return None
+    hits = glob.glob(os.path.join(glob.escape(blob_dir(log_path)), digest[:2], digest + ".*"))
+    hits = [h for h in hits if not h.endswith(".tmp")]
+    return hits[0] if hits else None
+
+
+def read_blob(log_path: str, ref: str) -> Optional[bytes]:
+    path = blob_path(log_path, ref)
+    if not path:
+        return None
+    try:
+        with open(path, "rb") as fh:
+            return fh.read()
+    except Exception:
+        return None
+
+
+def artifact_fields(log_path: str, name: str, data, ext: str, min_bytes: int = BLOB_MIN_BYTES) -> dict:
+    """Event fields for an artifact: {name + "_ref": ref} when it went to the blob store,
+    otherwise {name: data} inline (small values, no log file, or a failed write).
+    """
+    if data is None:
+        return {name: None}
+    size = len(data.encode("utf-8")) if isinstance(data, str) else len(data)
+    if log_path and size >= max(0, int(min_bytes)):
+        ref = store_blob(log_path, data, ext)
+        if ref:
+            return {name + "_ref": ref, name + "_bytes": size}
+    if isinstance(data, (bytes, bytearray)):
+        return {name + "_bytes": size}
+    return {name: data}
+
+
+class EventWriter:
+    """Append events to a JSONL file from a background thread via a bounded queue."""
+
+    def __init__(
+        self,
+        path: str,
+        flush_interval: float = LOG_FLUSH_INTERVAL,
+        max_queue: int = LOG_QUEUE_SIZE,
+        max_bytes: int = LOG_MAX_BYTES,
+        backups: int = LOG_BACKUPS,
+        rotate_on_start: bool = LOG_ROTATE_ON_START,
+    ):
+        self.path = path
+        self.max_bytes = int(max_bytes)
+        self.backups = int(backups)
+        self.rotate_on_start = bool(rotate_on_start)
+        self.flush_interval = max(0.01, float(flush_interval))
+        self.dropped = 0
+        self._q: "queue.Queue" = queue.Queue(maxsize=max(1, int(max_queue)))
+        self._wake = threading.Event()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="event-writer", daemon=True)
+        self._thread.start()
+
+    def write(self, evt: dict):
+        """Enqueue one event (already a private copy); never blocks."""
+        if self._closed:
+            return
+        try:
+            self._q.put_nowait(evt)
+        except queue.Full:
+            self.dropped += 1
+
+    def flush(self, timeout: float = 5.0):
+        """Wake the writer and wait until everything queued so far is on disk."""
+        self._wake.set()
+        deadline = time.time() + timeout
+        while self._q.unfinished_tasks and time.time() < deadline and self._thread.is_alive():
+            time.sleep(0.01)
+
+    def close(self, timeout: float = 5.0):
+        if self._closed:
+            return
+        self._closed = True
+        self._wake.set()
+        self._thread.join(timeout)
+
+    def _drain(self) -> list:
+        batch = []
+        while True:
+            try:
+                batch.append(self._q.get_nowait())
+            except queue.Empty:
+                return batch
+
+    def _open(self):
+        try:
+            return open(self.path, "a", encoding="utf-8")
+        except Exception:
+            return None
+
+    def _write_batch(self, fh, batch: list):
+        lines = []
+        for evt in batch:
+            try:
+                lines.append(json.dumps(evt, ensure_ascii=False) + "\n")
+            except Exception:
+                pass
+        if self.dropped:
+            lines.append(json.dumps({"type": "log_dropped", "count": self.dropped, "ts": time.time()}) + "\n")
+            self.dropped = 0
+        data = "".join(lines)
+        if self.max_bytes > 0:
+            try:
+                if fh.tell() > 0 and fh.tell() + len(data.encode("utf-8")) > self.max_bytes:
+                    fh.close()
+                    rotate(self.path, self.backups)
+                    fh = self._open()
+            except Exception:
+                fh = fh if not fh.closed else self._open()
+        if fh is None:
+            return None
+        try:
+            fh.write(data)
+            fh.flush()
+        except Exception:
+            pass
+        return fh
+
+    def _run(self):
+        if self.rotate_on_start:
+            try:
+                rotate(self.path, self.backups)
+            except Exception:
+                pass
+        fh = self._open()
+        while True:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            batch = self._drain()
+            if batch:
+                if fh is None:
+                    fh = self._open()
+                if fh is not None:
+                    fh = self._write_batch(fh, batch)
+            for _ in batch:
+                self._q.task_done()
+            if self._closed and self._q.empty():
+                break
+        if fh is not None:
+            try:
+                fh.close()
+            except Exception:
+                pass
+
+
+_WRITERS: Dict[str, EventWriter] = {}
+_WRITERS_LOCK = threading.Lock()
+_SIGNALS_INSTALLED = False
+
+
+def get_writer(path: str) -> Optional[EventWriter]:
+    """Return the writer for path, starting it on first use."""
+    if not path:
+        return None
+    with _WRITERS_LOCK:
+        w = _WRITERS.get(path)
+        if w is None:
+            w = EventWriter(path)
+            _WRITERS[path] = w
+            _install_signal_flush()
+        return w
+
+
+def write_event(path: str, evt: dict):
+    try:
+        w = get_writer(path)
+        if w is not None:
+            w.write(evt)
+    except Exception:
+        pass
+
+
+def flush_all(timeout: float = 5.0):
+    for w in list(_WRITERS.values()):
+        try:
+            w.flush(timeout)
+        except Exception:
+            pass
+
+
+def close_all(timeout: float = 5.0):
+    for w in list(_WRITERS.values()):
+        try:
+            w.close(timeout)
+        except Exception:
+            pass
+
+
+def _install_signal_flush():
+    """Flush pending events when the GUI stops us (SIGTERM / CTRL_BREAK on Windows),
+    then let the signal take its original effect."""
+    global _SIGNALS_INSTALLED
+    if _SIGNALS_INSTALLED or threading.current_thread() is not threading.main_thread():
+        return
+    _SIGNALS_INSTALLED = True
+    for name in ("SIGTERM", "SIGBREAK"):
+        sig = getattr(signal, name, None)
+        if sig is None:
+            continue
+        try:
+            prev = signal.getsignal(sig)
+
+            def _handler(signum, frame, _prev=prev):
+                flush_all(2.0)
+                if callable(_prev):
+                    _prev(signum, frame)
+                else:
+                    signal.signal(signum, _prev if _prev is not None else signal.SIG_DFL)
+                    signal.raise_signal(signum)
+
+            signal.signal(sig, _handler)
+        except Exception:
+            pass
+
+
+atexit.register(close_all)
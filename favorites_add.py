@@ -1,7 +1,11 @@
 import asyncio
 from typing import Optional
 
-from playwright.async_api import async_playwright, TimeoutError as PWTimeout
+from playwright.async_api import async_playwright
+from invite_ledger import ACTION_FAVORITE, TALENT_ID_FROM_ELEMENT_JS, ledger_has, ledger_add
+import rate_limit
+from asset_filter import install_asset_filter, take_page_report
+from page_helpers import mark_stale, wait_ready
 
 
 SEARCH_URL = "https://www.voices.com/talents/search?keywords=&language_ids=1"
@@ -16,6 +20,8 @@ FAVORITE_BTN = ", ".join([
     "[title*='Favorite' i]",
     "[title*='Favourites' i]",
 ])
+# Plain-CSS talent card match used for the page readiness check (mirrors invite_all.TALENT_CARD_CSS)
+TALENT_CARD_CSS = "[data-testid='talent-card'], [data-qa='talent-card'], article"
 FAVORITES_UI_CONTAINERS = ":is([role='dialog'], [role='menu'], [role='listbox'], .modal.show, .dropdown-menu, .popover, .ReactModal__Content)"
 FAVORITE_SUCCESS = ":is(.Toastify__toast, [role='status']):has-text('Saved'), :has-text('Added to Favorites'), :has-text('Favourites'), :has-text('Added to list'), :has-text('saved')"
 
@@ -31,13 +37,11 @@ async def add_all_to_favorites(
     async with async_playwright() as p:
         browser = await p.chromium.launch(headless=headless, slow_mo=slow_mo)
         context = await browser.new_context(storage_state=storage_state)
+        await install_asset_filter(context)
         page = await context.new_page()
 
         await page.goto(search_url)
-        try:
-            await page.wait_for_load_state("networkidle")
-        except PWTimeout:
-            await page.wait_for_load_state("domcontentloaded")
+        await wait_ready(page, TALENT_CARD_CSS)
 
         pages_done = 0
         total_clicked = 0
@@ -62,7 +66,15 @@ async def add_all_to_favorites(
                     h = hearts.nth(i)
                     if not await h.is_visible():
                         continue
+                    # Skip talents already saved to this list on a previous run
+                    try:
+                        talent_id = await h.evaluate(TALENT_ID_FROM_ELEMENT_JS)
+                    except Exception:
+                        talent_id = None
+                    if ledger_has(talent_id, ACTION_FAVORITE, list_title):
+                        continue
                     await h.scroll_into_view_if_needed()
+                    await rate_limit.acquire("heart")
                     await h.click()
 
                     # Choose the list if chooser appears; otherwise rely on default behavior
@@ -90,21 +102,24 @@ async def add_all_to_favorites(
                             pass
 
                     total_clicked += 1
+                    ledger_add(talent_id, ACTION_FAVORITE, list_title, page.url)
                     await asyncio.sleep(0.2)
                 except Exception:
                     continue
 
+            report = take_page_report(page)
+            if report is not None:
+                print(f"[assets] Blocked {report['blocked']} requests on this page {report['blocked_by_type']}")
+
             # Go to next page if pagination is available
             try:
                 await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
                 await asyncio.sleep(0.3)
                 next_link = page.locator("nav[aria-label='Pagination'] >> text=Next").first
                 if await next_link.count():
+                    await mark_stale(page, TALENT_CARD_CSS)
                     await next_link.click()
-                    try:
-                        await page.wait_for_load_state("networkidle")
-                    except PWTimeout:
-                        await page.wait_for_load_state("domcontentloaded")
+                    await wait_ready(page, TALENT_CARD_CSS)
                     pages_done += 1
                     continue
             except Exception:
@@ -1,16 +1,31 @@
-import os, asyncio, random, json, time, re, argparse
+import os, sys, asyncio, contextvars, json, time, re, argparse, collections
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
 from playwright.async_api import async_playwright, TimeoutError as PWTimeout
+from event_log import artifact_fields, write_event
+from tracing import span, start_span, end_span, set_attrs, add_listener, configure as configure_tracing, flush as flush_trace
+import metrics
+import pacing
+import rate_limit
+import asset_filter
+from pagination import PagePlan, offset_url, parse_shard, url_offset
+from learned_stats import LearnedSelector, get_stats, save_stats
+from page_helpers import install_helpers, helper_call, helper_handle, mark_stale, wait_ready
+from invite_ledger import ACTION_INVITE, ACTION_FAVORITE, get_ledger, ledger_has, ledger_add
 
 START_URL = os.environ.get(
     "VOICES_START_URL",
     "https://www.voices.com/talents/search?keywords=&language_ids=1",
 )
 STORAGE_STATE = "voices_auth_state.json"
-CHECKPOINT = "voices_invite_checkpoint.json"
+CHECKPOINT = os.environ.get("VOICES_CHECKPOINT", "voices_invite_checkpoint.json")
 # Persisted store of invited talent IDs to skip across runs
 INVITED_DB = os.environ.get("VOICES_INVITED_DB", "invited_ids.json")
+# New invites are appended to "<INVITED_DB>.journal" and folded into the snapshot periodically.
+#   VOICES_INVITED_DB_FSYNC          "always" (fsync every record) or "never" (flush only)
+#   VOICES_INVITED_DB_COMPACT_EVERY  journal records before compacting into the snapshot
+INVITED_DB_FSYNC = os.environ.get("VOICES_INVITED_DB_FSYNC", "always").strip().lower()
+INVITED_DB_COMPACT_EVERY = int(os.environ.get("VOICES_INVITED_DB_COMPACT_EVERY", 1000))
 # Only invite to this job ID (can override via VOICES_JOB_ID)
 # Job selection is optional; default to no filtering and rely on the blue "Invite" confirm
 # Set VOICES_JOB_ID to force targeting a specific job ID if desired
@@ -47,10 +62,28 @@ PAGE_PAUSE = (
     float(os.environ.get("VOICES_PAGE_PAUSE_MAX", 4.0)),
 )  # between pages
 SCROLL_PASSES = 2        # help trigger lazy-loading on each page
+RESULTS_PER_PAGE = 24    # Voices search pages step the offset by 24
+START_PAGE = int(os.environ.get("VOICES_START_PAGE", 0) or 0)  # 1-based search page to begin at (0 = START_URL's own offset)
+PREFETCH = os.environ.get("VOICES_PREFETCH", "0").lower() in {"1", "true", "yes", "on"}  # load the next planned page in a second tab
+SHARD = parse_shard(os.environ.get("VOICES_SHARD", "1/1") or "1/1")  # (i, n): this process takes every n-th planned page
+TABS = max(1, int(os.environ.get("VOICES_TABS", 1) or 1))  # tabs working planned pages concurrently
+WORK_STEALING = os.environ.get("VOICES_WORK_STEALING", "0").lower() in {"1", "true", "yes", "on"}  # share cards, not pages, between tabs
+STEAL_BATCH = max(1, int(os.environ.get("VOICES_STEAL_BATCH", 3) or 3))  # cards a tab takes from the queue at a time
+PAGE_PLAN = os.environ.get("VOICES_PAGE_PLAN", "1").lower() in {"1", "true", "yes", "on"}  # visit offsets directly when the result count is known
 
 # dry-run and logging
 DRY_RUN = os.environ.get("VOICES_DRY_RUN", "0").lower() in {"1", "true", "yes", "on"}
 LOG_FILE = os.environ.get("VOICES_LOG_FILE", "").strip()
+# Confirm clicks: per-attempt timeout so a covered button fails over quickly instead of
+# waiting out Playwright's full actionability timeout
+CLICK_TIMEOUT_MS = int(os.environ.get("VOICES_CLICK_TIMEOUT_MS", 1500))
+CLICK_METHODS = ("normal", "force", "js", "keyboard")  # default order before any stats exist
+TRACE_FILE = os.environ.get("VOICES_TRACE_FILE", "").strip()  # Chrome trace of page/card/stage spans
+METRICS_PORT = metrics.METRICS_PORT  # serve Prometheus metrics on 127.0.0.1:<port>/metrics (0 = off)
+RATE_PER_MIN = rate_limit.RATE_PER_MIN  # shared committing actions/minute across all workers on this account (0 = off)
+BLOCK_ASSETS = asset_filter.BLOCK_ASSETS  # drop images/fonts/media/third-party requests on search pages (asset_filter.py)
+READY_STABLE_MS = int(os.environ.get("VOICES_READY_STABLE_MS", 400))  # card count must hold this long to count as loaded
+STATIC_PACING = pacing.STATIC_PACING  # True = uniform pauses; otherwise AIMD-adapted inside the ranges
 
 # Favorites mode (optional alternative to inviting)
 USE_FAVORITES = os.environ.get("VOICES_USE_FAVORITES", "0").lower() in {"1", "true", "yes", "on"}
@@ -61,6 +94,7 @@ _FAVORITES_LIST_SELECTED = False  # set True after first successful list selecti
 
 # selectors (you may tweak after a quick Inspect pass)
 TALENT_CARD = "[data-testid='talent-card'], [data-qa='talent-card'], article:has(button:has-text('Invite'))"
+TALENT_CARD_CSS = "[data-testid='talent-card'], [data-qa='talent-card'], article"  # plain-CSS superset for in-page counts
 INVITE_MENU_BTN = ":is(button, [role='button'], a):has-text('Invite to Job'), :is(button, [role='button'], a):has-text('Invite'), :is(button, [role='button'], a):has-text('Send Invite'), :is(button, [role='button'], a):has-text('Request a Quote')"  # on the card
 # Broaden modal selector to include common Bootstrap/ARIA modals used on voices.com
 INVITE_MODAL = "[role='dialog'], [aria-modal='true'], .modal.show, .modal.in, .modal[open], .modal-dialog, .modal-content, .ReactModal__Content"
@@ -73,6 +107,8 @@ FINAL_INVITE_BTN = f"#submit-request-quote, {INVITE_MODAL} >> button#submit-requ
 FINAL_INVITE_BTN_ANY = ":is(#submit-request-quote, button#submit-request-quote), :is(button, [role='button'], a):has-text('Invite to Job'), :is(button, [role='button'], a):has-text('Send Invite'), :is(button, [role='button'], a):has-text('Invite'), :is(button, [role='button'], a):has-text('Request a Quote'), :is(button, [role='button'], a):has-text('Submit Request'), :is(button, [role='button'], a):has-text('Send Request'), button.btn.btn-primary:has-text('Invite')"
 JOB_ROW = f"{INVITE_MODAL} >> :is([data-testid='job-row'], .job-item, li, tr)"
 JOB_TITLE_EL = ":is(h3, h4, .job-title, [data-testid='job-title'], a, span)"
+JOB_ROW_CSS = ":is([data-testid='job-row'], .job-item, li, tr)"  # rows inside INVITE_MODAL, for voices_helpers.js
+MODAL_CONFIRM_CSS = "#submit-request-quote, button[type='submit']"
 JOB_INVITE_BTN = f"{JOB_ROW} >> :is(button, a):has-text('Invite'), {JOB_ROW} >> :is(button, a):has-text('Select'), {JOB_ROW} >> :is(button, a):has-text('Choose')"
 SUCCESS_TOAST = ":is(.Toastify__toast, [role='status']):has-text('Invited'), :has-text('Invitation sent'), :has-text('invited')"
 
@@ -104,7 +140,7 @@ PAGINATION_NEXT = "nav[aria-label='Pagination'] >> text=Next"
 CURRENT_PAGE = "nav[aria-label='Pagination'] [aria-current='page']"
 PAGINATION_NUMBERS = "nav[aria-label='Pagination'] :is(a,button)"
 # Broaden selectors to catch various Next controls (icon-only, rel=next, title, aria-label)
-NEXT_LINK_SEL = ", ".join([
+NEXT_LINK_ALTS = [
     "a[rel='next']",
     "a[aria-label='Next']",
     "a[title*='Next']",
@@ -113,16 +149,63 @@ NEXT_LINK_SEL = ", ".join([
     ".pagination a:has(i.fa-angle-right)",
     "nav a:has(i.fa-chevron-right)",
     ".pagination a:has(i.fa-chevron-right)",
-])
+]
+NEXT_LINK_SEL = ", ".join(NEXT_LINK_ALTS)
+
+# Single-element lookups of the big unions go through LearnedSelector: the branch that
+# matched most often (persisted in voices_learned_stats.json) is queried alone first and
+# the full union is only evaluated on a miss. Playwright splits on ">>" before ",", so the
+# modal-scoped unions spell out each branch with its own INVITE_MODAL prefix and are
+# queried branch by branch (see LearnedSelector.chained), never as one string.
+_TEXT_BTN = ":is(button, [role='button'], a):has-text('{}')"
+_TAB_BTN = ":is(button, a, [role='tab']):has-text('{}')"
+INVITE_MENU_BTN_L = LearnedSelector(
+    "INVITE_MENU_BTN",
+    [_TEXT_BTN.format(t) for t in ("Invite to Job", "Invite", "Send Invite", "Request a Quote")],
+    INVITE_MENU_BTN,
+)
+EXISTING_TAB_L = LearnedSelector(
+    "EXISTING_TAB",
+    [f"{INVITE_MODAL} >> " + _TAB_BTN.format(t) for t in
+     ("Invite to Existing Jobs", "Invite to Existing Job", "Existing Jobs", "Use existing", "Existing")],
+    EXISTING_TAB,
+)
+FINAL_INVITE_BTN_L = LearnedSelector(
+    "FINAL_INVITE_BTN",
+    ["#submit-request-quote", f"{INVITE_MODAL} >> button#submit-request-quote"]
+    + [f"{INVITE_MODAL} >> " + _TEXT_BTN.format(t) for t in
+       ("Invite to Job", "Send Invite", "Invite", "Request a Quote", "Submit Request", "Send Request")]
+    + [f"{INVITE_MODAL} >> button[type='submit']"],
+    FINAL_INVITE_BTN,
+)
+NEXT_LINK_L = LearnedSelector("NEXT_LINK_SEL", NEXT_LINK_ALTS)
+
+async def wait_cards_ready(page, max_ms: int = 15000) -> str:
+    """After a navigation: wait for the talent cards to appear and stop changing (or for the
+    job modal to fill) rather than for network silence. Returns the state page_helpers reports."""
+    with span("ready", cat="page") as sp:
+        state = await wait_ready(page, TALENT_CARD_CSS, INVITE_MODAL, JOB_ROW_CSS,
+                                 stable_ms=READY_STABLE_MS, max_ms=max_ms)
+        if sp is not None:
+            sp.set(state=state)
+    if DEBUG:
+        print(f"[debug] Page ready: {state}")
+    return state
 
 async def jitter(a, b, label: str = "pause"):
-    delay = random.uniform(a, b)
-    log_event({"type": "delay", "label": label, "delay": delay})
+    """Sleep inside [a, b]; where in the range is decided by the adaptive pacer (see pacing.py)."""
+    pacer = pacing.get_pacer()
+    delay = pacer.delay(a, b)
+    # Pauses with the same label share one timeline across tabs (global pacing)
+    sleep_for = pacer.reserve(label, delay)
+    log_event({"type": "delay", "label": label, "delay": delay, "pace_level": round(pacer.level, 3),
+               "queued": round(sleep_for - delay, 3) if sleep_for - delay > 0.01 else None})
     try:
-        print(f"[delay] {label}: {delay:.2f}s")
+        print(f"[delay] {label}: {sleep_for:.2f}s")
     except Exception:
         pass
-    await asyncio.sleep(delay)
+    with span("jitter", cat="pace", label=label, delay=round(delay, 3)):
+        await asyncio.sleep(sleep_for)
     return delay
 
 def load_checkpoint():
@@ -201,7 +284,7 @@ async def is_logged_in(page) -> bool:
 
     # If an Invite button is present on talents page, you're likely logged in
     try:
-        btn = await page.query_selector(INVITE_MENU_BTN)
+        btn = await INVITE_MENU_BTN_L.query(page)
         if btn:
             return True
     except Exception:
@@ -385,18 +468,12 @@ async def login_if_needed(context, page, manual_login: bool = False):
             except Exception:
                 pass
 
-        try:
-            await page.wait_for_load_state("networkidle")
-        except PWTimeout:
-            pass
+        await wait_cards_ready(page)
         await asyncio.sleep(1.0)
 
     # Ensure we land back on the intended search page
     await page.goto(START_URL)
-    try:
-        await page.wait_for_load_state("networkidle")
-    except PWTimeout:
-        await page.wait_for_load_state("domcontentloaded")
+    await wait_cards_ready(page)
     # Save auth state when possible (not available when attaching over CDP without a context)
     try:
         if context:
@@ -407,16 +484,17 @@ async def login_if_needed(context, page, manual_login: bool = False):
 DEBUG = os.environ.get("VOICES_DEBUG", "0").lower() in {"1", "true", "yes", "on"}
 
 def log_event(evt: dict):
-    """Append a structured event to JSONL log (if configured) and echo when DEBUG is on."""
+    """Queue a structured event for the JSONL log (if configured) and echo when DEBUG is on.
+    The file write happens on event_log's background writer, never on the event loop.
+    """
     try:
         evt = dict(evt)
         evt.setdefault("ts", time.time())
         if LOG_FILE:
-            try:
-                with open(LOG_FILE, "a", encoding="utf-8") as f:
-                    f.write(json.dumps(evt, ensure_ascii=False) + "\n")
-            except Exception:
-                pass
+            write_event(LOG_FILE, evt)
+        if METRICS_PORT:
+            metrics.observe_event(evt)
+        pacing.get_pacer().observe_event(evt)
         if DEBUG:
             try:
                 print("[event] " + json.dumps(evt, ensure_ascii=False))
@@ -425,13 +503,20 @@ def log_event(evt: dict):
     except Exception:
         pass
 
-# invited IDs database (simple JSON key -> metadata)
+# invited IDs database: JSON snapshot (key -> metadata) plus an append-only JSONL journal
 _INVITED_DB_CACHE = None  # type: ignore[var-annotated]
+_INVITED_DB_JOURNAL = None  # open append handle for the journal
+_INVITED_DB_PENDING = 0  # journal records not yet folded into the snapshot
+
+def _invited_db_journal_path() -> Path:
+    return Path(str(INVITED_DB) + ".journal")
 
 def _invited_db_load() -> dict:
-    global _INVITED_DB_CACHE
+    """Load the snapshot (legacy list/dict JSON) and replay the journal on top of it."""
+    global _INVITED_DB_CACHE, _INVITED_DB_PENDING
     if _INVITED_DB_CACHE is not None:
         return _INVITED_DB_CACHE
+    db = {}
     try:
         p = Path(INVITED_DB)
         if p.exists():
@@ -440,29 +525,183 @@ def _invited_db_load() -> dict:
             if isinstance(data, list):
                 data = {str(x): {"ts": time.time()} for x in data}
             if isinstance(data, dict):
-                _INVITED_DB_CACHE = data
-                return _INVITED_DB_CACHE
+                db = data
+    except Exception:
+        pass
+    replayed = 0
+    try:
+        jp = _invited_db_journal_path()
+        if jp.exists():
+            with open(jp, "r", encoding="utf-8") as fh:
+                for line in fh:
+                    try:
+                        rec = json.loads(line)
+                        tid = str(rec.pop("id"))
+                    except Exception:
+                        # a torn final line from an interrupted run; skip it
+                        continue
+                    _invited_db_merge(db, tid, rec.get("job", ""), rec.get("ts"), rec.get("url", ""))
+                    replayed += 1
     except Exception:
         pass
-    _INVITED_DB_CACHE = {}
+    _INVITED_DB_CACHE = db
+    _INVITED_DB_PENDING = replayed
+    if replayed >= INVITED_DB_COMPACT_EVERY:
+        invited_db_compact()
     return _INVITED_DB_CACHE
 
-def invited_db_has(talent_id: str) -> bool:
+def invited_db_compact():
+    """Fold the journal into a fresh snapshot (atomic replace), then truncate the journal."""
+    global _INVITED_DB_JOURNAL, _INVITED_DB_PENDING
     try:
         db = _invited_db_load()
-        return str(talent_id) in db
+        p = Path(INVITED_DB)
+        tmp = Path(str(INVITED_DB) + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as fh:
+            fh.write(json.dumps(db, indent=2))
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp, p)
+        # A crash before truncation only means the journal is replayed again (idempotent)
+        if _INVITED_DB_JOURNAL is not None:
+            try:
+                _INVITED_DB_JOURNAL.close()
+            except Exception:
+                pass
+            _INVITED_DB_JOURNAL = None
+        with open(_invited_db_journal_path(), "w", encoding="utf-8"):
+            pass
+        log_event({"type": "invited_db_compact", "entries": len(db), "journal_records": _INVITED_DB_PENDING})
+        _INVITED_DB_PENDING = 0
     except Exception:
-        return False
+        pass
+
+def invited_db_close():
+    """Compact any pending journal records and release the journal handle."""
+    global _INVITED_DB_JOURNAL
+    if _INVITED_DB_CACHE is not None and _INVITED_DB_PENDING:
+        invited_db_compact()
+    if _INVITED_DB_JOURNAL is not None:
+        try:
+            _INVITED_DB_JOURNAL.close()
+        except Exception:
+            pass
+        _INVITED_DB_JOURNAL = None
 
-def invited_db_add(talent_id: str, url: str = ""):
+def _invited_db_merge(db: dict, talent_id: str, job_id: str, ts=None, url: str = ""):
+    """Record one (talent, job) invite in the in-memory store.
+    Entries carry a "jobs" map of job_id -> ts; entries without it predate per-job
+    tracking and keep meaning "invited to some job".
+    """
+    ts = ts or time.time()
+    entry = db.get(talent_id)
+    if not isinstance(entry, dict):
+        entry = {}
+        db[talent_id] = entry
+        entry["jobs"] = {}
+    jobs = entry.get("jobs")
+    if isinstance(jobs, dict):
+        jobs[str(job_id or "")] = ts
+    entry["ts"] = ts
+    if url:
+        entry["url"] = url
+
+def _invited_db_has_local(talent_id: str, job: str) -> bool:
+    try:
+        entry = _invited_db_load().get(str(talent_id))
+        if entry is not None:
+            jobs = entry.get("jobs") if isinstance(entry, dict) else None
+            if not job or not isinstance(jobs, dict) or job in jobs:
+                return True
+    except Exception:
+        pass
+    return False
+
+def invited_db_has(talent_id: str, job_id: Optional[str] = None) -> bool:
+    """True if talent_id was already invited to job_id (default: REQUIRED_JOB_ID).
+    Without a target job any recorded invite counts, matching the old behaviour; the
+    ledger is asked the same way (any job), not for the literal job "".
+    """
+    job = REQUIRED_JOB_ID if job_id is None else str(job_id)
+    if _invited_db_has_local(talent_id, job):
+        return True
+    # Also honour invites recorded by the other scripts in the shared ledger (any job when untargeted)
+    return ledger_has(talent_id, ACTION_INVITE, job, any_job=not job)
+
+def invited_db_done_many(talent_ids, job_id: Optional[str] = None) -> set:
+    """Bulk invited_db_has: the subset of talent_ids already invited to job_id."""
+    job = REQUIRED_JOB_ID if job_id is None else str(job_id)
+    ids = {str(t) for t in talent_ids if t}
+    done = {t for t in ids if _invited_db_has_local(t, job)}
+    try:
+        led = get_ledger()
+        if led and ids - done:
+            done |= led.has_many(ids - done, ACTION_INVITE, job, any_job=not job)
+    except Exception:
+        pass
+    return done
+
+def _invited_db_journal_open():
+    """Open the journal for appending. A run that died mid-write can leave a torn last line;
+    end it first so the next record starts on its own line instead of being glued onto it."""
+    jp = _invited_db_journal_path()
+    torn = False
+    try:
+        with open(jp, "rb") as fh:
+            fh.seek(0, os.SEEK_END)
+            if fh.tell():
+                fh.seek(-1, os.SEEK_END)
+                torn = fh.read(1) != b"\n"
+    except FileNotFoundError:
+        pass
+    fh = open(jp, "a", encoding="utf-8")
+    if torn:
+        fh.write("\n")
+    return fh
+
+def invited_db_add(talent_id: str, url: str = "", job_id: Optional[str] = None):
+    global _INVITED_DB_JOURNAL, _INVITED_DB_PENDING
+    job = REQUIRED_JOB_ID if job_id is None else str(job_id)
     try:
         db = _invited_db_load()
-        db[str(talent_id)] = {"ts": time.time(), "url": url}
-        Path(INVITED_DB).write_text(json.dumps(db, indent=2), encoding="utf-8")
-        log_event({"type": "invited_db_add", "talent_id": str(talent_id), "url": url})
+        ts = time.time()
+        _invited_db_merge(db, str(talent_id), job, ts, url)
+        if _INVITED_DB_JOURNAL is None:
+            _INVITED_DB_JOURNAL = _invited_db_journal_open()
+        _INVITED_DB_JOURNAL.write(json.dumps({"id": str(talent_id), "job": job, "ts": ts, "url": url}, ensure_ascii=False) + "\n")
+        _INVITED_DB_JOURNAL.flush()
+        if INVITED_DB_FSYNC == "always":
+            os.fsync(_INVITED_DB_JOURNAL.fileno())
+        _INVITED_DB_PENDING += 1
+        ledger_add(talent_id, ACTION_INVITE, job, url)
+        log_event({"type": "invited_db_add", "talent_id": str(talent_id), "job_id": job or None, "url": url})
+        if _INVITED_DB_PENDING >= INVITED_DB_COMPACT_EVERY:
+            invited_db_compact()
     except Exception:
         pass
 
+def invited_db_worklist(have_job: str, lack_job: str) -> list:
+    """Talents invited to have_job but not yet to lack_job, as [{"talent_id", "url"}].
+    Combines the JSON store with the shared ledger; url is the search page the talent
+    was last invited from, so the list can be worked without re-crawling the search.
+    """
+    items = {}
+    try:
+        for tid, entry in _invited_db_load().items():
+            jobs = entry.get("jobs") if isinstance(entry, dict) else None
+            if isinstance(jobs, dict) and str(have_job) in jobs and str(lack_job) not in jobs:
+                items[tid] = entry.get("url", "")
+    except Exception:
+        pass
+    try:
+        led = get_ledger()
+        if led:
+            for tid, url in led.missing_for_job(ACTION_INVITE, have_job, lack_job):
+                items.setdefault(tid, url)
+    except Exception:
+        pass
+    return [{"talent_id": t, "url": u} for t, u in items.items() if not invited_db_has(t, lack_job)]
+
 async def _card_is_favorited(card) -> bool:
     try:
         mark = await card.query_selector(FAVORITE_ACTIVE)
@@ -518,24 +757,32 @@ async def _click_heart_element(page, heart) -> bool:
     except Exception:
         return False
 
+async def _rate_gate(kind: str) -> float:
+    """Draw a token from the account-wide bucket (see rate_limit.py) before a committing click."""
+    if not rate_limit.get_bucket().enabled:
+        return 0.0
+    with span("rate_wait", cat="pace", kind=kind):
+        waited = await rate_limit.acquire(kind)
+    if waited >= 0.05:
+        log_event({"type": "rate_wait", "kind": kind, "seconds": round(waited, 3)})
+    return waited
+
 async def _click_heart_on_card(page, card) -> bool:
     try:
-        btn = await card.query_selector(FAVORITE_BTN)
+        # One call finds the heart's clickable element and scrolls it into view
+        btn = await helper_handle(page, "cardAction", card, "heart", FAVORITE_BTN)
         if not btn:
             try:
                 await card.hover()
-                btn = await card.query_selector(FAVORITE_BTN)
+                btn = await helper_handle(page, "cardAction", card, "heart", FAVORITE_BTN)
             except Exception:
                 btn = None
         if not btn:
             return False
-        try:
-            await btn.scroll_into_view_if_needed()
-        except Exception:
-            pass
         if DRY_RUN:
             log_event({"type": "would_click", "target": "favorite_heart"})
             return True
+        await _rate_gate("heart")
         try:
             await btn.click()
             return True
@@ -669,41 +916,180 @@ async def accept_cookies_if_present(page):
     except Exception:
         pass
 
-async def _click_with_logging(confirm, modal=None) -> bool:
-    """Attempt to click the confirmation element with fallbacks and logging."""
-    methods = [
-        ("normal", lambda: confirm.click()),
-        ("force", lambda: confirm.click(force=True)),
-        ("js", lambda: confirm.evaluate("el => el.click()")),
-        ("keyboard", lambda: (modal or confirm).press("Enter")),
-    ]
-    for name, action in methods:
-        try:
-            visible = await confirm.is_visible()
-        except Exception:
-            visible = None
-        try:
-            enabled = await confirm.is_enabled()
-        except Exception:
-            enabled = None
-        try:
-            bbox = await confirm.bounding_box()
-        except Exception:
-            bbox = None
-        log_event({"type": "confirm_attempt", "method": name, "visible": visible, "enabled": enabled, "bbox": bbox})
-        try:
-            await action()
-            log_event({"type": "confirm_summary", "method": name, "success": True})
+async def _confirm_diagnostics(confirm) -> dict:
+    """Visibility, enabled state, box and (by digest) outerHTML in one round trip; only called after a failed click."""
+    try:
+        d = await confirm.evaluate("""el => {
+            const r = el.getBoundingClientRect();
+            const st = getComputedStyle(el);
+            return {
+                visible: r.width > 0 && r.height > 0 && st.visibility !== 'hidden' && st.display !== 'none',
+                enabled: !el.disabled && el.getAttribute('aria-disabled') !== 'true',
+                bbox: {x: r.x, y: r.y, width: r.width, height: r.height},
+                outer: el.outerHTML,
+            };
+        }""")
+    except Exception:
+        return {}
+    outer = d.pop("outer", None)
+    d.update(artifact_fields(LOG_FILE, "outer_html", outer or None, "html"))
+    return d
+
+# (target, method) of the last confirm click in this task, scored once its outcome is known.
+# A click that does not throw proves nothing ("js" and "keyboard" practically never throw),
+# so methods are only credited when the invite toast shows or the modal closes. Scores live
+# in their own stats section; older "clicks" counts credited any click that did not throw.
+_PENDING_CLICK: contextvars.ContextVar = contextvars.ContextVar("pending_click", default=None)
+
+def _record_click_outcome(ok: bool):
+    pending = _PENDING_CLICK.get()
+    if pending is None:
+        return
+    _PENDING_CLICK.set(None)
+    target, method = pending
+    get_stats().bump("click_outcomes", target, method + (":ok" if ok else ":fail"))
+
+def _click_method_order(target: str) -> list:
+    """Click methods ordered by their (smoothed) confirmed-success rate for this target on earlier runs."""
+    counts = get_stats().counts("click_outcomes", target)
+
+    def score(m):
+        ok, fail = counts.get(m + ":ok", 0), counts.get(m + ":fail", 0)
+        return (ok + 1) / (ok + fail + 2)
+    return sorted(CLICK_METHODS, key=lambda m: (-score(m), CLICK_METHODS.index(m)))
+
+async def _click_with_logging(confirm, modal=None, target: str = "confirm") -> bool:
+    """Click the confirmation element, starting with the method that has worked best for
+    this target before and falling back through the others. Each attempt gets a short
+    timeout, and element diagnostics are only collected once an attempt has failed.
+    The method that went through is scored by _record_click_outcome after the result wait.
+    """
+    actions = {
+        "normal": lambda: confirm.click(timeout=CLICK_TIMEOUT_MS),
+        "force": lambda: confirm.click(force=True, timeout=CLICK_TIMEOUT_MS),
+        "js": lambda: confirm.evaluate("el => el.click()"),
+        "keyboard": lambda: (modal or confirm).press("Enter", timeout=CLICK_TIMEOUT_MS),
+    }
+    stats = get_stats()
+    order = _click_method_order(target)
+    _PENDING_CLICK.set(None)
+    await _rate_gate("confirm")
+    with span("confirm_click", target=target):
+        diag = None
+        for name in order:
+            log_event({"type": "confirm_attempt", "method": name, "target": target})
+            try:
+                await actions[name]()
+            except Exception as e:
+                stats.bump("click_outcomes", target, name + ":fail")
+                if diag is None:
+                    diag = await _confirm_diagnostics(confirm)
+                log_event({"type": "confirm_error", "method": name, "target": target, "error": str(e), **diag})
+                continue
+            _PENDING_CLICK.set((target, name))
+            log_event({"type": "confirm_summary", "method": name, "target": target, "success": True})
+            set_attrs(method=name, success=True)
             return True
-        except Exception as e:
-            outer = None
+        log_event({"type": "confirm_summary", "method": order[-1], "target": target, "success": False})
+        set_attrs(success=False)
+        return False
+
+# In-page, MutationObserver-backed waits that stand in for fixed mechanical sleeps: they
+# resolve as soon as the DOM reaches the wanted state (capped at max_ms). Deliberate
+# human pacing stays in jitter().
+#   visible: a visible element matching sel (optionally containing one of texts) under root
+#   count:   at least min_count elements matching sel are attached
+#   grow:    more elements match sel than when the wait started (lazy loading)
+#   quiet:   no DOM mutation for quiet_ms (the UI has finished reacting to a click)
+_DOM_WAIT_JS = r"""
+([root, mode, sel, texts, minCount, quietMs, maxMs]) => new Promise(resolve => {
+  const scope = root || document;
+  const visible = el => !!el && !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+  const want = (texts || []).map(t => t.toLowerCase());
+  const base = mode === "grow" ? scope.querySelectorAll(sel).length : 0;
+  const ready = () => {
+    if (mode === "quiet") return false;
+    if (mode === "grow") return scope.querySelectorAll(sel).length > base;
+    let n = 0;
+    for (const el of scope.querySelectorAll(sel)) {
+      if (mode === "visible" && !visible(el)) continue;
+      if (want.length && !want.some(t => (el.textContent || "").toLowerCase().includes(t))) continue;
+      if (++n >= minCount) return true;
+    }
+    return false;
+  };
+  if (ready()) return resolve(true);
+  let done = false, quiet = null, cap = null, obs = null;
+  const finish = v => {
+    if (done) return;
+    done = true;
+    if (obs) obs.disconnect();
+    clearTimeout(cap);
+    clearTimeout(quiet);
+    resolve(v);
+  };
+  const arm = () => {
+    if (mode !== "quiet") return;
+    clearTimeout(quiet);
+    quiet = setTimeout(() => finish(true), quietMs);
+  };
+  obs = new MutationObserver(() => { if (ready()) finish(true); else arm(); });
+  obs.observe(document.documentElement, {childList: true, subtree: true, attributes: true, characterData: true});
+  cap = setTimeout(() => finish(mode === "quiet" ? true : ready()), maxMs);
+  arm();
+})
+"""
+# Menu entry that opens the invite modal (CSS-only form of EXISTING_MENU_ITEM for in-page waits)
+EXISTING_MENU_ITEM_CSS = "button.request_a_quote_btn.menuitem, [role='menuitem'], .dropdown-menu :is(a, button)"
+EXISTING_MENU_ITEM_TEXTS = ("invite to existing job", "request a quote")
+# For the in-page nearest-item search: candidate elements, and px offsets below the head
+# button probed with elementFromPoint when no candidate is visible
+EXISTING_MENU_SCAN_CSS = "button, a, [role='menuitem']"
+EXISTING_MENU_PROBE_DY = (36, 44, 56, 68, 80)
+# EXISTING_MENU_ITEM's class-only branch: this button is the menu item whatever its text
+EXISTING_MENU_CLASS_CSS = "button.request_a_quote_btn.menuitem"
+
+async def _dom_wait(page, mode: str, sel: str = "", texts=(), root=None, min_count: int = 1,
+                    quiet_ms: int = 0, max_ms: int = 1500) -> bool:
+    try:
+        return bool(await page.evaluate(_DOM_WAIT_JS, [root, mode, sel, list(texts), int(min_count), int(quiet_ms), int(max_ms)]))
+    except Exception:
+        return False
+
+async def _wait_visible(page, sel: str, texts=(), root=None, timeout_ms: int = 1500) -> bool:
+    """Resolve as soon as a visible element matching sel (and one of texts) exists under root."""
+    return await _dom_wait(page, "visible", sel, texts, root=root, max_ms=timeout_ms)
+
+async def _dom_settle(page, quiet_ms: int = 60, max_ms: int = 400) -> None:
+    """Return once the DOM has stopped changing for quiet_ms (at most max_ms)."""
+    await _dom_wait(page, "quiet", quiet_ms=quiet_ms, max_ms=max_ms)
+
+async def _wait_invite_result(page, modal_wait: bool = True, log_result: bool = False) -> str:
+    """After confirming, wait for the success toast, else (optionally) for the invite modal to close.
+    Returns "toast_seen", "modal_hidden" or "timeout".
+    """
+    with span("toast_wait"):
+        status = "timeout"
+        t0 = time.perf_counter()
+        try:
+            await page.wait_for_selector(SUCCESS_TOAST, timeout=6000)
+            status = "toast_seen"
+        except PWTimeout:
+            if modal_wait:
+                try:
+                    await page.wait_for_selector(INVITE_MODAL, state="hidden", timeout=3000)
+                    status = "modal_hidden"
+                except Exception:
+                    pass
+        set_attrs(status=status)
+        pacing.get_pacer().observe_toast(status, time.perf_counter() - t0)
+        _record_click_outcome(status != "timeout")
+        if log_result and status != "timeout":
             try:
-                outer = await confirm.evaluate("el => el.outerHTML")
+                log_event({"type": "confirm_result", "status": status})
             except Exception:
                 pass
-            log_event({"type": "confirm_error", "method": name, "error": str(e), "outer_html": outer})
-    log_event({"type": "confirm_summary", "method": "keyboard", "success": False})
-    return False
+        return status
 
 async def _click_existing_job_dropdown(page, head_btn) -> bool:
     """After clicking the head 'Invite to Job' button on a card, click the
@@ -747,154 +1133,23 @@ async def _click_existing_job_dropdown(page, head_btn) -> bool:
                 log_event({"type": "head_btn_click_attempt", "attempt": attempt+1})
             except Exception:
                 pass
-            await asyncio.sleep(0.25)
-
-            # First, try container-scoped menu item inside this card
-            try:
-                container = await head_btn.evaluate_handle(
-                    "el => el.closest('.ResultCard-action') || el.closest('.portfolio-list-item-invite-to-job') || el.parentElement"
-                )
-            except Exception:
-                container = None
-            if container:
-                try:
-                    existing = await container.query_selector("button.request_a_quote_btn.menuitem")
-                    if not existing:
-                        existing = await container.query_selector(
-                            ":is(button,a):has-text('Invite to Existing Job'), :is(button,a):has-text('Invite to Existing Jobs')"
-                        )
-                    if existing and await existing.is_visible():
-                        clicked = False
-                        try:
-                            await existing.click()
-                            clicked = True
-                        except asyncio.CancelledError:
-                            clicked = True
-                        except Exception:
-                            clicked = False
-                        if not clicked:
-                            try:
-                                bb = await existing.bounding_box()
-                                if bb:
-                                    cx = bb["x"] + bb["width"]/2
-                                    cy = bb["y"] + bb["height"]/2
-                                    await page.mouse.move(cx, cy, steps=1)
-                                    await page.mouse.click(cx, cy, delay=30)
-                                    clicked = True
-                            except Exception:
-                                clicked = False
-                        if not clicked:
-                            try:
-                                await existing.evaluate("el => el.click()")
-                                clicked = True
-                            except Exception:
-                                clicked = False
-                        if clicked:
-                            try:
-                                await page.wait_for_selector(FINAL_INVITE_BTN_ANY, timeout=2000)
-                                if DEBUG:
-                                    try:
-                                        print("[debug] Container-scoped click on 'Invite to Existing Job'.")
-                                    except Exception:
-                                        pass
-                                return True
-                            except Exception:
-                                pass
-                except Exception:
-                    pass
+            await _wait_visible(page, EXISTING_MENU_ITEM_CSS, EXISTING_MENU_ITEM_TEXTS, timeout_ms=500)
 
-            # Keyboard fallback: navigate dropdown with ArrowDown + Enter
+            # First, try the visible menu item inside this card's own action area
             try:
-                await page.keyboard.press("ArrowDown")
-                await asyncio.sleep(0.05)
-                await page.keyboard.press("Enter")
-                try:
-                    await page.wait_for_selector(FINAL_INVITE_BTN_ANY, timeout=1200)
-                    if DEBUG:
-                        try:
-                            print("[debug] Keyboard fallback selected 'Invite to Existing Job'.")
-                        except Exception:
-                            pass
-                    return True
-                except Exception:
-                    pass
-            except Exception:
-                pass
-
-            # Wait a bit for the menu item to render
-            try:
-                await page.wait_for_selector(EXISTING_MENU_ITEM, state="visible", timeout=2000)
-            except Exception:
-                continue
-
-            try:
-                # Use proximity to pick the right menu item
-                hb = await head_btn.bounding_box()
-                if not hb:
-                    # Fallback: click the first visible item
-                    mi = page.locator(EXISTING_MENU_ITEM).first
-                    if await mi.is_visible():
-                        try:
-                            await mi.click(force=True)
-                        except Exception:
-                            # Final fallback: JS click
-                            try:
-                                sel = EXISTING_MENU_ITEM
-                                await page.eval_on_selector(sel, "el => el.click()")
-                            except Exception:
-                                pass
-                        if DEBUG:
-                            try:
-                                print("[debug] Clicked first visible 'Invite to Existing Job' item (no bbox).")
-                            except Exception:
-                                pass
-                        return True
-
-                candidates = await page.query_selector_all(EXISTING_MENU_ITEM)
-                if DEBUG:
-                    try:
-                        vis = 0
-                        for el in candidates:
-                            try:
-                                if await el.is_visible():
-                                    vis += 1
-                            except Exception:
-                                pass
-                        print(f"[debug] Attempt {attempt+1}: found {len(candidates)} candidates, {vis} visible")
-                    except Exception:
-                        pass
-                best = None
-                best_d = 1e9
-                for el in candidates:
-                    try:
-                        if not await el.is_visible():
-                            continue
-                        bb = await el.bounding_box()
-                        if not bb:
-                            continue
-                        # Distance from head button center to menu item center
-                        dx = (bb["x"] + bb["width"]/2) - (hb["x"] + hb["width"]/2)
-                        dy = (bb["y"] + bb["height"]/2) - (hb["y"] + hb["height"]/2)
-                        d2 = dx*dx + dy*dy
-                        if d2 < best_d:
-                            best_d = d2
-                            best = el
-                    except Exception:
-                        continue
-                if best:
-                    try:
-                        await best.scroll_into_view_if_needed()
-                    except Exception:
-                        pass
+                existing = await helper_handle(page, "openExistingJobMenu", head_btn)
+                if existing:
                     clicked = False
                     try:
-                        await best.click(force=True)
+                        await existing.click()
+                        clicked = True
+                    except asyncio.CancelledError:
                         clicked = True
                     except Exception:
                         clicked = False
                     if not clicked:
                         try:
-                            bb = await best.bounding_box()
+                            bb = await existing.bounding_box()
                             if bb:
                                 cx = bb["x"] + bb["width"]/2
                                 cy = bb["y"] + bb["height"]/2
@@ -905,8 +1160,7 @@ async def _click_existing_job_dropdown(page, head_btn) -> bool:
                             clicked = False
                     if not clicked:
                         try:
-                            sel = EXISTING_MENU_ITEM
-                            await page.eval_on_selector(sel, "el => el.click()")
+                            await existing.evaluate("el => el.click()")
                             clicked = True
                         except Exception:
                             clicked = False
@@ -915,41 +1169,80 @@ async def _click_existing_job_dropdown(page, head_btn) -> bool:
                             await page.wait_for_selector(FINAL_INVITE_BTN_ANY, timeout=2000)
                             if DEBUG:
                                 try:
-                                    print("[debug] Clicked nearest 'Invite to Existing Job' item.")
+                                    print("[debug] Container-scoped click on 'Invite to Existing Job'.")
                                 except Exception:
                                     pass
                             return True
                         except Exception:
-                            # fall through to coordinate fallback below
                             pass
+            except Exception:
+                pass
+
+            # Keyboard fallback: navigate dropdown with ArrowDown + Enter
+            try:
+                await page.keyboard.press("ArrowDown")
+                await _dom_settle(page, quiet_ms=30, max_ms=150)
+                await page.keyboard.press("Enter")
+                try:
+                    await page.wait_for_selector(FINAL_INVITE_BTN_ANY, timeout=1200)
+                    if DEBUG:
+                        try:
+                            print("[debug] Keyboard fallback selected 'Invite to Existing Job'.")
+                        except Exception:
+                            pass
+                    return True
+                except Exception:
+                    pass
+            except Exception:
+                pass
+
+            # Wait a bit for the menu item to render
+            try:
+                await page.wait_for_selector(EXISTING_MENU_ITEM, state="visible", timeout=2000)
             except Exception:
                 continue
 
-            # Coordinate-based fallback: click slightly below the head button in case selectors failed
+            # Nearest visible menu item to this head button (or, failing that, one found just
+            # below it), located in one in-page call; None rather than some other control
+            best = await helper_handle(page, "nearestMenuItem", head_btn, EXISTING_MENU_SCAN_CSS,
+                                       list(EXISTING_MENU_ITEM_TEXTS), list(EXISTING_MENU_PROBE_DY),
+                                       EXISTING_MENU_CLASS_CSS)
+            if not best:
+                continue
+            clicked = False
             try:
-                hb = await head_btn.bounding_box()
+                await best.click(force=True)
+                clicked = True
             except Exception:
-                hb = None
-            if hb:
-                cx = hb["x"] + hb["width"]/2
-                base_y = hb["y"] + hb["height"]
-                for dy in (36, 44, 56, 68, 80):
-                    try:
-                        await page.mouse.move(cx, base_y + dy, steps=1)
-                        await page.mouse.click(cx, base_y + dy, delay=30)
-                        # Did the modal appear?
+                clicked = False
+            if not clicked:
+                try:
+                    bb = await best.bounding_box()
+                    if bb:
+                        cx = bb["x"] + bb["width"]/2
+                        cy = bb["y"] + bb["height"]/2
+                        await page.mouse.move(cx, cy, steps=1)
+                        await page.mouse.click(cx, cy, delay=30)
+                        clicked = True
+                except Exception:
+                    clicked = False
+            if not clicked:
+                try:
+                    await best.evaluate("el => el.click()")
+                    clicked = True
+                except Exception:
+                    clicked = False
+            if clicked:
+                try:
+                    await page.wait_for_selector(FINAL_INVITE_BTN_ANY, timeout=2000)
+                    if DEBUG:
                         try:
-                            await page.wait_for_selector(FINAL_INVITE_BTN_ANY, timeout=1200)
-                            if DEBUG:
-                                try:
-                                    print(f"[debug] Coordinate fallback clicked at dy={dy}.")
-                                except Exception:
-                                    pass
-                            return True
+                            print("[debug] Clicked nearest 'Invite to Existing Job' item.")
                         except Exception:
                             pass
-                    except Exception:
-                        continue
+                    return True
+                except Exception:
+                    pass
     except Exception:
         pass
 
@@ -963,55 +1256,51 @@ async def _click_existing_job_dropdown(page, head_btn) -> bool:
         container = None
     if container:
         try:
-            # Try a few short polls for the menu item to render inside the container
-            for _ in range(8):
-                try:
-                    existing = await container.query_selector("button.request_a_quote_btn.menuitem")
-                    if not existing:
-                        existing = await container.query_selector(
-                            ":is(button,a):has-text('Invite to Existing Job'), :is(button,a):has-text('Invite to Existing Jobs')"
-                        )
-                    if existing:
+            # Wait (event-driven) for the menu item to render inside the container, then click it
+            await _wait_visible(page, "button.request_a_quote_btn.menuitem, button, a",
+                                ("invite to existing job",), root=container, timeout_ms=1600)
+            try:
+                existing = await helper_handle(page, "openExistingJobMenu", head_btn, False)
+                if existing:
+                    clicked = False
+                    try:
+                        await existing.click()
+                        clicked = True
+                    except asyncio.CancelledError:
+                        # Treat as likely click and continue to verify modal
+                        clicked = True
+                    except Exception:
                         clicked = False
+                    if not clicked:
                         try:
-                            await existing.click()
-                            clicked = True
-                        except asyncio.CancelledError:
-                            # Treat as likely click and continue to verify modal
+                            bb = await existing.bounding_box()
+                            if bb:
+                                cx = bb["x"] + bb["width"]/2
+                                cy = bb["y"] + bb["height"]/2
+                                await page.mouse.move(cx, cy, steps=1)
+                                await page.mouse.click(cx, cy, delay=30)
+                                clicked = True
+                        except Exception:
+                            clicked = False
+                    if not clicked:
+                        try:
+                            # JS click on the element handle
+                            await existing.evaluate("el => el.click()")
                             clicked = True
                         except Exception:
                             clicked = False
-                        if not clicked:
+                    try:
+                        await page.wait_for_selector(FINAL_INVITE_BTN_ANY, timeout=1500)
+                        if DEBUG:
                             try:
-                                bb = await existing.bounding_box()
-                                if bb:
-                                    cx = bb["x"] + bb["width"]/2
-                                    cy = bb["y"] + bb["height"]/2
-                                    await page.mouse.move(cx, cy, steps=1)
-                                    await page.mouse.click(cx, cy, delay=30)
-                                    clicked = True
+                                print("[debug] Container-scoped click on 'Invite to Existing Job'.")
                             except Exception:
-                                clicked = False
-                        if not clicked:
-                            try:
-                                # JS click on the element handle
-                                await existing.evaluate("el => el.click()")
-                                clicked = True
-                            except Exception:
-                                clicked = False
-                        try:
-                            await page.wait_for_selector(FINAL_INVITE_BTN_ANY, timeout=1500)
-                            if DEBUG:
-                                try:
-                                    print("[debug] Container-scoped click on 'Invite to Existing Job'.")
-                                except Exception:
-                                    pass
-                            return True
-                        except Exception:
-                            pass
-                except Exception:
-                    pass
-                await asyncio.sleep(0.2)
+                                pass
+                        return True
+                    except Exception:
+                        pass
+            except Exception:
+                pass
         except Exception:
             pass
 
@@ -1050,6 +1339,43 @@ async def _extract_talent_id_from_root(root) -> Optional[str]:
         pass
     return None
 
+async def _snapshot_cards(page, cards) -> list:
+    """Return [{index, talent_id, invited_state, favorited_state, has_invite_button, needs_hover}]
+    for the given card handles, in one round trip when possible.
+    """
+    if not cards:
+        return []
+    try:
+        snap = await helper_call(page, "findCardActions", cards, FAVORITE_ACTIVE)
+        if isinstance(snap, list) and len(snap) == len(cards):
+            return snap
+    except Exception:
+        pass
+    # Fallback: per-card queries (slower, but tolerant of odd markup/detached cards)
+    out = []
+    for i, c in enumerate(cards):
+        try:
+            talent_id = await _extract_talent_id_from_root(c)
+        except Exception:
+            talent_id = None
+        try:
+            invited_state = bool(await c.query_selector(":is([aria-pressed='true'], .invited, :has-text('Invited'))"))
+        except Exception:
+            invited_state = False
+        try:
+            btn = await INVITE_MENU_BTN_L.query(c)
+        except Exception:
+            btn = None
+        out.append({
+            "index": i,
+            "talent_id": talent_id,
+            "invited_state": invited_state,
+            "favorited_state": await _card_is_favorited(c),
+            "has_invite_button": bool(btn),
+            "needs_hover": not btn,
+        })
+    return out
+
 async def _extract_talent_id_from_button(page, btn) -> Optional[str]:
     """Walk up from a button to the nearest talent card container and extract an ID."""
     try:
@@ -1366,13 +1692,20 @@ async def _is_locator_empty(loc) -> bool:
     except Exception:
         return True
 
+async def _read_modal_state(page) -> dict:
+    """Modal presence, job picker value, job row IDs and confirm-button state in one evaluate."""
+    try:
+        return await helper_call(page, "readModalState", INVITE_MODAL, JOB_ROW_CSS, MODAL_CONFIRM_CSS) or {}
+    except Exception:
+        return {}
+
 async def pick_job_in_modal(page) -> bool:
     await pause_if_requested()
     """Return True if we clicked an Invite button for some job."""
     job_pref = os.environ.get("VOICES_JOB_TITLE", "").strip().lower()
     # Log the selection plan up front
     try:
-        sel_val0 = await page.eval_on_selector("#request-quote-open-jobs-list", "el => el && el.value")
+        sel_val0 = (await _read_modal_state(page)).get("select_val")
     except Exception:
         sel_val0 = None
     try:
@@ -1390,7 +1723,7 @@ async def pick_job_in_modal(page) -> bool:
         dd = await page.query_selector(EXISTING_MENU_ITEM)
         if dd and await dd.is_visible():
             await dd.click()
-            await asyncio.sleep(0.2)
+            await _dom_settle(page)
     except Exception:
         pass
 
@@ -1402,6 +1735,13 @@ async def pick_job_in_modal(page) -> bool:
         have_modal = True
     except Exception:
         have_modal = False
+    # In-page waits need the element itself; a Locator can't be passed to evaluate
+    modal_root = None
+    if have_modal:
+        try:
+            modal_root = await modal.element_handle()
+        except Exception:
+            modal_root = None
 
     # Log modal presence
     try:
@@ -1434,19 +1774,30 @@ async def pick_job_in_modal(page) -> bool:
                 except Exception:
                     pass
                 ts = int(time.time() * 1000)
-                try:
-                    html_path = f"debug_modal_missing_{ts}.html"
-                    with open(html_path, "w", encoding="utf-8") as fh:
-                        fh.write(await page.content())
-                    extra["html_path"] = html_path
-                except Exception:
-                    pass
-                try:
-                    png_path = f"debug_modal_missing_{ts}.png"
-                    await page.screenshot(path=png_path)
-                    extra["screenshot"] = png_path
-                except Exception:
-                    pass
+                if LOG_FILE:
+                    # Stored once by content hash next to the log; the event keeps only the digest
+                    try:
+                        extra.update(artifact_fields(LOG_FILE, "html", await page.content(), "html", min_bytes=0))
+                    except Exception:
+                        pass
+                    try:
+                        extra.update(artifact_fields(LOG_FILE, "screenshot", await page.screenshot(), "png", min_bytes=0))
+                    except Exception:
+                        pass
+                else:
+                    try:
+                        html_path = f"debug_modal_missing_{ts}.html"
+                        with open(html_path, "w", encoding="utf-8") as fh:
+                            fh.write(await page.content())
+                        extra["html_path"] = html_path
+                    except Exception:
+                        pass
+                    try:
+                        png_path = f"debug_modal_missing_{ts}.png"
+                        await page.screenshot(path=png_path)
+                        extra["screenshot"] = png_path
+                    except Exception:
+                        pass
             log_event({"type": "modal_missing", "reason": "no_confirm_button", "url": page.url, **extra})
             return False
 
@@ -1478,28 +1829,22 @@ async def pick_job_in_modal(page) -> bool:
             if DRY_RUN:
                 log_event({"type": "would_click", "target": "confirm_primary", "selector": "#submit-request-quote"})
                 return True
-            ok = await _click_with_logging(confirm0, modal if have_modal else None)
+            ok = await _click_with_logging(confirm0, modal if have_modal else None, target="confirm_primary")
             if not ok:
                 return False
-            try:
-                await page.wait_for_selector(SUCCESS_TOAST, timeout=6000)
-            except PWTimeout:
-                try:
-                    if have_modal:
-                        await page.wait_for_selector(INVITE_MODAL, state="hidden", timeout=3000)
-                except Exception:
-                    pass
+            await _wait_invite_result(page, modal_wait=have_modal)
             return True
         except Exception:
             pass
 
     # Always switch to "Invite to Existing Jobs" (never create new job)
     try:
-        tab = await page.query_selector(EXISTING_TAB)
+        tab = await EXISTING_TAB_L.query(page)
         if tab:
             await tab.click()
-            await page.wait_for_load_state("networkidle")
-            await asyncio.sleep(0.5)
+            # The existing-jobs pane is ready once its job picker (or job rows) renders
+            await _wait_visible(page, ".choices, #request-quote-open-jobs-list, [data-testid='job-row'], .job-item",
+                                root=modal_root, timeout_ms=5000)
     except Exception:
         pass  # sometimes the list is already on existing jobs
 
@@ -1533,69 +1878,18 @@ async def pick_job_in_modal(page) -> bool:
                     await page.eval_on_selector(INVITE_MODAL, "(el) => el.scrollBy(0, 1200)")
                 except Exception:
                     pass
-                await asyncio.sleep(0.3)
+                if await _dom_wait(page, "count", "[data-testid='job-row'], .job-item, li, tr", root=modal_root, max_ms=300):
+                    break
             rows = await page.query_selector_all(JOB_ROW)
         except Exception:
             pass
 
-    # Try to extract job IDs (if present) to support targeted selection
-    async def _extract_job_id(row) -> Optional[str]:
-        try:
-            link = await row.query_selector("a[href*='/jobs/']")
-            if link:
-                href = await link.get_attribute("href")
-                if href:
-                    m = re.search(r"/jobs/(\d+)", href)
-                    if m:
-                        return m.group(1)
-                    m = re.search(r"(\d{5,})", href)
-                    if m:
-                        return m.group(1)
-        except Exception:
-            pass
-        for attr in ("data-job-id", "data-id", "data-jobid", "data-job"):
-            try:
-                v = await row.get_attribute(attr)
-                if v and re.fullmatch(r"\d{5,}", v.strip()):
-                    return v.strip()
-            except Exception:
-                continue
-        try:
-            txt = await row.inner_text()
-            m = re.search(r"\b(\d{5,})\b", txt)
-            if m:
-                return m.group(1)
-        except Exception:
-            pass
-        return None
-
-    # If a specific job ID or title is required, try to target it; otherwise fall back to confirming
+    # If a specific job ID or title is required, try to target it; otherwise fall back to confirming.
+    # The row scan (job ID, then title) runs in the page and hands back the row's button.
     target_btn = None
-    if REQUIRED_JOB_ID:
-        for r in rows:
-            try:
-                jid = await _extract_job_id(r)
-                if jid and jid == REQUIRED_JOB_ID:
-                    btn = await r.query_selector(JOB_INVITE_BTN)
-                    if btn:
-                        target_btn = btn
-                        break
-            except Exception:
-                continue
-
-        # try exact/contains match if title provided (only if not already matched by ID)
-        if (not target_btn) and job_pref:
-            for r in rows:
-                try:
-                    title_el = await r.query_selector(JOB_TITLE_EL)
-                    title = (await title_el.inner_text()) if title_el else ""
-                    if job_pref in title.lower():
-                        btn = await r.query_selector(JOB_INVITE_BTN)
-                        if btn:
-                            target_btn = btn
-                            break
-                except Exception:
-                    continue
+    if REQUIRED_JOB_ID and rows:
+        target_btn = await helper_handle(page, "jobRowInviteButton", INVITE_MODAL, JOB_ROW_CSS, JOB_TITLE_EL,
+                                         REQUIRED_JOB_ID, job_pref)
 
     # If no required job filtering, or if we didn't find a specific row button, try the confirm path
     if not target_btn:
@@ -1618,24 +1912,18 @@ async def pick_job_in_modal(page) -> bool:
                                 await row_text.evaluate("el => el.click()")
                             except Exception:
                                 pass
-                    await asyncio.sleep(0.2)
+                    await _dom_settle(page)
                     # After selecting a row, confirm
                     try:
-                        confirm = await page.query_selector(FINAL_INVITE_BTN)
+                        confirm = await FINAL_INVITE_BTN_L.query(page)
                         if confirm and (await confirm.is_enabled()):
                             if DRY_RUN:
                                 log_event({"type": "would_click", "target": "confirm_after_row_click"})
                                 return True
-                            ok = await _click_with_logging(confirm, modal if have_modal else None)
+                            ok = await _click_with_logging(confirm, modal if have_modal else None, target="confirm_after_row_click")
                             if not ok:
                                 return False
-                            try:
-                                await page.wait_for_selector(SUCCESS_TOAST, timeout=6000)
-                            except PWTimeout:
-                                try:
-                                    await page.wait_for_selector(INVITE_MODAL, state="hidden", timeout=3000)
-                                except Exception:
-                                    pass
+                            await _wait_invite_result(page)
                             return True
                     except Exception:
                         pass
@@ -1682,7 +1970,7 @@ async def pick_job_in_modal(page) -> bool:
                 if DRY_RUN:
                     log_event({"type": "would_click", "target": "confirm_after_choices"})
                     return True
-                ok = await _click_with_logging(confirm, modal if have_modal else None)
+                ok = await _click_with_logging(confirm, modal if have_modal else None, target="confirm_after_choices")
                 if not ok:
                     return False
 
@@ -1691,22 +1979,7 @@ async def pick_job_in_modal(page) -> bool:
                     log_event({"type": "confirm_clicked", "path": "after_choices"})
                 except Exception:
                     pass
-                try:
-                    await page.wait_for_selector(SUCCESS_TOAST, timeout=6000)
-                    try:
-                        log_event({"type": "confirm_result", "status": "toast_seen"})
-                    except Exception:
-                        pass
-                except PWTimeout:
-                    try:
-                        if have_modal:
-                            await page.wait_for_selector(INVITE_MODAL, state="hidden", timeout=3000)
-                            try:
-                                log_event({"type": "confirm_result", "status": "modal_hidden"})
-                            except Exception:
-                                pass
-                    except Exception:
-                        pass
+                await _wait_invite_result(page, modal_wait=have_modal, log_result=True)
                 return True
             except Exception:
                 pass
@@ -1743,29 +2016,14 @@ async def pick_job_in_modal(page) -> bool:
             if DRY_RUN:
                 log_event({"type": "would_click", "target": "confirm_fallback", "selector": "modal-scoped"})
                 return True
-            ok = await _click_with_logging(confirm, modal if have_modal else None)
+            ok = await _click_with_logging(confirm, modal if have_modal else None, target="confirm_fallback")
             if not ok:
                 return False
             try:
                 log_event({"type": "confirm_clicked", "path": "fallback_confirm"})
             except Exception:
                 pass
-            try:
-                await page.wait_for_selector(SUCCESS_TOAST, timeout=6000)
-                try:
-                    log_event({"type": "confirm_result", "status": "toast_seen"})
-                except Exception:
-                    pass
-            except PWTimeout:
-                try:
-                    if have_modal:
-                        await page.wait_for_selector(INVITE_MODAL, state="hidden", timeout=3000)
-                        try:
-                            log_event({"type": "confirm_result", "status": "modal_hidden"})
-                        except Exception:
-                            pass
-                except Exception:
-                    pass
+            await _wait_invite_result(page, modal_wait=have_modal, log_result=True)
             return True
         except Exception:
             pass
@@ -1783,17 +2041,12 @@ async def pick_job_in_modal(page) -> bool:
                 if DRY_RUN:
                     log_event({"type": "would_click", "target": "row_invite_button"})
                     return True
+                await _rate_gate("confirm")
                 try:
                     await first_row_btn.click()
                 except asyncio.CancelledError:
                     return False
-                try:
-                    await page.wait_for_selector(SUCCESS_TOAST, timeout=6000)
-                except PWTimeout:
-                    try:
-                        await page.wait_for_selector(INVITE_MODAL, state="hidden", timeout=3000)
-                    except Exception:
-                        pass
+                await _wait_invite_result(page)
                 return True
         except Exception:
             pass
@@ -1802,37 +2055,23 @@ async def pick_job_in_modal(page) -> bool:
         try:
             if rows:
                 await rows[0].click()
-                await asyncio.sleep(0.2)
-                confirm = await page.query_selector(FINAL_INVITE_BTN if have_modal else FINAL_INVITE_BTN_ANY)
+                await _dom_settle(page)
+                confirm = await (FINAL_INVITE_BTN_L.query(page) if have_modal else page.query_selector(FINAL_INVITE_BTN_ANY))
                 if confirm and (await confirm.is_enabled()):
                     if DRY_RUN:
                         log_event({"type": "would_click", "target": "confirm_after_row_select"})
                         return True
-                    ok = await _click_with_logging(confirm, modal if have_modal else None)
+                    ok = await _click_with_logging(confirm, modal if have_modal else None, target="confirm_after_row_select")
                     if not ok:
                         return False
-                    try:
-                        await page.wait_for_selector(SUCCESS_TOAST, timeout=6000)
-                    except PWTimeout:
-                        try:
-                            if have_modal:
-                                await page.wait_for_selector(INVITE_MODAL, state="hidden", timeout=3000)
-                        except Exception:
-                            pass
+                    await _wait_invite_result(page, modal_wait=have_modal)
                     return True
         except Exception:
             pass
 
         if DEBUG and REQUIRED_JOB_ID:
             try:
-                found_ids = []
-                for r in rows:
-                    try:
-                        jid = await _extract_job_id(r)
-                        if jid:
-                            found_ids.append(jid)
-                    except Exception:
-                        pass
+                found_ids = (await _read_modal_state(page)).get("job_ids") or []
                 print(f"[debug] No matching job. Found IDs: {', '.join(found_ids) if found_ids else 'none'}; required {REQUIRED_JOB_ID}.")
             except Exception:
                 pass
@@ -1846,24 +2085,17 @@ async def pick_job_in_modal(page) -> bool:
     if DRY_RUN:
         log_event({"type": "would_click", "target": "target_row_button"})
         return True
+    await _rate_gate("confirm")
     await target_btn.click()
     # wait for a success toast or the modal to close/disable
-    try:
-        await page.wait_for_selector(SUCCESS_TOAST, timeout=6000)
-    except PWTimeout:
+    if await _wait_invite_result(page, modal_wait=False) == "timeout":
         # Try a final confirmation click if required
         try:
-            confirm = await page.query_selector(FINAL_INVITE_BTN)
+            confirm = await FINAL_INVITE_BTN_L.query(page)
             if confirm and await confirm.is_enabled():
-                ok = await _click_with_logging(confirm, modal if have_modal else None)
+                ok = await _click_with_logging(confirm, modal if have_modal else None, target="confirm_final")
                 if ok:
-                    try:
-                        await page.wait_for_selector(SUCCESS_TOAST, timeout=6000)
-                    except PWTimeout:
-                        try:
-                            await page.wait_for_selector(INVITE_MODAL, state="hidden", timeout=3000)
-                        except Exception:
-                            pass
+                    await _wait_invite_result(page)
         except Exception:
             pass
     # close modal (some UIs auto-close)
@@ -1938,7 +2170,7 @@ async def _select_job_via_choices_simple(page, modal, job_id: str, job_pref: str
                         )
                         ok = True
                     if ok:
-                        await asyncio.sleep(0.15)
+                        await _dom_settle(page)
                         chip1, sel1 = await _read_state()
                         log_event({"type": "job_choice_selected_via_select", "chip": chip1, "select_val": sel1})
                         if sel1 is not None and eff_job_id is not None and str(sel1) == str(eff_job_id) and str(chip1) == str(eff_job_id):
@@ -1960,7 +2192,7 @@ async def _select_job_via_choices_simple(page, modal, job_id: str, job_pref: str
                         await wrapper.evaluate("el => el.click()")
                     except Exception:
                         pass
-                await asyncio.sleep(0.12)
+                await _wait_visible(page, ".choices__list--dropdown .choices__item", timeout_ms=400)
                 try:
                     expanded = await wrapper.get_attribute("aria-expanded")
                 except Exception:
@@ -1975,7 +2207,7 @@ async def _select_job_via_choices_simple(page, modal, job_id: str, job_pref: str
                         await wrapper.press("Space")
                     except Exception:
                         pass
-                await asyncio.sleep(0.12)
+                await _wait_visible(page, ".choices__list--dropdown .choices__item", timeout_ms=400)
         except Exception:
             pass
 
@@ -2014,7 +2246,7 @@ async def _select_job_via_choices_simple(page, modal, job_id: str, job_pref: str
                 search = wrapper.locator("input[type='search'], .choices__input--cloned, input[role='searchbox']").first
                 if await search.count():
                     await search.fill(eff_job_id or job_pref)
-                    await asyncio.sleep(0.25)
+                    await _dom_settle(page, quiet_ms=80, max_ms=500)
                     target = wrapper.locator(".choices__list--dropdown .choices__item[role='option']", has_text=(eff_job_id or job_pref)).first
             except Exception:
                 pass
@@ -2028,7 +2260,7 @@ async def _select_job_via_choices_simple(page, modal, job_id: str, job_pref: str
                         "request-quote-open-jobs-list",
                         eff_job_id,
                     )
-                    await asyncio.sleep(0.15)
+                    await _dom_settle(page)
                     chip3, sel3 = await _read_state()
                     log_event({"type": "job_choice_selected_via_select_fallback", "chip": chip3, "select_val": sel3})
                     return str(sel3) == str(eff_job_id)
@@ -2052,7 +2284,7 @@ async def _select_job_via_choices_simple(page, modal, job_id: str, job_pref: str
                 except Exception:
                     return False
 
-        await asyncio.sleep(0.15)
+        await _dom_settle(page)
         chip2, sel2 = await _read_state()
         log_event({"type": "job_choice_selected", "chip": chip2, "select_val": sel2})
         return (str(sel2) == str(eff_job_id)) if eff_job_id else bool(chip2)
@@ -2060,7 +2292,75 @@ async def _select_job_via_choices_simple(page, modal, job_id: str, job_pref: str
         pass
     return False
 
-async def invite_all_on_page(page) -> int:
+def _page_done_sets(snapshot) -> tuple:
+    """(already invited, already favorited) talent IDs among the snapshot, looked up in bulk."""
+    ids = {sn["talent_id"] for sn in snapshot if sn.get("talent_id")}
+    invited_done = invited_db_done_many(ids) if ids else set()
+    fav_done = set()
+    if USE_FAVORITES and ids:
+        try:
+            led = get_ledger()
+            if led:
+                fav_done = led.has_many(ids, ACTION_FAVORITE, FAVORITES_LIST_TITLE)
+        except Exception:
+            fav_done = set()
+    return invited_done, fav_done
+
+def _card_actionable(sn: dict, invited_done: set, fav_done: set, only_ids: Optional[set]) -> bool:
+    tid = sn.get("talent_id")
+    if only_ids is not None and tid not in only_ids:
+        return False
+    if (tid and tid in invited_done) or sn.get("invited_state"):
+        return False
+    if USE_FAVORITES and ((tid and tid in fav_done) or sn.get("favorited_state")):
+        return False
+    return True
+
+def _page_offset(url: str) -> Optional[int]:
+    m = re.search(r"[?&]offset=(\d+)", url or "")
+    return int(m.group(1)) if m else None
+
+# Talent IDs a tab has taken (or finished) in this run; only used by the tab pool, where two
+# tabs can reach the same talent before either has written it to the invited DB.
+_CLAIMED_IDS: Optional[set] = None
+
+def _claim_talent(talent_id: Optional[str]) -> bool:
+    if _CLAIMED_IDS is None or not talent_id:
+        return True
+    if talent_id in _CLAIMED_IDS:
+        return False
+    _CLAIMED_IDS.add(talent_id)
+    return True
+
+def _release_talent(talent_id: Optional[str]):
+    if _CLAIMED_IDS is not None and talent_id:
+        _CLAIMED_IDS.discard(talent_id)
+
+async def invite_all_on_page(page, only_ids: Optional[set] = None,
+                             prefetched: Optional[dict] = None) -> Tuple[int, bool]:
+    """Scan the current results page inside a "page" trace span. Returns (invites made,
+    all_done), all_done meaning every card was already handled so the caller can move to
+    the next offset without pacing.
+    prefetched is a _prefetch_page result for this tab (cards already loaded and scrolled).
+    """
+    with span("page", cat="page", offset=_page_offset(page.url), url=page.url) as sp:
+        invited, all_done = await _scan_page(page, only_ids, prefetched)
+        if sp is not None:
+            sp.set(invited=invited, all_done=all_done)
+        report = asset_filter.take_page_report(page)
+        if report is not None:
+            log_event({"type": "assets_blocked", "url": page.url, **report})
+            if sp is not None:
+                sp.set(assets_blocked=report["blocked"])
+    flush_trace()
+    return invited, all_done
+
+async def _scan_page(page, only_ids: Optional[set] = None, prefetched: Optional[dict] = None) -> Tuple[int, bool]:
+    """Invite (or favorite) every actionable card on the current search page; returns
+    (invites made, all_done). When only_ids is given, cards whose talent ID is not in it are left alone.
+    """
+    if prefetched is not None and (prefetched.get("tab") is not page or not prefetched.get("cards")):
+        prefetched = None
     await pause_if_requested()
     await accept_cookies_if_present(page)
     # Ensure we're on a talents search page; if we were redirected (e.g., to jobs list), navigate back
@@ -2068,21 +2368,42 @@ async def invite_all_on_page(page) -> int:
         curr = (page.url or "").lower()
         if "/talents/search" not in curr:
             await page.goto(START_URL)
-            try:
-                await page.wait_for_load_state("networkidle")
-            except PWTimeout:
-                await page.wait_for_load_state("domcontentloaded")
-            await asyncio.sleep(0.5)
+            await wait_cards_ready(page)
     except Exception:
         pass
     # For Favorites mode, ensure we treat this page as needing an initial list pick
     global _FAVORITES_LIST_SELECTED
     _FAVORITES_LIST_SELECTED = False
     favorites_selected_this_page = False
+
+    # Fast pre-pass: when a full page of cards is already done, skip scrolling, the
+    # per-card loop and the fallbacks entirely. Short pages may still be lazy-loading,
+    # so they always get the scroll passes before being judged.
+    if prefetched is not None:
+        # Loaded, scrolled and snapshotted in the background while the previous page ran
+        cards, snapshot = prefetched["cards"], prefetched["snapshot"]
+    else:
+        cards = await page.query_selector_all(TALENT_CARD)
+        snapshot = await _snapshot_cards(page, cards)
+    invited_done, fav_done = _page_done_sets(snapshot)
+    if (len(snapshot) >= RESULTS_PER_PAGE or prefetched is not None) and not any(_card_actionable(sn, invited_done, fav_done, only_ids) for sn in snapshot):
+        log_event({"type": "page_skip_all_done", "url": page.url, "count": len(snapshot), "phase": "pre_scroll"})
+        log_event({"type": "page_scan_end", "url": page.url, "count": 0, "dry_run": bool(DRY_RUN)})
+        return 0, True
+
     # help trigger any lazy-loading
-    for _ in range(SCROLL_PASSES):
+    for _ in range(0 if prefetched is not None else SCROLL_PASSES):
         await page.mouse.wheel(0, 20000)
-        await asyncio.sleep(0.6)
+        # Lazy-loaded cards: move on as soon as more render (same 0.6s cap as before otherwise)
+        await _dom_wait(page, "grow", TALENT_CARD_CSS, max_ms=600)
+    if SCROLL_PASSES and prefetched is None:
+        cards = await page.query_selector_all(TALENT_CARD)
+        snapshot = await _snapshot_cards(page, cards)
+        invited_done, fav_done = _page_done_sets(snapshot)
+    if snapshot and not any(_card_actionable(sn, invited_done, fav_done, only_ids) for sn in snapshot):
+        log_event({"type": "page_skip_all_done", "url": page.url, "count": len(snapshot), "phase": "post_scroll"})
+        log_event({"type": "page_scan_end", "url": page.url, "count": 0, "dry_run": bool(DRY_RUN)})
+        return 0, True
 
     # Pre-scan diagnostics: how many visible invite buttons exist now
     try:
@@ -2101,7 +2422,6 @@ async def invite_all_on_page(page) -> int:
         except Exception:
             pass
 
-    cards = await page.query_selector_all(TALENT_CARD)
     if DEBUG:
         try:
             print(f"[debug] Found {len(cards)} talent cards on page.")
@@ -2113,27 +2433,36 @@ async def invite_all_on_page(page) -> int:
         pass
     invited = 0
 
-    for c in cards:
+    # The snapshot holds everything the loop needs to decide; the browser is only
+    # revisited below for hovers and real clicks.
+    for snap in snapshot:
         await pause_if_requested()
+        card_span = start_span("card", cat="card", talent_id=snap["talent_id"], index=snap["index"])
+        claimed, card_ok = None, False
         try:
+            c = cards[snap["index"]]
             # Check and skip previously invited IDs
-            talent_id = None
-            try:
-                talent_id = await _extract_talent_id_from_root(c)
-            except Exception:
-                talent_id = None
-            if talent_id and invited_db_has(talent_id):
+            talent_id = snap["talent_id"]
+            if only_ids is not None and talent_id not in only_ids:
+                continue
+            if talent_id and talent_id in invited_done:
                 log_event({"type": "skip_already_invited", "talent_id": talent_id})
                 continue
             # If card already shows invited state, skip (site-specific; update if needed)
-            already = await c.query_selector(":is([aria-pressed='true'], .invited, :has-text('Invited'))")
-            if already:
+            if snap["invited_state"]:
                 continue
+            if not _claim_talent(talent_id):
+                log_event({"type": "skip_claimed", "talent_id": talent_id})
+                continue
+            claimed = talent_id
 
             # Favorites mode: per-page initial list selection, then simple heart clicks
             if USE_FAVORITES:
                 try:
-                    already_fav = await _card_is_favorited(c)
+                    if talent_id and talent_id in fav_done:
+                        log_event({"type": "skip_already_favorited", "talent_id": talent_id})
+                        continue
+                    already_fav = snap["favorited_state"]
                     if not favorites_selected_this_page:
                         # Find the first non-favorited card on this page and use it to set (or confirm) the list
                         if already_fav:
@@ -2147,7 +2476,9 @@ async def invite_all_on_page(page) -> int:
                                 log_event({"type": "favorite_planned", "url": page.url, "talent_id": talent_id, "phase": "initializer"})
                             else:
                                 log_event({"type": "favorited", "url": page.url, "talent_id": talent_id, "phase": "initializer"})
+                                ledger_add(talent_id, ACTION_FAVORITE, FAVORITES_LIST_TITLE, page.url)
                             invited += 1
+                            card_ok = True
                             await jitter(*CLICK_PAUSE, label="CLICK_PAUSE")
                             continue
                     else:
@@ -2160,17 +2491,18 @@ async def invite_all_on_page(page) -> int:
                                 log_event({"type": "favorite_planned", "url": page.url, "talent_id": talent_id})
                             else:
                                 log_event({"type": "favorited", "url": page.url, "talent_id": talent_id})
+                                ledger_add(talent_id, ACTION_FAVORITE, FAVORITES_LIST_TITLE, page.url)
                             invited += 1
+                            card_ok = True
                             await jitter(*CLICK_PAUSE, label="CLICK_PAUSE")
                             continue
                 except Exception:
                     pass
 
-            btn = await c.query_selector(INVITE_MENU_BTN)
-            if not btn:
+            if snap["needs_hover"]:
                 # Some cards hide the button until hover
                 await c.hover()
-                btn = await c.query_selector(INVITE_MENU_BTN)
+            btn = await INVITE_MENU_BTN_L.query(c)
             if not btn:
                 if DEBUG:
                     try:
@@ -2182,12 +2514,12 @@ async def invite_all_on_page(page) -> int:
 
             await btn.scroll_into_view_if_needed()
             # Use robust dropdown click helper to open the 'Invite to Existing Job' flow
-            opened = await _click_existing_job_dropdown(page, btn)
+            with span("open_dropdown"):
+                opened = await _click_existing_job_dropdown(page, btn)
             if not opened:
                 # Fallback: click head button once and try quick wait
                 try:
                     await btn.click()
-                    await asyncio.sleep(0.25)
                     mi = await page.wait_for_selector(EXISTING_MENU_ITEM, timeout=2000)
                     if mi:
                         try:
@@ -2197,11 +2529,12 @@ async def invite_all_on_page(page) -> int:
                                 await page.eval_on_selector(EXISTING_MENU_ITEM, "el => el.click()")
                             except Exception:
                                 pass
-                        await asyncio.sleep(0.2)
+                        await _dom_settle(page)
                 except Exception:
                     pass
 
-            ok = await pick_job_in_modal(page)
+            with span("pick_job"):
+                ok = await pick_job_in_modal(page)
             if ok:
                 if DRY_RUN:
                     log_event({"type": "invite_planned", "url": page.url, "talent_id": talent_id})
@@ -2210,10 +2543,15 @@ async def invite_all_on_page(page) -> int:
                     if talent_id:
                         invited_db_add(talent_id, url=page.url)
                 invited += 1
+                card_ok = True
                 await jitter(*CLICK_PAUSE, label="CLICK_PAUSE")
         except Exception:
             # element may detach due to reflow; move on
             continue
+        finally:
+            if claimed and not card_ok:
+                _release_talent(claimed)
+            end_span(card_span)
 
     # Post-scan diagnostics and count for fallback
     post_invites = None
@@ -2261,7 +2599,7 @@ async def invite_all_on_page(page) -> int:
             pass
 
     # Fallback (invite mode only): if we didn't invite anyone via card-based flow, try clicking any visible Invite buttons directly
-    if not USE_FAVORITES and invited == 0 and (post_invites or 0) > 0:
+    if not USE_FAVORITES and only_ids is None and invited == 0 and (post_invites or 0) > 0:
         try:
             btns = await page.query_selector_all(INVITE_MENU_BTN)
             try:
@@ -2269,15 +2607,22 @@ async def invite_all_on_page(page) -> int:
             except Exception:
                 pass
             for btn in btns:
+                card_span = start_span("card", cat="card", where="fallback_btns")
+                claimed, card_ok = None, False
                 try:
                     # Try mapping the button back to a talent ID and skip if already invited
                     try:
                         talent_id = await _extract_talent_id_from_button(page, btn)
                     except Exception:
                         talent_id = None
+                    set_attrs(talent_id=talent_id)
                     if talent_id and invited_db_has(talent_id):
                         log_event({"type": "skip_already_invited", "talent_id": talent_id, "where": "fallback_btns"})
                         continue
+                    if not _claim_talent(talent_id):
+                        log_event({"type": "skip_claimed", "talent_id": talent_id, "where": "fallback_btns"})
+                        continue
+                    claimed = talent_id
                     if not await btn.is_visible():
                         continue
                     # Ensure any prior dropdown is closed before proceeding
@@ -2287,11 +2632,11 @@ async def invite_all_on_page(page) -> int:
                         pass
                     await btn.scroll_into_view_if_needed()
                     # Robust dropdown opening and menu click
-                    opened = await _click_existing_job_dropdown(page, btn)
+                    with span("open_dropdown"):
+                        opened = await _click_existing_job_dropdown(page, btn)
                     if not opened:
                         try:
                             await btn.click()
-                            await asyncio.sleep(0.25)
                             mi = await page.wait_for_selector(EXISTING_MENU_ITEM, timeout=2000)
                             if mi:
                                 try:
@@ -2301,10 +2646,11 @@ async def invite_all_on_page(page) -> int:
                                         await page.eval_on_selector(EXISTING_MENU_ITEM, "el => el.click()")
                                     except Exception:
                                         pass
-                                await asyncio.sleep(0.2)
+                                await _dom_settle(page)
                         except Exception:
                             pass
-                    ok = await pick_job_in_modal(page)
+                    with span("pick_job"):
+                        ok = await pick_job_in_modal(page)
                     if ok:
                         if DRY_RUN:
                             log_event({"type": "invite_planned", "url": page.url, "talent_id": talent_id})
@@ -2313,9 +2659,14 @@ async def invite_all_on_page(page) -> int:
                             if talent_id:
                                 invited_db_add(talent_id, url=page.url)
                         invited += 1
+                        card_ok = True
                         await jitter(*CLICK_PAUSE, label="CLICK_PAUSE")
                 except Exception:
                     continue
+                finally:
+                    if claimed and not card_ok:
+                        _release_talent(claimed)
+                    end_span(card_span)
         except Exception:
             pass
 
@@ -2323,9 +2674,12 @@ async def invite_all_on_page(page) -> int:
         log_event({"type": "page_scan_end", "url": page.url, "count": int(invited), "dry_run": bool(DRY_RUN)})
     except Exception:
         pass
-    return invited
+    return invited, False
 
-async def goto_next_page(page) -> bool:
+async def goto_next_page(page, pace: bool = True) -> bool:
+    # Cards still on screen belong to this page; the readiness wait must not mistake them
+    # for the next page's when pagination re-renders in place
+    await mark_stale(page, TALENT_CARD_CSS)
     # Ensure pagination is in view
     try:
         await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
@@ -2335,7 +2689,7 @@ async def goto_next_page(page) -> bool:
 
     # 1) Prefer explicit next link variants (rel=next, title, sr-only "Next Page")
     try:
-        next_link = await page.query_selector(NEXT_LINK_SEL)
+        next_link = await NEXT_LINK_L.query(page)
         if next_link:
             href = None
             try:
@@ -2355,11 +2709,9 @@ async def goto_next_page(page) -> bool:
                 await page.goto(href)
             else:
                 await next_link.click()
-            try:
-                await page.wait_for_load_state("networkidle")
-            except PWTimeout:
-                await page.wait_for_load_state("domcontentloaded")
-            await jitter(*PAGE_PAUSE, label="PAGE_PAUSE")
+            await wait_cards_ready(page)
+            if pace:
+                await jitter(*PAGE_PAUSE, label="PAGE_PAUSE")
             return True
     except Exception:
         pass
@@ -2376,39 +2728,368 @@ async def goto_next_page(page) -> bool:
                 t = (await n.inner_text()).strip()
                 if t == target:
                     await n.click()
-                    await page.wait_for_load_state("networkidle")
-                    await jitter(*PAGE_PAUSE, label="PAGE_PAUSE")
+                    await wait_cards_ready(page)
+                    if pace:
+                        await jitter(*PAGE_PAUSE, label="PAGE_PAUSE")
                     return True
     except Exception:
         pass
 
     # 3) Fallback: increment URL offset parameter (Voices uses offset=24*n)
     try:
-        from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
-        u = urlparse(page.url)
-        q = parse_qs(u.query)
-        curr_offset = int(q.get("offset", [0])[0] or 0)
-        next_offset = curr_offset + 24
-        q["offset"] = [str(next_offset)]
-        new_query = urlencode(q, doseq=True)
-        new_url = urlunparse((u.scheme, u.netloc, u.path, u.params, new_query, u.fragment))
+        next_offset = url_offset(page.url) + RESULTS_PER_PAGE
+        new_url = offset_url(page.url, next_offset)
         if DEBUG:
             try:
                 print(f"[debug] Fallback navigating to offset {next_offset}: {new_url}")
             except Exception:
                 pass
         await page.goto(new_url)
-        try:
-            await page.wait_for_load_state("networkidle")
-        except PWTimeout:
-            await page.wait_for_load_state("domcontentloaded")
-        await jitter(*PAGE_PAUSE, label="PAGE_PAUSE")
+        await wait_cards_ready(page)
+        if pace:
+            await jitter(*PAGE_PAUSE, label="PAGE_PAUSE")
         return True
     except Exception:
         pass
 
     return False
 
+async def plan_pages(page, first_page: int) -> Optional[PagePlan]:
+    """Read the search size off the current (first) results page and plan every offset URL."""
+    try:
+        counts = await helper_call(page, "resultCount", PAGINATION_NUMBERS)
+    except Exception:
+        counts = None
+    plan = PagePlan.from_counts(offset_url(page.url, 0), RESULTS_PER_PAGE,
+                                total_results=(counts or {}).get("total"),
+                                last_page=(counts or {}).get("last_page"), start_page=first_page, shard=SHARD)
+    if plan is None:
+        print("[pages] Result count not found; following the pagination links instead.")
+        return None
+    log_event({"type": "page_plan", "total_results": plan.total_results, "pages": plan.page_count,
+               "start_page": plan.start_page, "base_url": plan.base_url,
+               "shard": "%d/%d" % SHARD if SHARD else None, "planned": len(plan.page_numbers())})
+    shard_note = f" (shard {SHARD[0]}/{SHARD[1]}: {len(plan.page_numbers())} pages)" if SHARD else ""
+    print(f"[pages] {plan.total_results or '?'} results -> {plan.page_count} pages{shard_note}; starting at page {plan.start_page}.")
+    return plan
+
+async def _page_is_full(page) -> bool:
+    """True when page shows a whole page of cards, i.e. the search may go on past it."""
+    try:
+        return len(await page.query_selector_all(TALENT_CARD)) >= RESULTS_PER_PAGE
+    except Exception:
+        return False
+
+async def goto_planned_page(page, plan: PagePlan, page_num: int, pace: bool = True,
+                            current: Optional[int] = None) -> bool:
+    """Open page page_num of the plan by its offset URL. False past the last page (or for None,
+    i.e. no next page in this shard), or when the
+    site shows no cards there (the count can shrink while a long run is going).
+    The count is read off the page text and can come out low: when the tab is on the last
+    planned page (current) and it is still full, follow the Next link instead of stopping."""
+    if page_num is None or page_num > plan.page_count:
+        if current is not None and current >= plan.page_count and await _page_is_full(page):
+            log_event({"type": "page_plan_undercount", "page": current, "pages": plan.page_count})
+            return await goto_next_page(page, pace=pace)
+        return False
+    await page.goto(plan.url_for(page_num))
+    if await wait_cards_ready(page) == "empty":
+        return False
+    if pace:
+        await jitter(*PAGE_PAUSE, label="PAGE_PAUSE")
+    return True
+
+async def _prefetch_page(tab, url: str) -> dict:
+    """Load url in a background tab, run the lazy-load scroll passes and snapshot its cards,
+    so the hand-off to this tab needs no navigation or waiting."""
+    with span("prefetch", cat="page", url=url) as sp:
+        await tab.goto(url)
+        state = await wait_cards_ready(tab)
+        cards, snapshot = [], []
+        if state != "empty":
+            for _ in range(SCROLL_PASSES):
+                # Scripted scroll: wheel input is not reliable on a tab that is not in front
+                await tab.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+                await _dom_wait(tab, "grow", TALENT_CARD_CSS, max_ms=600)
+            await tab.evaluate("window.scrollTo(0, 0)")
+            cards = await tab.query_selector_all(TALENT_CARD)
+            snapshot = await _snapshot_cards(tab, cards)
+        if sp is not None:
+            sp.set(state=state, cards=len(cards))
+    log_event({"type": "prefetch_ready", "url": url, "state": state, "cards": len(cards)})
+    return {"tab": tab, "url": url, "state": state, "cards": cards, "snapshot": snapshot}
+
+async def _await_prefetch(task) -> Optional[dict]:
+    try:
+        return await task
+    except Exception as e:
+        log_event({"type": "prefetch_error", "error": str(e)})
+        print(f"[warn] Prefetch failed ({e}); loading the next page directly.")
+        return None
+
+class CardQueue:
+    """Actionable cards by page number. A tab drains its own page first (take_local);
+    idle tabs steal from the tail of the page with the biggest backlog."""
+
+    def __init__(self):
+        self.by_page: Dict[int, collections.deque] = {}
+
+    def push(self, page_num: int, talent_ids: list):
+        if talent_ids:
+            self.by_page.setdefault(page_num, collections.deque()).extend(talent_ids)
+
+    def take_local(self, page_num: Optional[int], n: int) -> list:
+        q = self.by_page.get(page_num) if page_num is not None else None
+        out = []
+        while q and len(out) < n:
+            out.append(q.popleft())
+        if q is not None and not q:
+            del self.by_page[page_num]
+        return out
+
+    def steal(self, n: int) -> tuple:
+        if not self.by_page:
+            return None, []
+        page_num = max(self.by_page, key=lambda k: len(self.by_page[k]))
+        q = self.by_page[page_num]
+        out = []
+        while q and len(out) < n:
+            out.append(q.pop())
+        if not q:
+            del self.by_page[page_num]
+        return page_num, out
+
+    def __len__(self) -> int:
+        return sum(len(q) for q in self.by_page.values())
+
+async def _fresh_cards(tab) -> dict:
+    """Re-read the cards of an already loaded and scrolled page (no navigation, no scrolling)."""
+    cards = await tab.query_selector_all(TALENT_CARD)
+    return {"tab": tab, "url": tab.url, "state": "cards", "cards": cards, "snapshot": await _snapshot_cards(tab, cards)}
+
+async def run_tab_pool(context, first_tab, plan: PagePlan, invited_total: int, tabs: int,
+                       steal: bool = False) -> int:
+    """Work the planned pages with several tabs of one context. Each tab pulls the next page
+    number from a shared queue; talent IDs are claimed in a shared set so two tabs never
+    invite the same talent, and jitter() keeps pauses on one timeline for all tabs.
+    With steal, pages are only harvested for actionable cards and the cards themselves are
+    shared out, so a page full of new talents is worked by every idle tab at once."""
+    global _CLAIMED_IDS
+    _CLAIMED_IDS = set()
+    queue: "asyncio.Queue[int]" = asyncio.Queue()
+    for n in plan.page_numbers():
+        queue.put_nowait(n)
+    done_pages: set = set()
+    totals = {"invited": invited_total}
+    loaded = {id(first_tab): plan.start_page}  # the first tab already shows the start page
+    pool = [first_tab]
+    for _ in range(tabs - 1):
+        try:
+            t = await context.new_page()
+            pacing.watch_page(t)
+            pool.append(t)
+        except Exception as e:
+            print(f"[warn] Could not open another worker tab: {e}")
+            break
+    print(f"[tabs] {len(pool)} tabs working {queue.qsize()} pages{' (card work-stealing)' if steal else ''}.")
+
+    def page_finished(tab, page_num: int, added: int):
+        done_pages.add(page_num)
+        plan.mark_done()
+        # Checkpoint the first page not finished yet, so a resume never skips one
+        nxt = next((p for p in plan.page_numbers() if p not in done_pages), plan.page_count + 1)
+        save_checkpoint({"page_num": nxt, "invited": totals["invited"]})
+        print(f"[tab {pool.index(tab) + 1}] page {page_num}: {added} | Total: {totals['invited']} | {plan.progress_line(page_num)}")
+        log_event({"type": "page_progress", "tab": pool.index(tab) + 1, **plan.progress(page_num)})
+
+    def extend_plan(page_num: int):
+        # The result count came out low (see goto_planned_page): the last page was full, so queue the next
+        log_event({"type": "page_plan_undercount", "page": page_num, "pages": plan.page_count})
+        plan.page_count = page_num + 1
+        queue.put_nowait(page_num + 1)
+
+    async def worker(tab):
+        while totals["invited"] < TARGET_INVITES:
+            try:
+                page_num = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            await pause_if_requested()
+            if loaded.pop(id(tab), None) != page_num:
+                await tab.goto(plan.url_for(page_num))
+                if await wait_cards_ready(tab) == "empty":
+                    # Past the real end of the results (the count shrank): nothing further to do
+                    while not queue.empty():
+                        queue.get_nowait()
+                    return
+            added, all_done = await invite_all_on_page(tab)
+            totals["invited"] += added
+            if page_num >= plan.page_count and await _page_is_full(tab):
+                extend_plan(page_num)
+            page_finished(tab, page_num, added)
+            if not all_done:
+                await jitter(*PAGE_PAUSE, label="PAGE_PAUSE")
+
+    cq = CardQueue()
+    pending: Dict[int, int] = {}  # page -> harvested cards not yet worked
+    page_added: Dict[int, int] = {}
+    harvesting = {"n": 0}
+
+    async def open_page(tab, page_num: int) -> dict:
+        if loaded.pop(id(tab), None) == page_num:
+            # Still on the start page from main(): just scroll it and take the snapshot
+            for _ in range(SCROLL_PASSES):
+                await tab.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+                await _dom_wait(tab, "grow", TALENT_CARD_CSS, max_ms=600)
+            await tab.evaluate("window.scrollTo(0, 0)")
+            return await _fresh_cards(tab)
+        return await _prefetch_page(tab, plan.url_for(page_num))
+
+    def settle(tab, page_num: int, batch: list, added: int):
+        totals["invited"] += added
+        page_added[page_num] = page_added.get(page_num, 0) + added
+        pending[page_num] -= len(batch)
+        if pending[page_num] <= 0:
+            page_finished(tab, page_num, page_added.pop(page_num, 0))
+
+    async def work_cards(tab, page_num: int, batch: list, loaded_page: Optional[dict]):
+        added = 0
+        try:
+            if loaded_page is None:
+                loaded_page = await _prefetch_page(tab, plan.url_for(page_num))
+                await jitter(*PAGE_PAUSE, label="PAGE_PAUSE")
+            added, _ = await invite_all_on_page(tab, only_ids=set(batch), prefetched=loaded_page)
+        except Exception as e:
+            # The batch is dropped (its talents stay un-invited for a later run)
+            log_event({"type": "card_batch_error", "page": page_num, "cards": len(batch), "error": str(e)})
+        settle(tab, page_num, batch, added)
+        log_event({"type": "card_batch", "tab": pool.index(tab) + 1, "page": page_num,
+                   "cards": len(batch), "invited": added, "backlog": len(cq)})
+
+    async def stealing_worker(tab):
+        current = None  # page number this tab has loaded
+        while totals["invited"] < TARGET_INVITES:
+            await pause_if_requested()
+            # 1) Keep working the page this tab already has open
+            batch = cq.take_local(current, STEAL_BATCH)
+            if batch:
+                try:
+                    loaded_page = await _fresh_cards(tab)
+                except Exception:
+                    loaded_page = None  # reload the page in work_cards
+                await work_cards(tab, current, batch, loaded_page)
+                continue
+            # 2) Harvest the next page: load it and queue its actionable cards
+            try:
+                page_num = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                page_num = None
+            if page_num is not None:
+                harvesting["n"] += 1
+                try:
+                    loaded_page = await open_page(tab, page_num)
+                    current = page_num
+                    snap = loaded_page["snapshot"]
+                    invited_done, fav_done = _page_done_sets(snap)
+                    # Cards without a talent ID cannot be handed to another tab, so they are not queued
+                    ids = [sn["talent_id"] for sn in snap if sn.get("talent_id")
+                           and _card_actionable(sn, invited_done, fav_done, None)
+                           and not (_CLAIMED_IDS and sn["talent_id"] in _CLAIMED_IDS)]
+                    ids = list(dict.fromkeys(ids))
+                except Exception as e:
+                    log_event({"type": "page_harvest_error", "page": page_num, "error": str(e)})
+                    current = None
+                    continue
+                finally:
+                    harvesting["n"] -= 1
+                log_event({"type": "page_harvest", "tab": pool.index(tab) + 1, "page": page_num,
+                           "cards": len(loaded_page["cards"]), "actionable": len(ids), "state": loaded_page["state"]})
+                if loaded_page["state"] == "empty":
+                    while not queue.empty():
+                        queue.get_nowait()
+                    continue
+                if page_num >= plan.page_count and len(loaded_page["cards"]) >= RESULTS_PER_PAGE:
+                    extend_plan(page_num)
+                if not ids:
+                    page_finished(tab, page_num, 0)
+                    continue
+                pending[page_num] = len(ids)
+                cq.push(page_num, ids)
+                await jitter(*PAGE_PAUSE, label="PAGE_PAUSE")
+                continue
+            # 3) Nothing left to harvest: steal cards queued for another tab's page
+            page_num, batch = cq.steal(STEAL_BATCH)
+            if batch:
+                loaded_page = None if page_num != current else await _fresh_cards(tab)
+                current = page_num
+                log_event({"type": "card_steal", "tab": pool.index(tab) + 1, "page": page_num, "cards": len(batch)})
+                await work_cards(tab, page_num, batch, loaded_page)
+                continue
+            # 4) Others may still be harvesting and about to queue more cards
+            if harvesting["n"]:
+                await asyncio.sleep(0.2)
+                continue
+            return
+
+    try:
+        results = await asyncio.gather(*(asyncio.create_task((stealing_worker if steal else worker)(t), name=f"tab-{i + 1}")
+                                         for i, t in enumerate(pool)), return_exceptions=True)
+        for i, r in enumerate(results):
+            if isinstance(r, Exception):
+                log_event({"type": "tab_error", "tab": i + 1, "error": str(r)})
+                print(f"[warn] Tab {i + 1} stopped: {r}")
+    finally:
+        _CLAIMED_IDS = None
+        for t in pool[1:]:
+            try:
+                await t.close()
+            except Exception:
+                pass
+    return totals["invited"]
+
+async def run_worklist(page, from_job: str, invited_total: int = 0) -> Tuple[int, int]:
+    """Invite talents already invited to from_job (but not REQUIRED_JOB_ID) by revisiting
+    only the search pages they were recorded on, instead of paging through the whole search.
+    Returns (invited_total, missing): missing counts talents with no recorded page or whose
+    card is no longer on it (each logged as a worklist_missing event).
+    """
+    if not REQUIRED_JOB_ID:
+        print("[error] --worklist-from-job needs a target job (--job-id / VOICES_JOB_ID).")
+        return invited_total, 0
+    items = invited_db_worklist(from_job, REQUIRED_JOB_ID)
+    by_url = {}
+    missing = 0
+    for it in items:
+        if it.get("url"):
+            by_url.setdefault(it["url"], set()).add(it["talent_id"])
+        else:
+            missing += 1
+            log_event({"type": "worklist_missing", "talent_id": it["talent_id"], "reason": "no_url"})
+    print(f"[worklist] {len(items)} talents invited to job {from_job} but not {REQUIRED_JOB_ID}, on {len(by_url)} pages.")
+    log_event({"type": "worklist_plan", "from_job": from_job, "to_job": REQUIRED_JOB_ID, "talents": len(items), "pages": len(by_url)})
+    for url, ids in by_url.items():
+        if invited_total >= TARGET_INVITES:
+            break
+        await pause_if_requested()
+        await page.goto(url)
+        await wait_cards_ready(page)
+        added, _ = await invite_all_on_page(page, only_ids=ids)
+        invited_total += added
+        # The scan has scrolled the page, so every card still listed there is loaded by now
+        try:
+            present = {sn.get("talent_id") for sn in await _snapshot_cards(page, await page.query_selector_all(TALENT_CARD))}
+        except Exception:
+            present = set(ids)
+        for tid in sorted(ids - present):
+            missing += 1
+            log_event({"type": "worklist_missing", "talent_id": tid, "url": url, "reason": "card_not_on_page"})
+        print(f"[worklist] Invited on this page: {added}/{len(ids)} | Total: {invited_total}")
+        await jitter(*PAGE_PAUSE, label="PAGE_PAUSE")
+    if missing:
+        print(f"[worklist] {missing} talents could not be found on their recorded page (see worklist_missing events).")
+    log_event({"type": "worklist_done", "invited_total": invited_total, "missing": missing})
+    return invited_total, missing
+
 async def main(
     cli_profile_dir: Optional[str] = None,
     disable_cdp: bool = False,
@@ -2416,9 +3097,13 @@ async def main(
     slow_mo: int = 70,
     manual_login: bool = False,
     require_cdp: bool = False,
+    worklist_from_job: Optional[str] = None,
 ):
     state = load_checkpoint()
     invited_total = state["invited"]
+    configure_tracing(TRACE_FILE)
+    if METRICS_PORT and metrics.start_server(METRICS_PORT):
+        add_listener(metrics.observe_span)
     log_event({"type": "delay", "label": "slow_mo", "delay": slow_mo / 1000})
     try:
         print(f"[delay] slow_mo: {slow_mo}ms")
@@ -2465,7 +3150,7 @@ async def main(
                 print("       To use CDP, start Chrome with: --remote-debugging-port=9222 and the desired profile.")
                 if require_cdp:
                     print("[error] --require-cdp specified; aborting instead of falling back.")
-                    return
+                    return 2
 
         # Try to launch installed Chrome with your existing signed-in profile (system Chrome)
         if USE_SYSTEM_CHROME and not context:
@@ -2517,7 +3202,7 @@ async def main(
         # If CDP was required but we have no context (and no browser), abort clearly
         if require_cdp and not using_cdp:
             print("[error] CDP was required but connection was not established. Exiting.")
-            return
+            return 2
 
         # Open a new tab in the appropriate mode
         if using_cdp:
@@ -2526,42 +3211,119 @@ async def main(
                 page = await context.new_page()
             except Exception as e:
                 print(f"[error] Failed to open a new page over CDP: {e}")
-                return
+                return 2
         else:
             # Open a fresh page in our managed context
             page = await context.new_page()
 
+        await install_helpers(context)
+        await asset_filter.install_asset_filter(context, BLOCK_ASSETS)
+        pacing.set_static(STATIC_PACING)
+        rate_limit.configure(per_min=RATE_PER_MIN)
+        pacing.watch_page(page)
         await login_if_needed(context, page, manual_login=manual_login)
-        await page.goto(START_URL)
-        await page.wait_for_load_state("networkidle")
+        page_num = START_PAGE or (url_offset(START_URL) // RESULTS_PER_PAGE + 1)
+        await page.goto(offset_url(START_URL, (page_num - 1) * RESULTS_PER_PAGE) if START_PAGE else START_URL)
+        await wait_cards_ready(page)
+        plan = await plan_pages(page, page_num) if PAGE_PLAN and not worklist_from_job else None
+        if plan is not None and plan.page_numbers() and plan.page_numbers()[0] != page_num:
+            # The start page belongs to another shard: begin at this worker's first page
+            page_num = plan.page_numbers()[0]
+            await page.goto(plan.url_for(page_num))
+            await wait_cards_ready(page)
+        elif plan is not None and not plan.page_numbers():
+            print("[pages] No pages left for this shard; done.")
+            await page.close()
+            return
+        if SHARD and plan is None and not worklist_from_job and SHARD[0] != 1:
+            # Without a page count the pages cannot be split; shard 1 follows Next links alone
+            print(f"[pages] Shard {SHARD[0]}/{SHARD[1]} has nothing to do without a page plan; exiting.")
+            await page.close()
+            return
+        spare = None  # second tab that loads the next planned page while this one is worked
+        prefetched = None
+        pooled = TABS > 1 and plan is not None and not USE_FAVORITES
+        if TABS > 1 and not pooled and not worklist_from_job:
+            print("[warn] --tabs needs a page plan and invite mode (favorites pick a list per page); using one tab.")
+        if PREFETCH and pooled:
+            print("[warn] --prefetch is ignored with --tabs; every tab loads its own pages.")
+        elif PREFETCH and plan is not None:
+            try:
+                spare = await context.new_page()
+                pacing.watch_page(spare)
+                await page.bring_to_front()
+            except Exception as e:
+                print(f"[warn] Could not open a prefetch tab: {e}")
+        elif PREFETCH and not worklist_from_job:
+            print("[warn] --prefetch needs a page plan (result count); continuing without it.")
         await jitter(*PAGE_PAUSE, label="PAGE_PAUSE")
 
-        while invited_total < TARGET_INVITES:
+        if worklist_from_job:
+            invited_total, _ = await run_worklist(page, worklist_from_job, invited_total)
+        elif pooled:
+            invited_total = await run_tab_pool(context, page, plan, invited_total, TABS, steal=WORK_STEALING)
+        while not worklist_from_job and not pooled and invited_total < TARGET_INVITES:
             await pause_if_requested()
-            added = await invite_all_on_page(page)
+            prefetch_task = None
+            next_num = plan.next_after(page_num) if plan is not None else page_num + 1
+            if spare is not None and next_num is not None:
+                prefetch_task = asyncio.create_task(_prefetch_page(spare, plan.url_for(next_num)),
+                                                    name=f"prefetch-{next_num}")
+            added, all_done = await invite_all_on_page(page, prefetched=prefetched)
+            prefetched = None
             invited_total += added
             if DRY_RUN:
                 print(f"Planned invites on this page: {added} | Total planned: {invited_total}")
             else:
                 print(f"Invited on this page: {added} | Total: {invited_total}")
-            save_checkpoint({"page_num": state["page_num"] + 1, "invited": invited_total})
-
-            await jitter(*PAGE_PAUSE, label="PAGE_PAUSE")
+            save_checkpoint({"page_num": next_num or page_num + 1, "invited": invited_total})
+            if plan is not None:
+                plan.mark_done()
+                print(plan.progress_line(page_num))
+                log_event({"type": "page_progress", **plan.progress(page_num)})
+
+            # Pages where everything was already done are hopped over without pacing
+            if not all_done:
+                await jitter(*PAGE_PAUSE, label="PAGE_PAUSE")
             if added == 0:
                 # still try to move on—maybe all on this page were already invited
                 pass
 
             await pause_if_requested()
-            has_next = await goto_next_page(page)
+            with span("next_page", cat="page"):
+                if prefetch_task is not None:
+                    prefetched = await _await_prefetch(prefetch_task)
+                if prefetched is not None:
+                    # Swap tabs: the prefetched one becomes the working tab, the old one the spare
+                    page, spare = spare, page
+                    has_next = prefetched["state"] != "empty"
+                    if has_next:
+                        await page.bring_to_front()
+                        if not all_done:
+                            await jitter(*PAGE_PAUSE, label="PAGE_PAUSE")
+                elif plan is not None:
+                    has_next = await goto_planned_page(page, plan, next_num, pace=not all_done,
+                                                       current=page_num)
+                else:
+                    has_next = await goto_next_page(page, pace=not all_done)
+            page_num = next_num or page_num + 1
             if not has_next:
                 print("No next page found; done.")
                 break
 
+        if spare is not None:
+            try:
+                await spare.close()
+            except Exception:
+                pass
         # Persist and close cleanly depending on how we launched
         try:
             await context.storage_state(path=STORAGE_STATE)
         except Exception:
             pass
+        invited_db_close()
+        save_stats()
+        log_event({"type": "pacing_summary", **pacing.get_pacer().snapshot()})
         if using_persistent:
             await context.close()
         elif using_cdp:
@@ -2668,6 +3430,62 @@ def _parse_cli_args():
         action="store_true",
         help="Faster timings: smaller click/page pauses and fewer scroll passes.",
     )
+    parser.add_argument(
+        "--rate-per-min",
+        dest="rate_per_min",
+        type=float,
+        help="Cap invite confirms and heart clicks per minute across every worker using this account "
+             "(shared via a lock file; overrides VOICES_RATE_PER_MIN).",
+    )
+    parser.add_argument(
+        "--start-page",
+        dest="start_page",
+        type=int,
+        help="1-based search results page to start from (jumps straight to its offset).",
+    )
+    parser.add_argument(
+        "--follow-next",
+        action="store_true",
+        help="Page by clicking Next instead of planning all offset URLs from the result count.",
+    )
+    parser.add_argument(
+        "--shard",
+        help="I/N: work only every N-th planned page starting with the I-th (for several worker processes; see supervisor.py).",
+    )
+    parser.add_argument(
+        "--cdp-url",
+        dest="cdp_url",
+        help="Chrome DevTools endpoint to attach to (overrides CHROME_CDP_URL).",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        help="Checkpoint JSON path (overrides VOICES_CHECKPOINT; give each worker process its own).",
+    )
+    parser.add_argument(
+        "--tabs",
+        type=int,
+        help="Work this many search pages at once, one tab each (needs the page plan; overrides VOICES_TABS).",
+    )
+    parser.add_argument(
+        "--steal",
+        action="store_true",
+        help="With --tabs: queue each page's actionable cards and let idle tabs take them over.",
+    )
+    parser.add_argument(
+        "--prefetch",
+        action="store_true",
+        help="Load, scroll and snapshot the next page in a second tab while the current one is worked.",
+    )
+    parser.add_argument(
+        "--block-assets",
+        action="store_true",
+        help="On search pages, skip images, fonts, media and third-party requests the automation never uses.",
+    )
+    parser.add_argument(
+        "--static-pacing",
+        action="store_true",
+        help="Use plain random pauses inside the click/page ranges instead of adapting them to site health.",
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -2678,10 +3496,26 @@ def _parse_cli_args():
         dest="log_file",
         help="Path to JSONL log file for structured events.",
     )
+    parser.add_argument(
+        "--trace-file",
+        dest="trace_file",
+        help="Write page/card/stage timing spans to this Chrome trace JSON (open in ui.perfetto.dev).",
+    )
+    parser.add_argument(
+        "--metrics-port",
+        dest="metrics_port",
+        type=int,
+        help="Serve live Prometheus metrics on http://127.0.0.1:PORT/metrics (overrides VOICES_METRICS_PORT).",
+    )
     parser.add_argument(
         "--invited-db",
         dest="invited_db",
-        help="Path to JSON file storing already-invited talent IDs to skip.",
+        help="Path to JSON file storing already-invited talent IDs (per job) to skip.",
+    )
+    parser.add_argument(
+        "--worklist-from-job",
+        dest="worklist_from_job",
+        help="Instead of crawling the search, invite talents already invited to this job ID but not yet to --job-id.",
     )
     parser.add_argument(
         "--pause-file",
@@ -2722,6 +3556,10 @@ if __name__ == "__main__":
     if getattr(_args, "log_file", None):
         LOG_FILE = _args.log_file  # type: ignore[name-defined]
         os.environ["VOICES_LOG_FILE"] = _args.log_file
+    if getattr(_args, "trace_file", None):
+        TRACE_FILE = _args.trace_file  # type: ignore[name-defined]
+    if getattr(_args, "metrics_port", None) is not None:
+        METRICS_PORT = int(_args.metrics_port)  # type: ignore[name-defined]
     # Favorites mode
     if getattr(_args, "use_favorites", False):
         USE_FAVORITES = True  # type: ignore[name-defined]
@@ -2737,19 +3575,44 @@ if __name__ == "__main__":
     if getattr(_args, "invited_db", None):
         INVITED_DB = _args.invited_db  # type: ignore[name-defined]
         os.environ["VOICES_INVITED_DB"] = _args.invited_db
+    if getattr(_args, "rate_per_min", None) is not None:
+        RATE_PER_MIN = float(_args.rate_per_min)  # type: ignore[name-defined]
+    if getattr(_args, "start_page", None):
+        START_PAGE = max(1, int(_args.start_page))  # type: ignore[name-defined]
+    if getattr(_args, "follow_next", False):
+        PAGE_PLAN = False  # type: ignore[name-defined]
+    if getattr(_args, "shard", None):
+        SHARD = parse_shard(_args.shard)  # type: ignore[name-defined]
+    if getattr(_args, "cdp_url", None):
+        CHROME_CDP_URL = _args.cdp_url  # type: ignore[name-defined]
+    if getattr(_args, "checkpoint", None):
+        CHECKPOINT = _args.checkpoint  # type: ignore[name-defined]
+    if getattr(_args, "tabs", None):
+        TABS = max(1, int(_args.tabs))  # type: ignore[name-defined]
+    if getattr(_args, "steal", False):
+        WORK_STEALING = True  # type: ignore[name-defined]
+    if getattr(_args, "prefetch", False):
+        PREFETCH = True  # type: ignore[name-defined]
+    if getattr(_args, "block_assets", False):
+        BLOCK_ASSETS = True  # type: ignore[name-defined]
+    if getattr(_args, "static_pacing", False):
+        STATIC_PACING = True  # type: ignore[name-defined]
     # Apply fast mode if requested (or via env VOICES_FAST)
     if _args.fast or os.environ.get("VOICES_FAST", "0").lower() in {"1", "true", "yes", "on"}:
         CLICK_PAUSE = (0.3, 0.6)
         PAGE_PAUSE = (1.0, 2.0)
         if _args.scroll_passes is None:
             SCROLL_PASSES = 1
-    asyncio.run(
+    # A non-zero exit tells a supervisor (supervisor.py) to restart this worker
+    sys.exit(asyncio.run(
         main(
             cli_profile_dir=_args.profile_dir,
             disable_cdp=_args.no_cdp,
             headless=_args.headless,
             slow_mo=_args.slow_mo,
             manual_login=_args.manual_login,
-            require_cdp=_args.require_cdp or REQUIRE_CDP,
+            # --no-cdp asks for a launched browser, so the REQUIRE_CDP default must not veto it
+            require_cdp=_args.require_cdp or (REQUIRE_CDP and not _args.no_cdp),
+            worklist_from_job=_args.worklist_from_job,
         )
-    )
+    ))
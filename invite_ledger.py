@@ -0,0 +1,196 @@
+import os
+import sqlite3
+import threading
+import time
+from typing import Iterable, Optional
+
+# Shared record of work already done on talents, consulted by every script before
+# touching a card so reruns skip finished work. Set VOICES_LEDGER_DB to "" to disable.
+LEDGER_DB = os.environ.get("VOICES_LEDGER_DB", "voices_ledger.sqlite3").strip()
+
+ACTION_INVITE = "invite"
+ACTION_FAVORITE = "favorite"
+ACTION_MESSAGE = "message"
+
+# Walk up from any element inside a talent card (or the card itself) and return a
+# stable talent ID/slug: data-* attributes first, then the profile link. Mirrors
+# invite_all._extract_talent_id_from_root so every script keys the ledger the same way.
+TALENT_ID_FROM_ELEMENT_JS = r"""
+el => {
+  const root = el.closest("[data-testid='talent-card'], [data-qa='talent-card'], article, tr, li") || el;
+  for (const a of ["data-talent-id", "data-profile-id", "data-id", "data-user-id"]) {
+    const v = root.getAttribute(a);
+    if (v && v.trim()) return v.trim();
+  }
+  const link = root.querySelector("a[href*='/talents/'], a[href*='/talent/'], a[href*='/profile/'], a[href*='/users/']");
+  const href = link ? (link.getAttribute("href") || "") : "";
+  const m = href.match(/\/talents\/([A-Za-z0-9_-]+)/) || href.match(/\/talent\/([A-Za-z0-9_-]+)/)
+    || href.match(/\/profile\/([A-Za-z0-9_-]+)/) || href.match(/\/users\/([A-Za-z0-9_-]+)/);
+  return m ? m[1] : null;
+}
+"""
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS ledger (
+    talent_id TEXT NOT NULL,
+    action    TEXT NOT NULL,
+    job_id    TEXT NOT NULL DEFAULT '',
+    ts        REAL NOT NULL,
+    url       TEXT,
+    PRIMARY KEY (talent_id, action, job_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS ledger_action_job ON ledger (action, job_id);
+"""
+
+
+class Ledger:
+    """SQLite (WAL mode) ledger keyed by (talent_id, action, job_id).
+
+    job_id is "" for actions that are not scoped to a job. Lookups match job_id exactly;
+    any_job=True matches the action for any job (invite_all's "no target job" check).
+    Safe to share between processes; writes are autocommitted so a crash never loses a
+    recorded action.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(path, timeout=30, isolation_level=None, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(_SCHEMA)
+
+    def has(self, talent_id: str, action: str, job_id: str = "", any_job: bool = False) -> bool:
+        with self._lock:
+            if any_job:
+                row = self.conn.execute(
+                    "SELECT 1 FROM ledger WHERE talent_id=? AND action=? LIMIT 1", (str(talent_id), action),
+                ).fetchone()
+            else:
+                row = self.conn.execute(
+                    "SELECT 1 FROM ledger WHERE talent_id=? AND action=? AND job_id=?",
+                    (str(talent_id), action, str(job_id or "")),
+                ).fetchone()
+        return row is not None
+
+    def has_many(self, talent_ids: Iterable[str], action: str, job_id: str = "", any_job: bool = False) -> set:
+        """Return the subset of talent_ids already recorded for (action, job_id)."""
+        ids = list({str(t) for t in talent_ids if t})
+        done = set()
+        with self._lock:
+            # Stay well under SQLite's bound-parameter limit
+            for i in range(0, len(ids), 500):
+                chunk = ids[i:i + 500]
+                marks = ",".join("?" * len(chunk))
+                if any_job:
+                    rows = self.conn.execute(
+                        f"SELECT DISTINCT talent_id FROM ledger WHERE action=? AND talent_id IN ({marks})",
+                        (action, *chunk),
+                    ).fetchall()
+                else:
+                    rows = self.conn.execute(
+                        f"SELECT talent_id FROM ledger WHERE action=? AND job_id=? AND talent_id IN ({marks})",
+                        (action, str(job_id or ""), *chunk),
+                    ).fetchall()
+                done.update(r[0] for r in rows)
+        return done
+
+    def add(self, talent_id: str, action: str, job_id: str = "", url: str = ""):
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO ledger (talent_id, action, job_id, ts, url) VALUES (?, ?, ?, ?, ?)",
+                (str(talent_id), action, str(job_id or ""), time.time(), url or ""),
+            )
+
+    def missing_for_job(self, action: str, have_job: str, lack_job: str) -> list:
+        """[(talent_id, url)] recorded for (action, have_job) but not for (action, lack_job)."""
+        with self._lock:
+            return self.conn.execute(
+                "SELECT a.talent_id, a.url FROM ledger a WHERE a.action=? AND a.job_id=? "
+                "AND NOT EXISTS (SELECT 1 FROM ledger b WHERE b.talent_id=a.talent_id "
+                "AND b.action=a.action AND b.job_id=?) ORDER BY a.url, a.ts",
+                (action, str(have_job or ""), str(lack_job or "")),
+            ).fetchall()
+
+    def counts_since(self, since: float) -> dict:
+        """{(action, job_id): rows recorded at or after the since timestamp}."""
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT action, job_id, COUNT(*) FROM ledger WHERE ts>=? GROUP BY action, job_id", (since,),
+            ).fetchall()
+        return {(a, j): n for a, j, n in rows}
+
+    def close(self):
+        with self._lock:
+            try:
+                self.conn.close()
+            except Exception:
+                pass
+
+
+_LEDGER: Optional[Ledger] = None
+_LEDGER_FAILED = False
+
+
+def get_ledger() -> Optional[Ledger]:
+    """Return the process-wide ledger, opening it on first use (None when disabled/unavailable)."""
+    global _LEDGER, _LEDGER_FAILED
+    if _LEDGER is not None or _LEDGER_FAILED:
+        return _LEDGER
+    path = os.environ.get("VOICES_LEDGER_DB", LEDGER_DB).strip()
+    if not path or path.lower() in {"0", "off", "none"}:
+        _LEDGER_FAILED = True
+        return None
+    try:
+        _LEDGER = Ledger(path)
+    except Exception as e:
+        _LEDGER_FAILED = True
+        try:
+            print(f"[warn] Ledger unavailable at {path}: {e}")
+        except Exception:
+            pass
+    return _LEDGER
+
+
+def ledger_has(talent_id: Optional[str], action: str, job_id: str = "", any_job: bool = False) -> bool:
+    """Best-effort membership check; False when the ID is unknown or the ledger is off."""
+    if not talent_id:
+        return False
+    try:
+        led = get_ledger()
+        return bool(led and led.has(talent_id, action, job_id, any_job))
+    except Exception:
+        return False
+
+
+def ledger_add(talent_id: Optional[str], action: str, job_id: str = "", url: str = ""):
+    if not talent_id:
+        return
+    try:
+        led = get_ledger()
+        if led:
+            led.add(talent_id, action, job_id, url)
+    except Exception:
+        pass
+
+
+if __name__ == "__main__":
+    import argparse
+    import json
+
+    ap = argparse.ArgumentParser(description="Query the shared Voices action ledger.")
+    ap.add_argument("--db", default=LEDGER_DB, help="Ledger path (default: VOICES_LEDGER_DB or voices_ledger.sqlite3)")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    wl = sub.add_parser("worklist", help="Print talents done for one job but not another, as JSON lines")
+    wl.add_argument("--have", required=True, help="Job ID the talents were already invited to")
+    wl.add_argument("--lack", required=True, help="Job ID they have not been invited to yet")
+    wl.add_argument("--action", default=ACTION_INVITE, help="Ledger action (default: invite)")
+    args = ap.parse_args()
+
+    led = Ledger(args.db)
+    try:
+        if args.cmd == "worklist":
+            for tid, url in led.missing_for_job(args.action, args.have, args.lack):
+                print(json.dumps({"talent_id": tid, "url": url}))
+    finally:
+        led.close()
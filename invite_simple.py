@@ -1,10 +1,17 @@
 import os
 import json
 import asyncio
+import contextvars
 import random
+import time
 from typing import Optional
 
 from playwright.async_api import async_playwright, TimeoutError as PWTimeout
+from event_log import artifact_fields, write_event
+from invite_ledger import ACTION_INVITE, TALENT_ID_FROM_ELEMENT_JS, ledger_has, ledger_add
+from learned_stats import get_stats
+import rate_limit
+from page_helpers import wait_ready
 
 
 SEARCH_URL = "https://www.voices.com/talents/search?keywords=&language_ids=419&accent_id=114"
@@ -18,6 +25,11 @@ PAGE_PAUSE = (
     float(os.environ.get("VOICES_PAGE_PAUSE_MIN", 1.0)),
     float(os.environ.get("VOICES_PAGE_PAUSE_MAX", 1.0)),
 )
+# Plain-CSS talent card match for the page readiness check (mirrors invite_all.TALENT_CARD_CSS)
+TALENT_CARD_CSS = "[data-testid='talent-card'], [data-qa='talent-card'], article"
+# Per-attempt confirm-click timeout; methods are tried in order of past success
+CLICK_TIMEOUT_MS = int(os.environ.get("VOICES_CLICK_TIMEOUT_MS", 1500))
+CLICK_METHODS = ("normal", "force", "js", "keyboard")
 
 
 async def jitter(a: float, b: float, label: str = "pause"):
@@ -157,40 +169,83 @@ async def select_job_in_modal(modal, job_id: str) -> bool:
     return False
 
 
-async def _click_with_logging(confirm, modal=None) -> bool:
-    """Attempt to click the confirmation element with fallbacks and logging."""
-    methods = [
-        ("normal", lambda: confirm.click()),
-        ("force", lambda: confirm.click(force=True)),
-        ("js", lambda: confirm.evaluate("el => el.click()")),
-        ("keyboard", lambda: (modal or confirm).press("Enter")),
-    ]
-    for name, action in methods:
-        try:
-            visible = await confirm.is_visible()
-        except Exception:
-            visible = None
-        try:
-            enabled = await confirm.is_enabled()
-        except Exception:
-            enabled = None
-        try:
-            bbox = await confirm.bounding_box()
-        except Exception:
-            bbox = None
-        log_event({"type": "confirm_attempt", "method": name, "visible": visible, "enabled": enabled, "bbox": bbox})
+async def _confirm_diagnostics(confirm) -> dict:
+    """Visibility, enabled state, box and (by digest) outerHTML in one round trip; only called after a failed click."""
+    try:
+        d = await confirm.evaluate("""el => {
+            const r = el.getBoundingClientRect();
+            const st = getComputedStyle(el);
+            return {
+                visible: r.width > 0 && r.height > 0 && st.visibility !== 'hidden' && st.display !== 'none',
+                enabled: !el.disabled && el.getAttribute('aria-disabled') !== 'true',
+                bbox: {x: r.x, y: r.y, width: r.width, height: r.height},
+                outer: el.outerHTML,
+            };
+        }""")
+    except Exception:
+        return {}
+    outer = d.pop("outer", None)
+    d.update(artifact_fields(os.environ.get("VOICES_LOG_FILE", "").strip(), "outer_html", outer or None, "html"))
+    return d
+
+
+# (target, method) of the last confirm click in this task, scored once its outcome is known.
+# A click that does not throw proves nothing ("js" and "keyboard" practically never throw),
+# so methods are only credited when the invite toast shows or the modal closes. Scores live
+# in their own stats section; older "clicks" counts credited any click that did not throw.
+_PENDING_CLICK: contextvars.ContextVar = contextvars.ContextVar("pending_click", default=None)
+
+
+def _record_click_outcome(ok: bool):
+    pending = _PENDING_CLICK.get()
+    if pending is None:
+        return
+    _PENDING_CLICK.set(None)
+    target, method = pending
+    get_stats().bump("click_outcomes", target, method + (":ok" if ok else ":fail"))
+
+
+def _click_method_order(target: str) -> list:
+    """Click methods ordered by their (smoothed) confirmed-success rate for this target on earlier runs."""
+    counts = get_stats().counts("click_outcomes", target)
+
+    def score(m):
+        ok, fail = counts.get(m + ":ok", 0), counts.get(m + ":fail", 0)
+        return (ok + 1) / (ok + fail + 2)
+    return sorted(CLICK_METHODS, key=lambda m: (-score(m), CLICK_METHODS.index(m)))
+
+
+async def _click_with_logging(confirm, modal=None, target: str = "confirm") -> bool:
+    """Click the confirmation element, starting with the method that has worked best for
+    this target before and falling back through the others. Each attempt gets a short
+    timeout, and element diagnostics are only collected once an attempt has failed.
+    The method that went through is scored by _record_click_outcome after the result wait.
+    """
+    actions = {
+        "normal": lambda: confirm.click(timeout=CLICK_TIMEOUT_MS),
+        "force": lambda: confirm.click(force=True, timeout=CLICK_TIMEOUT_MS),
+        "js": lambda: confirm.evaluate("el => el.click()"),
+        "keyboard": lambda: (modal or confirm).press("Enter", timeout=CLICK_TIMEOUT_MS),
+    }
+    stats = get_stats()
+    order = _click_method_order(target)
+    _PENDING_CLICK.set(None)
+    await rate_limit.acquire("confirm")
+    diag = None
+    for name in order:
+        log_event({"type": "confirm_attempt", "method": name, "target": target})
         try:
-            await action()
-            log_event({"type": "confirm_summary", "method": name, "success": True})
-            return True
+            await actions[name]()
         except Exception as e:
-            outer = None
-            try:
-                outer = await confirm.evaluate("el => el.outerHTML")
-            except Exception:
-                pass
-            log_event({"type": "confirm_error", "method": name, "error": str(e), "outer_html": outer})
-    log_event({"type": "confirm_summary", "method": "keyboard", "success": False})
+            stats.bump("click_outcomes", target, name + ":fail")
+            if diag is None:
+                diag = await _confirm_diagnostics(confirm)
+            log_event({"type": "confirm_error", "method": name, "target": target, "error": str(e), **diag})
+            continue
+        _PENDING_CLICK.set((target, name))
+        log_event({"type": "confirm_summary", "method": name, "target": target, "success": True})
+        return True
+    log_event({"type": "confirm_summary", "method": order[-1], "target": target, "success": False})
     return False
 
 
@@ -212,12 +267,14 @@ async def confirm_invite(modal) -> bool:
     # Wait for the modal to close (success or already invited toast may appear)
     try:
         await modal.wait_for(state="hidden", timeout=6000)
+        _record_click_outcome(True)
         try:
             log_event({"type": "confirm", "status": "modal_hidden"})
         except Exception:
             pass
         return True
     except Exception:
+        _record_click_outcome(False)
         try:
             log_event({"type": "confirm", "status": "timeout"})
         except Exception:
@@ -228,11 +285,11 @@ async def confirm_invite(modal) -> bool:
 def log_event(evt: dict):
     try:
         evt = dict(evt)
+        evt.setdefault("ts", time.time())
         print("[invite_simple] " + json.dumps(evt))
         lf = os.environ.get("VOICES_LOG_FILE", "").strip()
         if lf:
-            with open(lf, "a", encoding="utf-8") as f:
-                f.write(json.dumps(evt) + "\n")
+            write_event(lf, evt)
     except Exception:
         pass
 
@@ -263,7 +320,7 @@ async def run(job_id: str = DEFAULT_JOB_ID, start_url: str = SEARCH_URL, headles
 
         try:
             await page.goto(start_url)
-            await page.wait_for_load_state("domcontentloaded")
+            await wait_ready(page, TALENT_CARD_CSS)
         except Exception:
             pass
         await accept_cookies(page)
@@ -297,6 +354,14 @@ async def run(job_id: str = DEFAULT_JOB_ID, start_url: str = SEARCH_URL, headles
                 count = await cards.count()
                 if idx >= count:
                     break
+                # Skip talents already invited to this job by any script (shared ledger)
+                try:
+                    talent_id = await cards.nth(idx).evaluate(TALENT_ID_FROM_ELEMENT_JS)
+                except Exception:
+                    talent_id = None
+                if ledger_has(talent_id, ACTION_INVITE, job_id):
+                    log_event({"type": "skip_already_invited", "idx": int(idx), "talent_id": talent_id})
+                    continue
                 log_event({"type": "invite_open", "idx": int(idx), "count": int(count)})
                 modal = await open_existing_job_modal(page, idx)
                 if not modal:
@@ -308,6 +373,8 @@ async def run(job_id: str = DEFAULT_JOB_ID, start_url: str = SEARCH_URL, headles
                 log_event({"type": "invite_select", "idx": int(idx), "selected": bool(ok_sel), "job_id": str(job_id)})
                 ok_conf = await confirm_invite(modal)
                 log_event({"type": "invite_confirm", "idx": int(idx), "confirmed": bool(ok_conf)})
+                if ok_conf:
+                    ledger_add(talent_id, ACTION_INVITE, job_id, page.url)
                 await jitter(*CLICK_PAUSE, label="CLICK_PAUSE")
             except Exception:
                 pass
@@ -0,0 +1,148 @@
+import atexit
+import json
+import os
+import threading
+import time
+from typing import Dict, List, Optional, Sequence
+
+# Small persistent record of what worked on previous runs, so hot paths can try the
+# historically winning option first (which selector alternative matched, ...).
+#   VOICES_LEARNED_STATS  JSON file to keep the counts in (default voices_learned_stats.json; "" = memory only)
+LEARNED_STATS_FILE = os.environ.get("VOICES_LEARNED_STATS", "voices_learned_stats.json").strip()
+SAVE_INTERVAL = 30.0  # seconds between background saves while a run is going
+
+
+class LearnedStats:
+    """Hit counts by section -> key -> item, saved atomically to a JSON file."""
+
+    def __init__(self, path: str = ""):
+        self.path = path
+        self.data: Dict[str, Dict[str, Dict[str, float]]] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._last_save = time.time()
+        self.load()
+
+    def load(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as fh:
+                raw = json.load(fh)
+            if isinstance(raw, dict):
+                self.data = {s: {k: dict(v) for k, v in keys.items() if isinstance(v, dict)}
+                             for s, keys in raw.items() if isinstance(keys, dict)}
+        except Exception as e:
+            print(f"[warn] Ignoring unreadable learned stats {self.path}: {e}")
+
+    def save(self, force: bool = False):
+        with self._lock:
+            if not self.path or not self._dirty:
+                return
+            if not force and time.time() - self._last_save < SAVE_INTERVAL:
+                return
+            snapshot = json.dumps(self.data, indent=1, sort_keys=True)
+            self._dirty = False
+            self._last_save = time.time()
+        try:
+            tmp = f"{self.path}.{os.getpid()}.tmp"  # several worker processes may share the file
+            with open(tmp, "w", encoding="utf-8") as fh:
+                fh.write(snapshot)
+            os.replace(tmp, self.path)
+        except Exception:
+            pass
+
+    def counts(self, section: str, key: str) -> Dict[str, float]:
+        with self._lock:
+            return dict(self.data.get(section, {}).get(key, {}))
+
+    def bump(self, section: str, key: str, item: str, n: float = 1):
+        with self._lock:
+            bucket = self.data.setdefault(section, {}).setdefault(key, {})
+            bucket[item] = bucket.get(item, 0) + n
+            self._dirty = True
+        self.save()
+
+    def ranked(self, section: str, key: str, items: Sequence[str]) -> List[str]:
+        """items ordered by recorded hits (most first); ties keep the given order."""
+        c = self.counts(section, key)
+        return sorted(items, key=lambda it: (-c.get(it, 0), items.index(it)))
+
+
+_STATS: Optional[LearnedStats] = None
+
+
+def get_stats() -> LearnedStats:
+    global _STATS
+    if _STATS is None:
+        _STATS = LearnedStats(os.environ.get("VOICES_LEARNED_STATS", LEARNED_STATS_FILE).strip())
+    return _STATS
+
+
+def save_stats():
+    if _STATS is not None:
+        _STATS.save(force=True)
+
+
+atexit.register(save_stats)
+
+
+class LearnedSelector:
+    """A compound selector split into its alternatives.
+
+    query() tries the alternative that matched most often as a narrow query and only
+    falls back to the full union on a miss, learning which branch matched that time.
+    union defaults to the alternatives joined with ", "; pass the original string when
+    it must keep its exact Playwright semantics. A union containing ">>" is a chain to
+    Playwright, not a list, so for those the alternatives are tried one by one instead.
+    """
+
+    SECTION = "selectors"
+
+    def __init__(self, key: str, alternatives: Sequence[str], union: Optional[str] = None):
+        self.key = key
+        self.alternatives = list(alternatives)
+        self.union = union or ", ".join(self.alternatives)
+        self.chained = ">>" in self.union
+
+    def __str__(self) -> str:
+        return self.union
+
+    async def query(self, root):
+        """root.query_selector(union), usually at the cost of a single narrow query."""
+        stats = get_stats()
+        order = stats.ranked(self.SECTION, self.key, self.alternatives)
+        if self.chained:
+            for alt in order:
+                try:
+                    el = await root.query_selector(alt)
+                except Exception:
+                    el = None
+                if el is not None:
+                    stats.bump(self.SECTION, self.key, alt)
+                    return el
+            return None
+        winner = order[0] if stats.counts(self.SECTION, self.key) else None
+        if winner:
+            try:
+                el = await root.query_selector(winner)
+            except Exception:
+                el = None
+            if el is not None:
+                stats.bump(self.SECTION, self.key, winner)
+                return el
+        el = await root.query_selector(self.union)
+        if el is None:
+            return None
+        # Learn which branch produced the match (misses only, so this stays rare)
+        for alt in order:
+            if alt == winner:
+                continue
+            try:
+                cand = await root.query_selector(alt)
+                if cand is not None and await cand.evaluate("(a, b) => a === b", el):
+                    stats.bump(self.SECTION, self.key, alt)
+                    break
+            except Exception:
+                continue
+        return el
@@ -1,7 +1,10 @@
 import asyncio
+import re
 from typing import Optional, Set
 
 from playwright.async_api import async_playwright, TimeoutError as PWTimeout
+from invite_ledger import ACTION_MESSAGE, TALENT_ID_FROM_ELEMENT_JS, ledger_has, ledger_add
+import rate_limit
 
 
 JOB_RESPONSES_URL = "https://www.voices.com/client/jobs/responses/818318"
@@ -31,6 +34,9 @@ async def message_all_responses(
             return
 
         processed: Set[str] = set()
+        # Ledger scope for this job; responses already handled on earlier runs are skipped
+        m = re.search(r"/(\d+)(?:[/?#]|$)", job_url)
+        job_id = m.group(1) if m else job_url
         while True:
             msg_buttons = page.locator("button:has-text('Message')")
             count = await msg_buttons.count()
@@ -51,8 +57,17 @@ async def message_all_responses(
                         key = f"idx:{i}"
                     if key in processed:
                         continue
+                    try:
+                        talent_id = await btn.evaluate(TALENT_ID_FROM_ELEMENT_JS)
+                    except Exception:
+                        talent_id = None
+                    ledger_key = talent_id or (None if key.startswith("idx:") else key)
+                    if ledger_has(ledger_key, ACTION_MESSAGE, job_id):
+                        processed.add(key)
+                        continue
 
                     await btn.scroll_into_view_if_needed()
+                    await rate_limit.acquire("message")
                     await btn.click()
 
                     # Modal handling
@@ -78,6 +93,7 @@ async def message_all_responses(
 
                     await modal.wait_for(state="hidden", timeout=10000)
                     processed.add(key)
+                    ledger_add(ledger_key, ACTION_MESSAGE, job_id, page.url)
                     new_found = True
                 except Exception:
                     # Move on to next button if one fails
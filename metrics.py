@@ -0,0 +1,224 @@
+import collections
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+
+# Optional live metrics for a running invite job, served in the Prometheus text format.
+#   VOICES_METRICS_PORT  serve http://127.0.0.1:<port>/metrics (default: off; --metrics-port in invite_all.py)
+#   VOICES_METRICS_HOST  interface to bind (default 127.0.0.1)
+# Counters are fed from the structured events that log_event already emits, and stage
+# latencies from the tracing spans, so the browser-driving code needs no extra calls.
+METRICS_PORT = int(os.environ.get("VOICES_METRICS_PORT", "0") or 0)
+METRICS_HOST = os.environ.get("VOICES_METRICS_HOST", "127.0.0.1").strip() or "127.0.0.1"
+
+# Seconds; covers quick DOM checks up to the slowest modal/page waits
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 3.0, 5.0, 7.5, 10.0, 15.0, 30.0, 60.0)
+PAGES_PER_MINUTE_WINDOW = 300.0
+
+
+def _fmt_labels(names: Tuple[str, ...], values: Tuple[str, ...], extra: str = "") -> str:
+    parts = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _escape(v) -> str:
+    return str(v).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _num(v: float) -> str:
+    return repr(float(v)) if v != int(v) else str(int(v))
+
+
+class Counter:
+    def __init__(self, name: str, help_text: str, labels: Tuple[str, ...] = ()):
+        self.name = name
+        self.help = help_text
+        self.labels = tuple(labels)
+        self._values: Dict[tuple, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *label_values, amount: float = 1.0):
+        key = tuple(str(v) for v in label_values)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def render(self) -> str:
+        out = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            items = sorted(self._values.items())
+        if not items and not self.labels:
+            items = [((), 0.0)]
+        for key, v in items:
+            out.append(f"{self.name}{_fmt_labels(self.labels, key)} {_num(v)}")
+        return "\n".join(out)
+
+
+class Gauge:
+    def __init__(self, name: str, help_text: str, fn):
+        self.name = name
+        self.help = help_text
+        self.fn = fn
+
+    def render(self) -> str:
+        try:
+            v = float(self.fn())
+        except Exception:
+            v = 0.0
+        return f"# HELP {self.name} {self.help}\n# TYPE {self.name} gauge\n{self.name} {_num(v)}"
+
+
+class Histogram:
+    def __init__(self, name: str, help_text: str, labels: Tuple[str, ...] = (), buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.help = help_text
+        self.labels = tuple(labels)
+        self.buckets = tuple(sorted(buckets))
+        self._series: Dict[tuple, list] = {}  # key -> [bucket counts..., count, sum]
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *label_values):
+        key = tuple(str(v) for v in label_values)
+        with self._lock:
+            s = self._series.get(key)
+            if s is None:
+                s = self._series[key] = [0] * len(self.buckets) + [0, 0.0]
+            for i, b in enumerate(self.buckets):
+                if value <= b:
+                    s[i] += 1
+            s[-2] += 1
+            s[-1] += float(value)
+
+    def render(self) -> str:
+        out = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            items = sorted((k, list(v)) for k, v in self._series.items())
+        for key, s in items:
+            for i, b in enumerate(self.buckets):
+                le = 'le="%s"' % _num(b)
+                out.append(f"{self.name}_bucket{_fmt_labels(self.labels, key, le)} {s[i]}")
+            inf = 'le="+Inf"'
+            out.append(f"{self.name}_bucket{_fmt_labels(self.labels, key, inf)} {s[-2]}")
+            out.append(f"{self.name}_count{_fmt_labels(self.labels, key)} {s[-2]}")
+            out.append(f"{self.name}_sum{_fmt_labels(self.labels, key)} {_num(s[-1])}")
+        return "\n".join(out)
+
+
+_STARTED = time.time()
+_PAGE_TIMES: "collections.deque" = collections.deque()
+_PAGE_LOCK = threading.Lock()
+
+
+def _pages_per_minute() -> float:
+    now = time.time()
+    with _PAGE_LOCK:
+        while _PAGE_TIMES and now - _PAGE_TIMES[0] > PAGES_PER_MINUTE_WINDOW:
+            _PAGE_TIMES.popleft()
+        n = len(_PAGE_TIMES)
+    window = min(PAGES_PER_MINUTE_WINDOW, max(1.0, now - _STARTED))
+    return 60.0 * n / window
+
+
+INVITES = Counter("voices_invites_total", "Invites confirmed (mode=dry_run for planned ones).", ("mode",))
+FAVORITES = Counter("voices_favorites_total", "Talents added to the favorites list.", ("mode",))
+SKIPS = Counter("voices_skips_total", "Cards skipped as already done, by reason.", ("reason",))
+CONFIRMS = Counter("voices_confirm_clicks_total", "Confirm-button clicks by the method that was used.", ("method", "success"))
+CONFIRM_ERRORS = Counter("voices_confirm_errors_total", "Failed confirm-click attempts that fell through to the next method.", ("method",))
+MODAL_TIMEOUTS = Counter("voices_modal_timeouts_total", "Invite modals that never confirmed (no toast / no confirm button / no action).", ("kind",))
+PAGES = Counter("voices_pages_total", "Search pages finished (including ones skipped as all done).")
+PAGES_ALL_DONE = Counter("voices_pages_all_done_total", "Search pages skipped because every card was already handled.")
+STAGE_SECONDS = Histogram("voices_stage_seconds", "Latency of each invite pipeline stage.", ("stage",))
+PAGES_PER_MINUTE = Gauge("voices_pages_per_minute", f"Pages finished per minute over the last {int(PAGES_PER_MINUTE_WINDOW)}s.", _pages_per_minute)
+UPTIME = Gauge("voices_uptime_seconds", "Seconds since the metrics module was loaded.", lambda: time.time() - _STARTED)
+
+_METRICS = (INVITES, FAVORITES, SKIPS, CONFIRMS, CONFIRM_ERRORS, MODAL_TIMEOUTS, PAGES, PAGES_ALL_DONE, PAGES_PER_MINUTE, STAGE_SECONDS, UPTIME)
+
+
+def render() -> str:
+    return "\n".join(m.render() for m in _METRICS) + "\n"
+
+
+def observe_event(evt: dict):
+    """Update counters from one structured log event."""
+    t = evt.get("type")
+    if t == "invited":
+        INVITES.inc("live")
+    elif t == "invite_planned":
+        INVITES.inc("dry_run")
+    elif t == "favorited":
+        FAVORITES.inc("live")
+    elif t == "favorite_planned":
+        FAVORITES.inc("dry_run")
+    elif t in ("skip_already_invited", "skip_already_favorited"):
+        SKIPS.inc(t[len("skip_"):])
+    elif t == "confirm_summary":
+        CONFIRMS.inc(evt.get("method") or "unknown", "true" if evt.get("success") else "false")
+    elif t == "confirm_error":
+        CONFIRM_ERRORS.inc(evt.get("method") or "unknown")
+    elif t == "modal_missing":
+        MODAL_TIMEOUTS.inc("modal_missing")
+    elif t == "modal_no_action":
+        MODAL_TIMEOUTS.inc("no_action")
+    elif t == "page_skip_all_done":
+        PAGES_ALL_DONE.inc()
+    elif t == "page_scan_end":
+        PAGES.inc()
+        with _PAGE_LOCK:
+            _PAGE_TIMES.append(time.time())
+
+
+def observe_span(name: str, seconds: float, attrs: dict):
+    """Span listener (see tracing.add_listener): stage latencies plus toast-wait timeouts."""
+    STAGE_SECONDS.observe(seconds, name)
+    if name == "toast_wait" and attrs.get("status") == "timeout":
+        MODAL_TIMEOUTS.inc("toast_wait")
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?", 1)[0] not in ("/metrics", "/"):
+            self.send_error(404)
+            return
+        body = render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, fmt, *args):
+        pass
+
+
+_SERVER: Optional[ThreadingHTTPServer] = None
+
+
+def start_server(port: int = METRICS_PORT, host: str = METRICS_HOST) -> Optional[ThreadingHTTPServer]:
+    """Serve /metrics from a daemon thread. Returns None when port is 0 or the bind fails."""
+    global _SERVER
+    if _SERVER is not None or not port:
+        return _SERVER
+    try:
+        srv = ThreadingHTTPServer((host, int(port)), _Handler)
+        srv.daemon_threads = True
+    except Exception as e:
+        print(f"[warn] Metrics endpoint unavailable on {host}:{port}: {e}")
+        return None
+    threading.Thread(target=srv.serve_forever, name="metrics-http", daemon=True).start()
+    _SERVER = srv
+    print(f"[metrics] Serving http://{host}:{srv.server_address[1]}/metrics")
+    return srv
+
+
+def stop_server():
+    global _SERVER
+    if _SERVER is not None:
+        try:
+            _SERVER.shutdown()
+            _SERVER.server_close()
+        except Exception:
+            pass
+        _SERVER = None
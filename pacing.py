@@ -0,0 +1,115 @@
+import os
+import random
+import threading
+import time
+from typing import Optional
+from urllib.parse import urlparse
+
+# Adaptive pacing for the invite loop (AIMD: additive increase, multiplicative decrease).
+# One shared "speed" level in [0, 1] picks where each pause lands inside its configured
+# (min, max) range: 1.0 = the minimum, 0.0 = the maximum. The ranges stay hard limits.
+#   - every healthy signal (confirm with a quick toast) adds SPEED_STEP to the level;
+#   - every trouble signal (toast timeout, missing modal, HTTP 429/5xx) multiplies it by BACKOFF.
+#   VOICES_STATIC_PACING  1 = plain uniform pauses inside the ranges (--static-pacing in invite_all.py)
+#   VOICES_PACE_START     initial speed level (default 0.3)
+STATIC_PACING = os.environ.get("VOICES_STATIC_PACING", "0").lower() in {"1", "true", "yes", "on"}
+START_LEVEL = float(os.environ.get("VOICES_PACE_START", "0.3") or 0.3)
+SPEED_STEP = 0.05
+BACKOFF = 0.5
+FAST_TOAST_S = 2.5  # a toast slower than this is neither a success nor a failure
+SPREAD = 0.15  # random spread around the chosen pause, as a share of the range width
+FIRST_PARTY_SUFFIX = "voices.com"
+
+
+class PacingController:
+    def __init__(self, level: float = START_LEVEL, static: bool = STATIC_PACING):
+        self.level = min(1.0, max(0.0, level))
+        self.static = static
+        self.successes = 0
+        self.failures = 0
+        self.last_reason = ""
+        self._next_at = {}  # label -> monotonic time the last reserved pause ends
+        self._lock = threading.Lock()
+
+    def delay(self, a: float, b: float) -> float:
+        """A pause inside [a, b] for the current level (uniform when static)."""
+        lo, hi = min(a, b), max(a, b)
+        if self.static or hi <= lo:
+            return random.uniform(lo, hi)
+        width = hi - lo
+        center = hi - self.level * width
+        d = random.uniform(center - SPREAD * width, center + SPREAD * width)
+        return min(hi, max(lo, d))
+
+    def reserve(self, label: str, delay: float) -> float:
+        """Book a pause of delay seconds on label's shared timeline; returns how long to sleep.
+        With one caller this is just delay; concurrent callers (several tabs) queue up behind
+        each other, so the combined rate per label stays what one tab would do."""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_at.get(label, 0.0))
+            self._next_at[label] = start + delay
+            return start + delay - now
+
+    def success(self, reason: str = ""):
+        with self._lock:
+            self.successes += 1
+            self.level = min(1.0, self.level + SPEED_STEP)
+
+    def failure(self, reason: str = ""):
+        with self._lock:
+            self.failures += 1
+            self.last_reason = reason
+            self.level = max(0.0, self.level * BACKOFF)
+
+    def observe_toast(self, status: str, seconds: float):
+        if status == "toast_seen" and seconds <= FAST_TOAST_S:
+            self.success("toast")
+        elif status == "timeout":
+            self.failure("toast_timeout")
+
+    def observe_event(self, evt: dict):
+        """Trouble signals from structured log events (see invite_all.log_event)."""
+        t = evt.get("type")
+        if t in ("modal_missing", "modal_no_action"):
+            self.failure(t)
+        elif t == "confirm_summary" and not evt.get("success"):
+            self.failure("confirm_failed")
+
+    def observe_response(self, response):
+        """page.on("response") hook: first-party 429 and 5xx mean slow down."""
+        try:
+            status = response.status
+            if status != 429 and status < 500:
+                return
+            host = urlparse(response.url).hostname or ""
+            if host == FIRST_PARTY_SUFFIX or host.endswith("." + FIRST_PARTY_SUFFIX):
+                self.failure(f"http_{status}")
+        except Exception:
+            pass
+
+    def snapshot(self) -> dict:
+        return {"level": round(self.level, 3), "successes": self.successes, "failures": self.failures,
+                "last_failure": self.last_reason or None, "static": self.static}
+
+
+_PACER: Optional[PacingController] = None
+
+
+def get_pacer() -> PacingController:
+    global _PACER
+    if _PACER is None:
+        _PACER = PacingController()
+    return _PACER
+
+
+def set_static(static: bool):
+    get_pacer().static = bool(static)
+
+
+def watch_page(page):
+    """Feed a page's HTTP responses into the shared controller."""
+    try:
+        page.on("response", get_pacer().observe_response)
+    except Exception:
+        pass
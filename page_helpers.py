@@ -0,0 +1,96 @@
+from pathlib import Path
+from typing import Optional
+
+# Loader for voices_helpers.js, the in-page helper runtime (window.__voicesHelpers).
+# install_helpers() registers it as an init script so every document gets it before any
+# site script runs; helper_call()/helper_handle() fall back to evaluating the bundle on
+# pages that were already open (e.g. a CDP-attached tab) and retry once.
+HELPERS_VERSION = 4  # keep in sync with VERSION in voices_helpers.js
+_JS_PATH = Path(__file__).with_name("voices_helpers.js")
+_SOURCE: Optional[str] = None
+
+_CALL_JS = "([op, args]) => window.__voicesHelpers[op](...args)"
+_VERSION_JS = "() => (window.__voicesHelpers && window.__voicesHelpers.version) || 0"
+
+
+def helpers_source() -> str:
+    global _SOURCE
+    if _SOURCE is None:
+        _SOURCE = _JS_PATH.read_text(encoding="utf-8")
+    return _SOURCE
+
+
+async def install_helpers(context) -> bool:
+    """Register the bundle on the browser context (covers all current and future pages)."""
+    try:
+        await context.add_init_script(script=helpers_source())
+        return True
+    except Exception as e:
+        print(f"[warn] Could not install page helpers: {e}")
+        return False
+
+
+async def ensure_helpers(page) -> bool:
+    """Make sure this page has the current bundle (evaluate it in place if not)."""
+    try:
+        if int(await page.evaluate(_VERSION_JS) or 0) >= HELPERS_VERSION:
+            return True
+        # Evaluated rather than injected as a <script> tag, so the site's CSP does not apply;
+        # an older copy is replaced because the bundle only skips itself for >= VERSION
+        await page.evaluate(helpers_source())
+        return True
+    except Exception:
+        return False
+
+
+async def helper_call(page, op: str, *args):
+    """Run window.__voicesHelpers[op](*args) in one evaluate and return its JSON result."""
+    try:
+        return await page.evaluate(_CALL_JS, [op, list(args)])
+    except Exception:
+        if not await ensure_helpers(page):
+            raise
+        return await page.evaluate(_CALL_JS, [op, list(args)])
+
+
+async def helper_handle(page, op: str, *args):
+    """Like helper_call for ops that return an element; gives an ElementHandle or None."""
+    try:
+        h = await page.evaluate_handle(_CALL_JS, [op, list(args)])
+    except Exception:
+        if not await ensure_helpers(page):
+            return None
+        try:
+            h = await page.evaluate_handle(_CALL_JS, [op, list(args)])
+        except Exception:
+            return None
+    el = h.as_element()
+    if el is None:
+        try:
+            await h.dispose()
+        except Exception:
+            pass
+    return el
+
+
+async def wait_ready(page, item_sel: str, modal_sel: str = "", row_sel: str = "", stable_ms: int = 400,
+                     empty_ms: int = 2500, max_ms: int = 15000) -> str:
+    """Wait until the page is usable instead of for network silence (see waitReady in the bundle).
+    Returns "cards", "modal", "empty" or "timeout"; "error" if the check could not run at all."""
+    for _ in range(2):
+        try:
+            # A navigation that is still committing tears down the evaluate; wait for the DOM first
+            await page.wait_for_load_state("domcontentloaded")
+            res = await helper_call(page, "waitReady", item_sel, modal_sel, row_sel, stable_ms, empty_ms, max_ms)
+            return (res or {}).get("state") or "timeout"
+        except Exception:
+            continue
+    return "error"
+
+
+async def mark_stale(page, item_sel: str) -> int:
+    """Tag the current items so the next wait_ready only counts ones rendered after this call."""
+    try:
+        return int(await helper_call(page, "markStale", item_sel) or 0)
+    except Exception:
+        return 0
@@ -0,0 +1,112 @@
+import math
+import time
+from typing import List, Optional, Tuple
+from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
+
+# Up-front page plan for a talent search: read the result count once, then visit every
+# page directly by its offset URL instead of clicking "Next" and waiting each time.
+# Knowing the page count up front also gives progress/ETA and lets a run start anywhere.
+
+
+def offset_url(url: str, offset: int) -> str:
+    """url with its offset query parameter set (other parameters kept as they are)."""
+    u = urlparse(url)
+    q = parse_qs(u.query, keep_blank_values=True)
+    q["offset"] = [str(int(offset))]
+    return urlunparse((u.scheme, u.netloc, u.path, u.params, urlencode(q, doseq=True), u.fragment))
+
+
+def url_offset(url: str) -> int:
+    try:
+        return int(parse_qs(urlparse(url).query).get("offset", ["0"])[0] or 0)
+    except ValueError:
+        return 0
+
+
+def _fmt_duration(seconds: float) -> str:
+    seconds = int(max(0, seconds))
+    h, rem = divmod(seconds, 3600)
+    m, s = divmod(rem, 60)
+    return f"{h}h{m:02d}m" if h else f"{m}m{s:02d}s"
+
+
+def parse_shard(spec: str) -> Optional[Tuple[int, int]]:
+    """"2/4" -> (2, 4): this worker takes every 4th page, starting with the 2nd."""
+    try:
+        i, n = (int(x) for x in str(spec).split("/", 1))
+    except ValueError:
+        raise ValueError(f"shard must look like I/N (e.g. 2/4), got {spec!r}")
+    if n < 1 or not 1 <= i <= n:
+        raise ValueError(f"shard {spec!r} out of range")
+    return (i, n) if n > 1 else None
+
+
+class PagePlan:
+    """Every offset URL of a search, from page start_page (1-based) to the last page.
+    With shard=(i, n) only pages p with (p - 1) % n == i - 1 belong to this plan."""
+
+    def __init__(self, base_url: str, page_count: int, per_page: int, start_page: int = 1,
+                 total_results: Optional[int] = None, shard: Optional[Tuple[int, int]] = None):
+        self.shard = shard
+        self.base_url = base_url
+        self.per_page = per_page
+        self.page_count = max(1, int(page_count))
+        self.start_page = min(max(1, int(start_page)), self.page_count)
+        self.total_results = total_results
+        self.started = time.time()
+        self.pages_done = 0
+
+    @classmethod
+    def from_counts(cls, base_url: str, per_page: int, total_results: Optional[int] = None,
+                    last_page: Optional[int] = None, start_page: int = 1,
+                    shard: Optional[Tuple[int, int]] = None) -> Optional["PagePlan"]:
+        """Build a plan from the result count (preferred) or the last pagination number."""
+        if total_results:
+            pages = math.ceil(int(total_results) / per_page)
+        elif last_page:
+            pages = int(last_page)
+        else:
+            return None
+        return cls(base_url, pages, per_page, start_page, total_results, shard) if pages > 0 else None
+
+    def url_for(self, page_num: int) -> str:
+        return offset_url(self.base_url, (page_num - 1) * self.per_page)
+
+    def page_numbers(self) -> List[int]:
+        pages = range(self.start_page, self.page_count + 1)
+        if self.shard:
+            i, n = self.shard
+            return [p for p in pages if (p - 1) % n == i - 1]
+        return list(pages)
+
+    def next_after(self, page_num: int) -> Optional[int]:
+        """The plan's next page after page_num (None when page_num was its last)."""
+        return next((p for p in self.page_numbers() if p > page_num), None)
+
+    def mark_done(self):
+        self.pages_done += 1
+
+    def progress(self, page_num: int) -> dict:
+        """Progress after finishing page_num, with an ETA from the average page time so far.
+        Counts finished pages of this plan (start page and shard applied) rather than trusting
+        page_num, since tabs may finish out of order."""
+        planned = max(1, len(self.page_numbers()))
+        completed = min(planned, self.pages_done)
+        remaining = planned - completed
+        elapsed = time.time() - self.started
+        per_page_s = elapsed / self.pages_done if self.pages_done else 0.0
+        return {
+            "page": page_num,
+            "pages": self.page_count,
+            "percent": round(100.0 * completed / planned, 1),
+            "remaining_pages": remaining,
+            "seconds_per_page": round(per_page_s, 2),
+            "eta_s": round(per_page_s * remaining, 1) if self.pages_done else None,
+        }
+
+    def progress_line(self, page_num: int) -> str:
+        p = self.progress(page_num)
+        width = 24
+        filled = int(width * p["percent"] / 100)
+        eta = _fmt_duration(p["eta_s"]) if p["eta_s"] is not None else "?"
+        return f"[{'#' * filled}{'.' * (width - filled)}] page {page_num}/{self.page_count} ({p['percent']}%) ETA {eta}"
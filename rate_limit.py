@@ -0,0 +1,154 @@
+import asyncio
+import json
+import os
+import re
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional
+
+# Token bucket shared by every worker process driving the same Voices account, so running
+# several inviter processes side by side stays under one combined ceiling.
+# The bucket lives in a small JSON file next to a lock file; each draw takes an exclusive
+# OS file lock (fcntl on POSIX, msvcrt on Windows), refills by elapsed time and takes a token.
+#   VOICES_RATE_PER_MIN  committing actions per minute across all workers (default 0 = unlimited)
+#   VOICES_RATE_BURST    bucket size, i.e. actions allowed back to back (default 1)
+#   VOICES_RATE_DIR      directory holding the bucket files (default: the system temp dir)
+#   VOICES_ACCOUNT       bucket key (default VOICES_EMAIL, else "default")
+RATE_PER_MIN = float(os.environ.get("VOICES_RATE_PER_MIN", "0") or 0)
+RATE_BURST = max(1.0, float(os.environ.get("VOICES_RATE_BURST", "1") or 1))
+RATE_DIR = os.environ.get("VOICES_RATE_DIR", "").strip() or tempfile.gettempdir()
+MAX_WAIT_STEP = 5.0  # re-check at least this often while waiting for a token
+
+try:
+    import fcntl  # type: ignore
+except ImportError:  # Windows
+    fcntl = None  # type: ignore
+try:
+    import msvcrt  # type: ignore
+except ImportError:
+    msvcrt = None  # type: ignore
+
+
+def account_key() -> str:
+    return (os.environ.get("VOICES_ACCOUNT") or os.environ.get("VOICES_EMAIL") or "default").strip().lower()
+
+
+class _FileLock:
+    """Exclusive lock on a sidecar file, held for one read-modify-write of the bucket."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._fh = None
+
+    def __enter__(self):
+        self._fh = open(self.path, "a+b")
+        if fcntl is not None:
+            fcntl.flock(self._fh.fileno(), fcntl.LOCK_EX)
+        elif msvcrt is not None:
+            self._fh.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(self._fh.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue  # LK_LOCK gives up after ~10s; keep waiting
+        return self
+
+    def __exit__(self, *exc):
+        try:
+            if fcntl is not None:
+                fcntl.flock(self._fh.fileno(), fcntl.LOCK_UN)
+            elif msvcrt is not None:
+                self._fh.seek(0)
+                msvcrt.locking(self._fh.fileno(), msvcrt.LK_UNLCK, 1)
+        finally:
+            self._fh.close()
+            self._fh = None
+
+
+class SharedTokenBucket:
+    def __init__(self, account: str, per_min: float = RATE_PER_MIN, burst: float = RATE_BURST,
+                 directory: str = RATE_DIR):
+        slug = re.sub(r"[^a-z0-9._-]+", "_", account.lower()) or "default"
+        # Names are built whole: with_suffix() would eat the slug's last dotted part ("gmail.com")
+        base = f"voices_rate_{slug}"
+        self.state_path = Path(directory) / f"{base}.json"
+        self.lock_path = Path(directory) / f"{base}.lock"
+        self.tmp_path = Path(directory) / f"{base}.tmp"
+        self.per_min = float(per_min)
+        self.burst = max(1.0, float(burst))
+
+    @property
+    def enabled(self) -> bool:
+        return self.per_min > 0
+
+    def try_take(self, n: float = 1.0) -> float:
+        """Take n tokens if available. Returns 0.0 on success, else the seconds until they will be."""
+        if not self.enabled:
+            return 0.0
+        rate = self.per_min / 60.0
+        with _FileLock(self.lock_path):
+            now = time.time()
+            try:
+                state = json.loads(self.state_path.read_text(encoding="utf-8"))
+                tokens = float(state.get("tokens", self.burst))
+                updated = float(state.get("updated", now))
+            except Exception:
+                tokens, updated = self.burst, now
+            tokens = min(self.burst, tokens + max(0.0, now - updated) * rate)
+            wait = 0.0
+            if tokens >= n:
+                tokens -= n
+            else:
+                wait = (n - tokens) / rate
+            self.tmp_path.write_text(json.dumps({"tokens": tokens, "updated": now, "per_min": self.per_min}),
+                                     encoding="utf-8")
+            os.replace(self.tmp_path, self.state_path)
+        return wait
+
+    async def acquire(self, n: float = 1.0) -> float:
+        """Wait (without blocking the event loop) until n tokens are taken; returns seconds waited."""
+        t0 = time.monotonic()
+        while True:
+            try:
+                wait = await asyncio.to_thread(self.try_take, n)
+            except Exception as e:
+                # A broken bucket file must never stop the run; fall back to no shared limit
+                print(f"[warn] Shared rate limiter unavailable ({self.state_path}): {e}")
+                return time.monotonic() - t0
+            if wait <= 0:
+                return time.monotonic() - t0
+            await asyncio.sleep(min(wait, MAX_WAIT_STEP))
+
+
+_BUCKET: Optional[SharedTokenBucket] = None
+
+
+def configure(per_min: Optional[float] = None, burst: Optional[float] = None,
+              account: Optional[str] = None) -> SharedTokenBucket:
+    """(Re)create the process-wide bucket; None keeps the env/default value."""
+    global _BUCKET
+    _BUCKET = SharedTokenBucket(
+        account or account_key(),
+        RATE_PER_MIN if per_min is None else per_min,
+        RATE_BURST if burst is None else burst,
+    )
+    return _BUCKET
+
+
+def get_bucket() -> SharedTokenBucket:
+    if _BUCKET is None:
+        return configure()
+    return _BUCKET
+
+
+async def acquire(kind: str = "action") -> float:
+    """Draw one token for a committing action (invite confirm, heart click, message)."""
+    b = get_bucket()
+    if not b.enabled:
+        return 0.0
+    waited = await b.acquire()
+    if waited >= 0.05:
+        print(f"[rate] {kind}: waited {waited:.2f}s for the shared {b.per_min:g}/min budget")
+    return waited
@@ -0,0 +1,352 @@
+import argparse
+import json
+import math
+import os
+import re
+from typing import Dict, Optional
+
+from event_log import iter_events
+
+# Summarise a run from the JSONL event log (invite_all.py / invite_simple.py) in a single
+# streaming pass: per-page throughput, per-stage latency percentiles and how much wall
+# time went to jitter versus real browser work. Memory stays constant however big the log.
+#
+#   python run_stats.py invites_log.jsonl
+#   python run_stats.py --cards --no-pages            # per-card timelines instead of pages
+#   python run_stats.py --json > summary.json
+
+DEFAULT_LOG = os.environ.get("VOICES_LOG_FILE", "").strip() or "invites_log.jsonl"
+# Gaps between consecutive events longer than this are idle time between runs, not work
+IDLE_GAP = float(os.environ.get("VOICES_STATS_IDLE_GAP", 300))
+
+# Which stage of the card flow the time *after* each event belongs to
+STAGE_OF = {
+    "head_btn_click_attempt": "open_menu",
+    "fallback_invite_buttons": "open_menu",
+    "invite_open": "open_menu",
+    "modal_detected": "pick_job",
+    "job_selection_plan": "pick_job",
+    "job_select": "pick_job",
+    "invite_select": "pick_job",
+    "modal_no_action": "pick_job",
+    "modal_missing": "pick_job",
+    "favorites_scan_start": "pick_list",
+    "favorites_pick_attempt": "pick_list",
+    "about_to_confirm": "confirm_click",
+    "confirm_attempt": "confirm_click",
+    "confirm_error": "confirm_click",
+    "confirm_clicked": "result_wait",
+    "confirm_summary": "result_wait",
+    "page_scan_end": "navigate",
+    "page_skip_all_done": "navigate",
+    "start": "navigate",
+}
+STAGE_PREFIXES = (("choices_", "pick_job"), ("job_choice_", "pick_job"), ("job_selected_", "pick_job"))
+DEFAULT_STAGE = "card_scan"
+
+# Events that close a card's timeline, with the outcome they record
+CARD_END = {
+    "invited": "invited",
+    "invite_planned": "planned",
+    "favorited": "favorited",
+    "skip_already_invited": "skipped",
+    "skip_already_favorited": "skipped",
+    "invite_open_failed": "failed",
+}
+
+
+def stage_of(evt_type: str) -> str:
+    st = STAGE_OF.get(evt_type)
+    if st:
+        return st
+    for prefix, st in STAGE_PREFIXES:
+        if evt_type.startswith(prefix):
+            return st
+    return DEFAULT_STAGE
+
+
+class LogHistogram:
+    """Latency histogram with log-spaced buckets: fixed memory, ~2% relative error."""
+
+    def __init__(self, growth: float = 1.04, floor: float = 1e-4):
+        self.growth = growth
+        self.floor = floor
+        self._lg = math.log(growth)
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def add(self, v: float):
+        v = max(0.0, float(v))
+        idx = 0 if v <= self.floor else int(math.log(v / self.floor) / self._lg) + 1
+        self.counts[idx] = self.counts.get(idx, 0) + 1
+        self.count += 1
+        self.total += v
+        self.min = min(self.min, v)
+        self.max = max(self.max, v)
+
+    def quantile(self, q: float) -> Optional[float]:
+        if not self.count:
+            return None
+        rank = q * (self.count - 1)
+        seen = 0
+        for idx in sorted(self.counts):
+            seen += self.counts[idx]
+            if seen > rank:
+                if idx == 0:
+                    return self.min
+                # Geometric middle of the bucket, clamped to what was actually observed
+                mid = self.floor * self.growth ** (idx - 0.5)
+                return min(max(mid, self.min), self.max)
+        return self.max
+
+    def summary(self) -> dict:
+        return {
+            "count": self.count,
+            "mean": (self.total / self.count) if self.count else None,
+            "p50": self.quantile(0.50),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+            "max": self.max if self.count else None,
+        }
+
+
+def _page_label(url: str) -> str:
+    m = re.search(r"[?&]offset=(\d+)", url or "")
+    return f"offset={m.group(1)}" if m else (url or "?")
+
+
+class RunStats:
+    """Fold events one at a time; only the current page and card are kept in memory."""
+
+    def __init__(self, idle_gap: float = IDLE_GAP, on_page=None, on_card=None):
+        self.idle_gap = idle_gap
+        self.on_page = on_page
+        self.on_card = on_card
+        self.stages: Dict[str, LogHistogram] = {}
+        self.jitter_by_label: Dict[str, float] = {}
+        self.outcomes: Dict[str, int] = {}
+        self.card_hist = LogHistogram()
+        self.page_hist = LogHistogram()
+        self.events = 0
+        self.runs = 0
+        self.wall = 0.0
+        self.jitter = 0.0
+        self.pages = 0
+        self.invites = 0
+        self._last_ts: Optional[float] = None
+        self._stage = "navigate"
+        self._stage_time = 0.0
+        self._pending_jitter = 0.0
+        self._page = None
+        self._card = None
+
+    # -- helpers --------------------------------------------------------------
+    def _hist(self, name: str) -> LogHistogram:
+        h = self.stages.get(name)
+        if h is None:
+            h = self.stages[name] = LogHistogram()
+        return h
+
+    def _close_stage(self):
+        if self._stage_time > 0:
+            self._hist(self._stage).add(self._stage_time)
+        self._stage_time = 0.0
+
+    def _new_page(self, ts: float, url: str = ""):
+        self._page = {"start": ts, "url": url, "cards": 0, "invited": 0, "jitter": 0.0, "skipped": False}
+
+    def _new_card(self, ts: float):
+        self._card = {"start": ts, "steps": [], "jitter": 0.0}
+
+    def _account(self, dt: float):
+        """Split the gap since the previous event into jitter and browser work."""
+        jit = min(dt, self._pending_jitter)
+        self._pending_jitter = 0.0
+        work = dt - jit
+        self.wall += dt
+        self.jitter += jit
+        self._stage_time += work
+        if self._page is not None:
+            self._page["jitter"] += jit
+        if self._card is not None:
+            self._card["jitter"] += jit
+            if work > 0:
+                steps = self._card["steps"]
+                if steps and steps[-1][0] == self._stage:
+                    steps[-1][1] += work
+                elif len(steps) < 64:
+                    steps.append([self._stage, work])
+
+    def _end_page(self, ts: float, evt: dict):
+        page = self._page or {"start": ts, "url": "", "cards": 0, "invited": 0, "jitter": 0.0, "skipped": False}
+        url = evt.get("url") or page["url"]
+        dur = max(0.0, ts - page["start"])
+        self.pages += 1
+        self.page_hist.add(dur)
+        row = {
+            "page": _page_label(url),
+            "url": url,
+            "cards": page["cards"],
+            "invited": int(evt.get("count") or page["invited"]),
+            "skipped_all_done": bool(page["skipped"]),
+            "seconds": round(dur, 3),
+            "invites_per_min": round(60.0 * int(evt.get("count") or page["invited"]) / dur, 2) if dur > 0 else None,
+            "jitter_share": round(page["jitter"] / dur, 3) if dur > 0 else None,
+        }
+        if self.on_page:
+            self.on_page(row)
+        self._new_page(ts)
+        self._card = None
+
+    def _end_card(self, ts: float, outcome: str, evt: dict):
+        card = self._card or {"start": ts, "steps": [], "jitter": 0.0}
+        dur = max(0.0, ts - card["start"])
+        self.outcomes[outcome] = self.outcomes.get(outcome, 0) + 1
+        if outcome in ("invited", "favorited", "planned"):
+            self.card_hist.add(dur)
+        if self._page is not None:
+            self._page["cards"] += 1
+            if outcome == "invited":
+                self._page["invited"] += 1
+        if outcome == "invited":
+            self.invites += 1
+        if self.on_card:
+            self.on_card({
+                "talent_id": evt.get("talent_id") or evt.get("idx"),
+                "outcome": outcome,
+                "seconds": round(dur, 3),
+                "jitter": round(card["jitter"], 3),
+                "stages": [[name, round(t, 3)] for name, t in card["steps"]],
+            })
+        self._new_card(ts)
+
+    # -- main entry point -----------------------------------------------------
+    def feed(self, evt: dict):
+        ts = evt.get("ts")
+        etype = str(evt.get("type") or "")
+        if not isinstance(ts, (int, float)) or not etype:
+            return
+        self.events += 1
+        if self._last_ts is None or ts - self._last_ts > self.idle_gap or ts < self._last_ts:
+            # New run (or clock jump): nothing between the two events counts as work
+            self.runs += 1
+            self._close_stage()
+            self._pending_jitter = 0.0
+            self._new_page(ts)
+            self._card = None
+        else:
+            self._account(ts - self._last_ts)
+        self._last_ts = ts
+
+        if etype == "delay":
+            # Logged right before the sleep; the stage around it carries on afterwards
+            d = float(evt.get("delay") or 0.0)
+            self._pending_jitter += d
+            label = str(evt.get("label") or "pause")
+            self.jitter_by_label[label] = self.jitter_by_label.get(label, 0.0) + d
+            self._hist("jitter").add(d)
+            return
+
+        if etype in ("page_scan_start", "cards_detected", "start"):
+            if self._page is not None and etype != "cards_detected":
+                self._page["url"] = evt.get("url") or self._page["url"]
+            self._new_card(ts)
+        elif self._card is None and etype in ("head_btn_click_attempt", "invite_open", "fallback_invite_buttons"):
+            self._new_card(ts)
+
+        if etype in CARD_END:
+            self._end_card(ts, CARD_END[etype], evt)
+        elif etype == "invite_confirm":
+            self._end_card(ts, "invited" if evt.get("confirmed") else "failed", evt)
+
+        new_stage = stage_of(etype)
+        if etype in CARD_END or etype == "invite_confirm":
+            new_stage = DEFAULT_STAGE
+        if new_stage != self._stage:
+            self._close_stage()
+            self._stage = new_stage
+
+        # page_skip_all_done is always followed by its own page_scan_end; count the page once
+        if etype == "page_skip_all_done" and self._page is not None:
+            self._page["skipped"] = True
+        elif etype == "page_scan_end":
+            self._end_page(ts, evt)
+
+    def finish(self) -> dict:
+        self._close_stage()
+        work = max(0.0, self.wall - self.jitter)
+        return {
+            "events": self.events,
+            "runs": self.runs,
+            "pages": self.pages,
+            "invites": self.invites,
+            "outcomes": dict(sorted(self.outcomes.items())),
+            "wall_seconds": round(self.wall, 3),
+            "jitter_seconds": round(self.jitter, 3),
+            "work_seconds": round(work, 3),
+            "jitter_share": round(self.jitter / self.wall, 4) if self.wall else None,
+            "invites_per_hour": round(3600.0 * self.invites / self.wall, 2) if self.wall else None,
+            "jitter_by_label": {k: round(v, 3) for k, v in sorted(self.jitter_by_label.items(), key=lambda kv: -kv[1])},
+            "page_seconds": self.page_hist.summary(),
+            "card_seconds": self.card_hist.summary(),
+            "stages": {k: h.summary() for k, h in sorted(self.stages.items())},
+        }
+
+
+def _fmt(v) -> str:
+    if v is None:
+        return "-"
+    return f"{v:.3f}" if isinstance(v, float) else str(v)
+
+
+def print_report(s: dict):
+    print()
+    print(f"events={s['events']} runs={s['runs']} pages={s['pages']} invites={s['invites']} outcomes={s['outcomes']}")
+    wall = s["wall_seconds"] or 0.0
+    print(f"wall={wall:.1f}s work={s['work_seconds']:.1f}s jitter={s['jitter_seconds']:.1f}s "
+          f"jitter_share={_fmt(s['jitter_share'])} invites/hour={_fmt(s['invites_per_hour'])}")
+    if s["jitter_by_label"]:
+        print("jitter by label: " + ", ".join(f"{k}={v:.1f}s" for k, v in s["jitter_by_label"].items()))
+    print()
+    print(f"{'stage':<14}{'count':>8}{'mean':>10}{'p50':>10}{'p95':>10}{'p99':>10}{'max':>10}")
+    rows = [("page", s["page_seconds"]), ("card", s["card_seconds"])] + list(s["stages"].items())
+    for name, h in rows:
+        if not h["count"]:
+            continue
+        print(f"{name:<14}{h['count']:>8}" + "".join(f"{_fmt(h[k]):>10}" for k in ("mean", "p50", "p95", "p99", "max")))
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="Stream a Voices JSONL event log and report run throughput and latency.")
+    ap.add_argument("log", nargs="?", default=DEFAULT_LOG, help="Event log path (default: VOICES_LOG_FILE or invites_log.jsonl)")
+    ap.add_argument("--no-rotated", action="store_true", help="Read only the live file, not its rotated .gz segments")
+    ap.add_argument("--no-pages", action="store_true", help="Don't print a line per page")
+    ap.add_argument("--cards", action="store_true", help="Print each card's reconstructed timeline")
+    ap.add_argument("--idle-gap", type=float, default=IDLE_GAP, help="Seconds of silence that start a new run (default 300)")
+    ap.add_argument("--json", action="store_true", help="Print the summary as JSON instead of a table")
+    args = ap.parse_args()
+
+    def _page_line(row):
+        print(f"[page] {row['page']}: invited={row['invited']} cards={row['cards']} {row['seconds']:.1f}s "
+              f"inv/min={_fmt(row['invites_per_min'])} jitter_share={_fmt(row['jitter_share'])}"
+              + (" (all done)" if row["skipped_all_done"] else ""))
+
+    def _card_line(row):
+        steps = " ".join(f"{n}={t:.2f}" for n, t in row["stages"])
+        print(f"[card] {row['talent_id']} {row['outcome']} {row['seconds']:.2f}s jitter={row['jitter']:.2f}s {steps}")
+
+    stats = RunStats(
+        idle_gap=args.idle_gap,
+        on_page=None if (args.no_pages or args.json) else _page_line,
+        on_card=_card_line if (args.cards and not args.json) else None,
+    )
+    for evt in iter_events(args.log, include_rotated=not args.no_rotated):
+        stats.feed(evt)
+    summary = stats.finish()
+    if args.json:
+        print(json.dumps(summary, indent=2))
+    else:
+        print_report(summary)
@@ -0,0 +1,211 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import List, Optional
+
+from invite_ledger import LEDGER_DB, Ledger
+
+# Runs several invite_all.py worker processes at once, one per browser, so a long search
+# uses every core instead of a single renderer. Each browser is either a Chrome already
+# listening on a DevTools port (--cdp) or a persistent profile launched by the worker
+# (--profiles). Every search URL is split into interleaved page shards, one per browser
+# (invite_all --shard i/n). Workers keep private checkpoints and invited-ID files but all
+# record into the shared SQLite ledger, which is what keeps them from inviting a talent
+# twice. A worker that dies is restarted from its last checkpointed page.
+INVITE_SCRIPT = Path(__file__).with_name("invite_all.py")
+RESTART_BACKOFF = 5.0  # seconds, multiplied by the restart count
+POLL_INTERVAL = 1.0
+
+
+def _split(values: Optional[List[str]]) -> List[str]:
+    out = []
+    for v in values or []:
+        out.extend(x.strip() for x in v.split(",") if x.strip())
+    return out
+
+
+def _cdp_targets(values: Optional[List[str]]) -> List[str]:
+    """Endpoints from "http://host:9222", "9222" or a port range "9222-9225"."""
+    out = []
+    for v in _split(values):
+        if v.isdigit() or (v.count("-") == 1 and all(p.isdigit() for p in v.split("-"))):
+            lo, _, hi = v.partition("-")
+            out.extend(f"http://127.0.0.1:{p}" for p in range(int(lo), int(hi or lo) + 1))
+        else:
+            out.append(v)
+    return out
+
+
+class Worker:
+    """One browser slot working through its (search URL, shard) assignments in order."""
+
+    def __init__(self, index: int, count: int, target: dict, urls: List[str], run_dir: Path,
+                 extra_args: List[str], max_restarts: int):
+        self.index = index  # 1-based, also the shard index
+        self.count = count
+        self.target = target
+        self.urls = list(urls)
+        self.run_dir = run_dir
+        self.extra_args = extra_args
+        self.max_restarts = max_restarts
+        self.url_pos = 0
+        self.restarts = 0
+        self.proc: Optional[subprocess.Popen] = None
+        self.out = None
+        self.next_start = 0.0
+        self.finished = False
+        self.failed = False
+
+    @property
+    def name(self) -> str:
+        return f"w{self.index}"
+
+    def _file(self, suffix: str) -> str:
+        return str(self.run_dir / f"{self.name}_u{self.url_pos + 1}{suffix}")
+
+    def _resume_page(self) -> Optional[int]:
+        try:
+            return int(json.loads(Path(self._file(".checkpoint.json")).read_text()).get("page_num") or 0) or None
+        except Exception:
+            return None
+
+    def command(self) -> List[str]:
+        cmd = [sys.executable, str(INVITE_SCRIPT),
+               "--start-url", self.urls[self.url_pos],
+               "--shard", f"{self.index}/{self.count}",
+               "--checkpoint", self._file(".checkpoint.json"),
+               "--invited-db", str(self.run_dir / f"{self.name}.invited.json"),
+               "--log-file", self._file(".jsonl")]
+        page = self._resume_page()
+        if page:
+            cmd += ["--start-page", str(page)]
+        if self.target.get("cdp"):
+            cmd += ["--cdp-url", self.target["cdp"], "--require-cdp"]
+        else:
+            cmd += ["--no-cdp", "--profile-dir", self.target["profile"]]
+        return cmd + self.extra_args
+
+    def env(self) -> dict:
+        """Worker environment: profile slots launch their own browser, so REQUIRE_CDP
+        (on by default in invite_all.py) is switched off for them."""
+        env = dict(os.environ)
+        if not self.target.get("cdp"):
+            env["REQUIRE_CDP"] = "0"
+        return env
+
+    def start(self):
+        cmd = self.command()
+        self.out = open(self.run_dir / f"{self.name}.out.log", "a", encoding="utf-8")
+        self.out.write(f"\n=== {time.strftime('%Y-%m-%d %H:%M:%S')} {' '.join(cmd)}\n")
+        self.out.flush()
+        self.proc = subprocess.Popen(cmd, stdout=self.out, stderr=subprocess.STDOUT,
+                                     cwd=str(INVITE_SCRIPT.parent), env=self.env())
+        print(f"[{self.name}] started pid {self.proc.pid}: {self.urls[self.url_pos]} shard {self.index}/{self.count}"
+              f" on {self.target.get('cdp') or self.target.get('profile')}")
+
+    def poll(self):
+        """Advance this slot: start, notice exits, restart or move to the next URL."""
+        if self.finished:
+            return
+        if self.proc is None:
+            if time.time() >= self.next_start:
+                self.start()
+            return
+        code = self.proc.poll()
+        if code is None:
+            return
+        self.proc = None
+        self.out.close()
+        if code == 0:
+            print(f"[{self.name}] finished {self.urls[self.url_pos]}")
+            self.url_pos += 1
+            self.restarts = 0
+            self.finished = self.url_pos >= len(self.urls)
+            return
+        if self.restarts >= self.max_restarts:
+            print(f"[{self.name}] exit code {code}; gave up after {self.restarts} restarts (see {self.name}.out.log)")
+            self.failed = True
+            self.finished = True
+            return
+        self.restarts += 1
+        self.next_start = time.time() + RESTART_BACKOFF * self.restarts
+        print(f"[{self.name}] exit code {code}; restart {self.restarts}/{self.max_restarts} "
+              f"in {RESTART_BACKOFF * self.restarts:.0f}s from page {self._resume_page() or 'start'}")
+
+    def stop(self):
+        if self.proc is not None and self.proc.poll() is None:
+            self.proc.terminate()
+            try:
+                self.proc.wait(timeout=15)
+            except subprocess.TimeoutExpired:
+                self.proc.kill()
+
+
+def run(workers: List[Worker], ledger_path: str = "") -> int:
+    started = time.time()
+    try:
+        while not all(w.finished for w in workers):
+            for w in workers:
+                w.poll()
+            time.sleep(POLL_INTERVAL)
+    except KeyboardInterrupt:
+        print("[supervisor] Stopping workers...")
+        for w in workers:
+            w.stop()
+        return 130
+    if ledger_path and Path(ledger_path).exists():
+        led = Ledger(ledger_path)
+        try:
+            for (action, job), n in sorted(led.counts_since(started).items()):
+                print(f"[supervisor] ledger: {n} x {action}{' for job ' + job if job else ''} this run")
+        finally:
+            led.close()
+    failed = [w.name for w in workers if w.failed]
+    if failed:
+        print(f"[supervisor] Workers that gave up: {', '.join(failed)}")
+    return 1 if failed else 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    argv = list(sys.argv[1:] if argv is None else argv)
+    extra = []
+    if "--" in argv:
+        i = argv.index("--")
+        argv, extra = argv[:i], argv[i + 1:]
+    ap = argparse.ArgumentParser(
+        description="Run invite_all.py across several browsers (CDP endpoints and/or profiles). "
+                    "Arguments after -- go to every worker (e.g. -- --job-id 818318 --block-assets).")
+    ap.add_argument("--cdp", action="append",
+                    help="DevTools endpoints: URLs, ports or a port range, comma-separated (e.g. 9222-9225)")
+    ap.add_argument("--profiles", action="append",
+                    help="Chrome profile dirs, comma-separated; each gets its own launched browser")
+    ap.add_argument("--urls", action="append",
+                    help="Search URLs to work through, comma-separated (default VOICES_START_URL / invite_all's START_URL)")
+    ap.add_argument("--run-dir", default="voices_workers", help="Directory for worker checkpoints, ID files and logs")
+    ap.add_argument("--max-restarts", type=int, default=3, help="Restarts per assignment before a worker gives up")
+    args = ap.parse_args(argv)
+
+    # Workers run from the script directory, so every path handed to them is made absolute
+    targets = [{"cdp": u} for u in _cdp_targets(args.cdp)] + [
+        {"profile": str(Path(p).expanduser().resolve())} for p in _split(args.profiles)]
+    if not targets:
+        ap.error("give at least one --cdp endpoint or --profiles dir")
+    urls = _split(args.urls) or [os.environ.get(
+        "VOICES_START_URL", "https://www.voices.com/talents/search?keywords=&language_ids=1")]
+    run_dir = Path(args.run_dir).expanduser().resolve()
+    run_dir.mkdir(parents=True, exist_ok=True)
+    ledger_path = os.environ.get("VOICES_LEDGER_DB", LEDGER_DB).strip()
+    if ledger_path:
+        ledger_path = str(Path(ledger_path).expanduser().resolve())
+    os.environ["VOICES_LEDGER_DB"] = ledger_path
+    workers = [Worker(i + 1, len(targets), t, urls, run_dir, extra, args.max_restarts) for i, t in enumerate(targets)]
+    print(f"[supervisor] {len(workers)} workers x {len(urls)} search URL(s); run dir {run_dir}")
+    return run(workers, ledger_path)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,29 @@
+import time
+
+from invite_ledger import ACTION_INVITE, Ledger
+
+
+def test_any_job_lookup_matches_invites_to_any_job(tmp_path):
+    led = Ledger(str(tmp_path / "ledger.sqlite3"))
+    try:
+        led.add("t1", ACTION_INVITE, "818318")
+        assert not led.has("t1", ACTION_INVITE, "")
+        assert led.has("t1", ACTION_INVITE, "", any_job=True)
+        assert not led.has("t2", ACTION_INVITE, "", any_job=True)
+        assert led.has_many(["t1", "t2"], ACTION_INVITE, "") == set()
+        assert led.has_many(["t1", "t2"], ACTION_INVITE, "", any_job=True) == {"t1"}
+    finally:
+        led.close()
+
+
+def test_missing_for_job_and_counts_since(tmp_path):
+    led = Ledger(str(tmp_path / "ledger.sqlite3"))
+    try:
+        since = time.time() - 1
+        led.add("t1", ACTION_INVITE, "1", url="https://example/p1")
+        led.add("t2", ACTION_INVITE, "1", url="https://example/p2")
+        led.add("t2", ACTION_INVITE, "2")
+        assert led.missing_for_job(ACTION_INVITE, "1", "2") == [("t1", "https://example/p1")]
+        assert led.counts_since(since) == {(ACTION_INVITE, "1"): 2, (ACTION_INVITE, "2"): 1}
+    finally:
+        led.close()
@@ -0,0 +1,51 @@
+import json
+
+import pytest
+
+pytest.importorskip("playwright")
+import invite_all  # noqa: E402
+
+
+@pytest.fixture
+def invited_db(tmp_path, monkeypatch):
+    monkeypatch.setattr(invite_all, "INVITED_DB", str(tmp_path / "invited.json"))
+    monkeypatch.setattr(invite_all, "INVITED_DB_COMPACT_EVERY", 1000)
+    monkeypatch.setattr(invite_all, "LOG_FILE", "")
+    monkeypatch.setattr(invite_all, "ledger_add", lambda *a, **k: None)
+    monkeypatch.setattr(invite_all, "ledger_has", lambda *a, **k: False)
+    monkeypatch.setattr(invite_all, "get_ledger", lambda: None)
+    monkeypatch.setattr(invite_all, "_INVITED_DB_CACHE", None)
+    monkeypatch.setattr(invite_all, "_INVITED_DB_JOURNAL", None)
+    monkeypatch.setattr(invite_all, "_INVITED_DB_PENDING", 0)
+    yield invite_all._invited_db_journal_path()
+    if invite_all._INVITED_DB_JOURNAL is not None:
+        invite_all._INVITED_DB_JOURNAL.close()
+
+
+def _reload():
+    if invite_all._INVITED_DB_JOURNAL is not None:
+        invite_all._INVITED_DB_JOURNAL.close()
+    invite_all._INVITED_DB_JOURNAL = None
+    invite_all._INVITED_DB_CACHE = None
+    return invite_all._invited_db_load()
+
+
+def test_append_after_torn_last_line_is_replayed(invited_db):
+    good = json.dumps({"id": "111", "job": "818318", "ts": 1.0, "url": "u1"})
+    torn = json.dumps({"id": "222", "job": "818318", "ts": 2.0, "url": "u2"})[:17]
+    invited_db.write_text(good + "\n" + torn, encoding="utf-8")
+
+    invite_all.invited_db_add("333", url="u3", job_id="818318")
+
+    db = _reload()
+    assert "111" in db and "333" in db
+    assert "222" not in db
+    assert invite_all.invited_db_has("333", "818318")
+
+
+def test_append_to_clean_journal_adds_no_blank_lines(invited_db):
+    invite_all.invited_db_add("111", job_id="1")
+    invite_all.invited_db_add("222", job_id="1")
+    _reload()
+    assert invited_db.read_text(encoding="utf-8").count("\n") == 2
+    assert "" not in invited_db.read_text(encoding="utf-8").split("\n")[:-1]
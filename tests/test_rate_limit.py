@@ -0,0 +1,16 @@
+import rate_limit
+
+
+def test_accounts_differing_by_domain_suffix_get_separate_buckets(tmp_path):
+    com = rate_limit.SharedTokenBucket("bob@gmail.com", per_min=60, burst=1, directory=str(tmp_path))
+    net = rate_limit.SharedTokenBucket("bob@gmail.net", per_min=60, burst=1, directory=str(tmp_path))
+    assert com.state_path != net.state_path
+    assert com.lock_path != net.lock_path
+    assert com.state_path.name == "voices_rate_bob_gmail.com.json"
+
+    # Draining one account's bucket leaves the other's untouched
+    assert com.try_take() == 0.0
+    assert com.try_take() > 0.0
+    assert net.try_take() == 0.0
+    assert sorted(p.name for p in tmp_path.glob("*.json")) == [
+        "voices_rate_bob_gmail.com.json", "voices_rate_bob_gmail.net.json"]
@@ -0,0 +1,37 @@
+from pathlib import Path
+
+import supervisor
+
+
+def _worker(tmp_path: Path, target: dict) -> supervisor.Worker:
+    return supervisor.Worker(2, 3, target, ["https://www.voices.com/talents/search?keywords="],
+                             tmp_path, [], max_restarts=1)
+
+
+def test_profile_slot_does_not_demand_cdp(tmp_path, monkeypatch):
+    # invite_all.py defaults REQUIRE_CDP to on; a profile worker must still be allowed to launch
+    monkeypatch.setenv("REQUIRE_CDP", "1")
+    w = _worker(tmp_path, {"profile": str(tmp_path / "profile")})
+    cmd = w.command()
+    assert "--require-cdp" not in cmd
+    assert "--cdp-url" not in cmd
+    assert cmd[cmd.index("--profile-dir") + 1] == str(tmp_path / "profile")
+    assert "--no-cdp" in cmd
+    assert w.env()["REQUIRE_CDP"] == "0"
+
+
+def test_cdp_slot_requires_its_endpoint(tmp_path, monkeypatch):
+    monkeypatch.delenv("REQUIRE_CDP", raising=False)
+    w = _worker(tmp_path, {"cdp": "http://127.0.0.1:9223"})
+    cmd = w.command()
+    assert cmd[cmd.index("--cdp-url") + 1] == "http://127.0.0.1:9223"
+    assert "--require-cdp" in cmd
+    assert "REQUIRE_CDP" not in w.env()
+
+
+def test_command_resumes_from_checkpoint(tmp_path):
+    w = _worker(tmp_path, {"profile": str(tmp_path / "profile")})
+    Path(w._file(".checkpoint.json")).write_text('{"page_num": 7, "invited": 3}')
+    cmd = w.command()
+    assert cmd[cmd.index("--start-page") + 1] == "7"
+    assert cmd[cmd.index("--shard") + 1] == "2/3"
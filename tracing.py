@@ -0,0 +1,212 @@
+import asyncio
+import atexit
+import contextvars
+import itertools
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Optional
+
+# Nested timing spans (page -> card -> stage) exported in the Chrome Trace Event format,
+# so a run can be opened in chrome://tracing, https://ui.perfetto.dev or speedscope.
+#   VOICES_TRACE_FILE  write spans to this .json file (default: off; --trace-file in invite_all.py)
+# With no trace file and no listeners (see add_listener) span() is a cheap no-op.
+TRACE_FILE = os.environ.get("VOICES_TRACE_FILE", "").strip()
+
+_CURRENT: "contextvars.ContextVar[Optional[Span]]" = contextvars.ContextVar("voices_span", default=None)
+
+
+class Span:
+    __slots__ = ("name", "cat", "attrs", "parent", "lane", "start_wall", "start", "_token")
+
+    def __init__(self, name: str, cat: str, attrs: dict, parent: "Optional[Span]", lane: int):
+        self.name = name
+        self.cat = cat
+        self.attrs = attrs
+        self.parent = parent
+        self.lane = lane
+        self.start_wall = time.time()
+        self.start = time.perf_counter()
+        self._token = None
+
+    def set(self, **attrs):
+        self.attrs.update({k: v for k, v in attrs.items() if v is not None})
+
+    def end(self, error: Optional[BaseException] = None):
+        if self._token is None:
+            return
+        try:
+            _CURRENT.reset(self._token)
+        except ValueError:
+            # Ended from another context; just restore the parent
+            _CURRENT.set(self.parent)
+        self._token = None
+        if error is not None:
+            self.attrs.setdefault("error", type(error).__name__)
+        dur = time.perf_counter() - self.start
+        for fn in _LISTENERS:
+            try:
+                fn(self.name, dur, self.attrs)
+            except Exception:
+                pass
+        w = _WRITER
+        if w is not None:
+            w.emit({
+                "name": self.name,
+                "cat": self.cat,
+                "ph": "X",
+                "ts": round(self.start_wall * 1e6, 1),
+                "dur": round(dur * 1e6, 1),
+                "pid": os.getpid(),
+                "tid": self.lane,
+                "args": self.attrs,
+            })
+
+
+class TraceWriter:
+    """Streams trace events as a JSON array; an unterminated array (after a crash) is
+    still accepted by the trace viewers."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._fh = open(path, "w", encoding="utf-8")
+        self._first = True
+        self._fh.write("[\n")
+        self.emit({"name": "process_name", "ph": "M", "pid": os.getpid(), "tid": 0,
+                   "args": {"name": os.path.basename(sys.argv[0] or "voices")}})
+
+    def emit(self, evt: dict):
+        try:
+            line = json.dumps(evt, ensure_ascii=False, default=str)
+        except Exception:
+            return
+        with self._lock:
+            if self._fh is None:
+                return
+            self._fh.write(line if self._first else ",\n" + line)
+            self._first = False
+
+    def flush(self):
+        with self._lock:
+            if self._fh is not None:
+                try:
+                    self._fh.flush()
+                except Exception:
+                    pass
+
+    def close(self):
+        with self._lock:
+            if self._fh is None:
+                return
+            try:
+                self._fh.write("\n]\n")
+                self._fh.close()
+            except Exception:
+                pass
+            self._fh = None
+
+
+_WRITER: Optional[TraceWriter] = None
+_LISTENERS: list = []  # fn(name, seconds, attrs) called as each span ends (e.g. metrics)
+_LANES: dict = {}
+_LANE_IDS = itertools.count(1)
+
+
+def configure(path: Optional[str] = None) -> Optional[TraceWriter]:
+    """Start exporting spans to path (or VOICES_TRACE_FILE). Returns the writer, or None if off."""
+    global _WRITER
+    path = (path if path is not None else TRACE_FILE) or ""
+    if not path.strip():
+        return None
+    if _WRITER is not None:
+        if _WRITER.path == path:
+            return _WRITER
+        _WRITER.close()
+    try:
+        _WRITER = TraceWriter(path)
+    except Exception as e:
+        print(f"[warn] Could not open trace file {path}: {e}")
+        _WRITER = None
+    return _WRITER
+
+
+def add_listener(fn):
+    """Call fn(name, seconds, attrs) whenever a span ends; spans are recorded even without a trace file."""
+    if fn not in _LISTENERS:
+        _LISTENERS.append(fn)
+
+
+def enabled() -> bool:
+    return _WRITER is not None or bool(_LISTENERS)
+
+
+def _lane() -> int:
+    """One viewer row per asyncio task (or thread), so concurrent work doesn't overlap."""
+    try:
+        task = asyncio.current_task()
+    except RuntimeError:
+        task = None
+    key = id(task) if task is not None else ("thread", threading.get_ident())
+    lane = _LANES.get(key)
+    if lane is None:
+        lane = _LANES[key] = next(_LANE_IDS)
+        name = task.get_name() if task is not None else threading.current_thread().name
+        w = _WRITER
+        if w is not None:
+            w.emit({"name": "thread_name", "ph": "M", "pid": os.getpid(), "tid": lane, "args": {"name": name}})
+    return lane
+
+
+def start_span(name: str, cat: str = "invite", **attrs) -> Optional[Span]:
+    """Open a span as the child of the current one; call .end() on it when done.
+    Returns None when neither a trace file nor a listener is configured."""
+    if _WRITER is None and not _LISTENERS:
+        return None
+    parent = _CURRENT.get()
+    sp = Span(name, cat, {k: v for k, v in attrs.items() if v is not None}, parent, _lane())
+    sp._token = _CURRENT.set(sp)
+    return sp
+
+
+def end_span(sp: Optional[Span], error: Optional[BaseException] = None):
+    if sp is not None:
+        sp.end(error)
+
+
+@contextmanager
+def span(name: str, cat: str = "invite", **attrs):
+    sp = start_span(name, cat, **attrs)
+    try:
+        yield sp
+    except BaseException as e:
+        end_span(sp, e)
+        sp = None
+        raise
+    finally:
+        end_span(sp)
+
+
+def set_attrs(**attrs):
+    """Attach attributes to the innermost open span (e.g. a talent_id found mid-card)."""
+    sp = _CURRENT.get()
+    if sp is not None:
+        sp.set(**attrs)
+
+
+def flush():
+    if _WRITER is not None:
+        _WRITER.flush()
+
+
+def close():
+    global _WRITER
+    if _WRITER is not None:
+        _WRITER.close()
+        _WRITER = None
+
+
+atexit.register(close)
@@ -0,0 +1,248 @@
+// In-page helper runtime for the Voices automation scripts.
+// Installed once per page with context.add_init_script (see page_helpers.py) and exposed
+// as window.__voicesHelpers, so multi-step DOM work (find, measure, filter) costs one
+// evaluate instead of a dozen Playwright round trips. Clicks that need trusted input
+// events stay on the Python side; these helpers only locate and describe elements.
+// Bump VERSION whenever the API changes so stale copies in long-lived tabs get replaced.
+(() => {
+  const VERSION = 5;
+  const existing = window.__voicesHelpers;
+  if (existing && existing.version >= VERSION) return existing.version;
+
+  const visible = el => !!el && !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length)
+    && getComputedStyle(el).visibility !== "hidden";
+  const textOf = el => (el && (el.innerText || el.textContent) || "").replace(/\s+/g, " ").trim();
+  const hasText = (el, re) => re.test(el.textContent || "");
+
+  // Same rules as invite_all._extract_talent_id_from_root
+  const talentId = root => {
+    for (const a of ["data-talent-id", "data-profile-id", "data-id", "data-user-id"]) {
+      const v = root.getAttribute(a);
+      if (v && v.trim()) return v.trim();
+    }
+    const link = root.querySelector("a[href*='/talents/'], a[href*='/talent/'], a[href*='/profile/'], a[href*='/users/']");
+    const href = link ? (link.getAttribute("href") || "") : "";
+    const m = href.match(/\/talents\/([A-Za-z0-9_-]+)/) || href.match(/\/talent\/([A-Za-z0-9_-]+)/)
+      || href.match(/\/profile\/([A-Za-z0-9_-]+)/) || href.match(/\/users\/([A-Za-z0-9_-]+)/);
+    return m ? m[1] : null;
+  };
+
+  // Job ID of a modal job row (used by jobRowInviteButton and readModalState): the /jobs/ link,
+  // then a data-* attribute, then a 5+ digit number in the row text
+  const jobId = row => {
+    const link = row.querySelector("a[href*='/jobs/']");
+    const href = link ? (link.getAttribute("href") || "") : "";
+    let m = href.match(/\/jobs\/(\d+)/) || href.match(/(\d{5,})/);
+    if (m) return m[1];
+    for (const a of ["data-job-id", "data-id", "data-jobid", "data-job"]) {
+      const v = (row.getAttribute(a) || "").trim();
+      if (/^\d{5,}$/.test(v)) return v;
+    }
+    m = textOf(row).match(/\b(\d{5,})\b/);
+    return m ? m[1] : null;
+  };
+
+  const inviteButtons = card => Array.from(card.querySelectorAll("button, [role='button'], a"))
+    .filter(b => hasText(b, /invite|request a quote/i));
+
+  // Outermost visible invite modal (the modal selectors match nested wrappers too)
+  const modalRoot = modalSel => {
+    const all = Array.from(document.querySelectorAll(modalSel)).filter(visible);
+    return all.find(m => !all.some(o => o !== m && o.contains(m))) || null;
+  };
+
+  const STALE_ATTR = "data-voices-stale";
+
+  const jobRows = (root, rowSel) => root ? Array.from(root.querySelectorAll(rowSel)) : [];
+
+  const api = {
+    version: VERSION,
+
+    // One summary per talent card: ID, invited/favorited state and invite-button visibility.
+    findCardActions(cards, favActive) {
+      return cards.map((card, index) => {
+        const invited = !!card.querySelector("[aria-pressed='true'], .invited") || /invited/i.test(card.textContent || "");
+        let favorited = false;
+        try { favorited = Array.from(card.querySelectorAll(favActive)).some(visible); } catch (e) {}
+        const buttons = inviteButtons(card);
+        return {
+          index,
+          talent_id: talentId(card),
+          invited_state: invited,
+          favorited_state: favorited,
+          has_invite_button: buttons.length > 0,
+          needs_hover: !buttons.some(visible),
+        };
+      });
+    },
+
+    // Clickable element for an action on a card ("heart" or "invite"), scrolled into view; null if absent.
+    cardAction(card, kind, sel) {
+      let cands = [];
+      try {
+        cands = kind === "invite" ? inviteButtons(card) : Array.from(card.querySelectorAll(sel));
+      } catch (e) {
+        return null;
+      }
+      if (!cands.length) return null;
+      let el = cands.find(visible) || cands[0];
+      if (kind === "heart") el = el.closest("button, a, [role='button']") || el;
+      el.scrollIntoView({block: "center", inline: "nearest"});
+      return el;
+    },
+
+    // The "Invite to Existing Job" entry inside the head button's own card action area.
+    openExistingJobMenu(headBtn, requireVisible = true) {
+      const container = headBtn.closest(".ResultCard-action") || headBtn.closest(".portfolio-list-item-invite-to-job")
+        || headBtn.parentElement;
+      if (!container) return null;
+      const item = container.querySelector("button.request_a_quote_btn.menuitem")
+        || Array.from(container.querySelectorAll("button, a")).find(b => hasText(b, /invite to existing job/i));
+      if (!item || (requireVisible && !visible(item))) return null;
+      return item;
+    },
+
+    // Visible menu item (sel + one of texts, or anySel whatever its text) closest to the head
+    // button's centre. When none is visible, probe the points dys px below the button for one.
+    // Only such items are returned (else null): the caller force-clicks the result.
+    nearestMenuItem(headBtn, sel, texts, dys, anySel) {
+      const wanted = el => {
+        if (anySel && el.matches(anySel)) return true;
+        const t = textOf(el).toLowerCase();
+        return texts.some(x => t.includes(x));
+      };
+      const hb = headBtn.getBoundingClientRect();
+      const hx = hb.left + hb.width / 2, hy = hb.top + hb.height / 2;
+      let best = null, bestD = Infinity;
+      for (const el of document.querySelectorAll(sel)) {
+        if (!visible(el) || !wanted(el)) continue;
+        if (!hb.width && !hb.height) return el;  // no geometry for the button: first visible item
+        const r = el.getBoundingClientRect();
+        const dx = r.left + r.width / 2 - hx, dy = r.top + r.height / 2 - hy;
+        if (dx * dx + dy * dy < bestD) { bestD = dx * dx + dy * dy; best = el; }
+      }
+      if (best || !hb.width) return best;
+      for (const dy of dys || []) {
+        const hit = document.elementFromPoint(hx, hb.bottom + dy);
+        const el = hit && hit.closest(sel);
+        if (el && !headBtn.contains(el) && wanted(el)) return el;
+      }
+      return null;
+    },
+
+    // Size of the current search: {total} from a "N results" / "1-24 of N" label and
+    // {last_page} from "Page x of N" or the highest pagination number; null when not shown.
+    resultCount(pagerSel) {
+      const num = t => parseInt(String(t).replace(/[^\d]/g, ""), 10) || null;
+      const labels = Array.from(document.querySelectorAll(
+        "h1, h2, h3, [class*='count' i], [class*='result' i], [data-testid*='count' i], [aria-live]"
+      )).map(textOf).filter(t => t && t.length < 200);
+      let total = null, lastPage = null;
+      for (const t of labels.concat([textOf(document.body).slice(0, 20000)])) {
+        let m = t.match(/\bpage\s+\d+\s+of\s+([\d,]+)/i);
+        if (m && !lastPage) lastPage = num(m[1]);
+        m = t.match(/\b\d[\d,]*\s*[-\u2013]\s*\d[\d,]*\s+of\s+([\d,]+)/i)
+          || t.match(/([\d,]+)\s+(?:results|talents|voice actors|voice over artists|matches)\b/i);
+        if (m && !total) total = num(m[1]);
+        if (total) break;
+      }
+      if (pagerSel) {
+        try {
+          for (const el of document.querySelectorAll(pagerSel)) {
+            const n = /^\d+$/.test(textOf(el)) ? num(textOf(el)) : null;
+            if (n && (!lastPage || n > lastPage)) lastPage = n;
+          }
+        } catch (e) {}
+      }
+      return total || lastPage ? {total, last_page: lastPage} : null;
+    },
+
+    // Tag the items currently on the page so waitReady ignores them after an in-place navigation.
+    markStale(itemSel) {
+      let n = 0;
+      try { for (const el of document.querySelectorAll(itemSel)) { el.setAttribute(STALE_ATTR, "1"); n++; } } catch (e) {}
+      return n;
+    },
+
+    // Resolves once the page is usable: "modal" when the job modal has rows, "cards" when the
+    // item count is non-zero and unchanged for stableMs, "empty" when the document finished
+    // loading and nothing showed up within emptyMs, else "timeout" after maxMs. Items tagged by
+    // markStale do not count.
+    waitReady(itemSel, modalSel, rowSel, stableMs = 400, emptyMs = 2500, maxMs = 15000) {
+      return new Promise(resolve => {
+        const t0 = performance.now();
+        let lastCount = -1, since = t0, done = false, obs = null, timer = null;
+        const finish = (state, count) => {
+          if (done) return;
+          done = true;
+          if (obs) obs.disconnect();
+          clearInterval(timer);
+          resolve({state, count, ms: Math.round(performance.now() - t0)});
+        };
+        const check = () => {
+          const now = performance.now();
+          if (modalSel && rowSel && jobRows(modalRoot(modalSel), rowSel).length) return finish("modal", 0);
+          let n = 0;
+          try {
+            n = itemSel ? Array.from(document.querySelectorAll(itemSel)).filter(el => !el.hasAttribute(STALE_ATTR)).length : 0;
+          } catch (e) {}
+          if (n !== lastCount) { lastCount = n; since = now; }
+          if (n > 0 && now - since >= stableMs) return finish("cards", n);
+          if (n === 0 && document.readyState === "complete" && now - since >= emptyMs) return finish("empty", 0);
+          if (now - t0 >= maxMs) finish("timeout", n);
+        };
+        obs = new MutationObserver(check);
+        obs.observe(document.documentElement, {childList: true, subtree: true});
+        // Stability is about time passing without changes, so also tick on a timer
+        timer = setInterval(check, Math.max(50, Math.min(stableMs, 200)));
+        check();
+      });
+    },
+
+    // Everything pick_job_in_modal wants to know about the modal, in one call.
+    readModalState(modalSel, rowSel, confirmSel) {
+      const root = modalRoot(modalSel);
+      const select = document.getElementById("request-quote-open-jobs-list");
+      const rows = jobRows(root, rowSel);
+      let confirm = null;
+      try { confirm = (root || document).querySelector(confirmSel); } catch (e) {}
+      return {
+        has_modal: !!root,
+        select_val: select ? select.value : null,
+        choices: !!(root || document).querySelector(".choices"),
+        rows: rows.length,
+        job_ids: rows.map(jobId).filter(Boolean),
+        confirm_present: !!confirm,
+        confirm_enabled: !!confirm && !confirm.disabled && confirm.getAttribute("aria-disabled") !== "true",
+      };
+    },
+
+    // Row-level Invite/Select button for the wanted job: by ID first, then by title substring.
+    jobRowInviteButton(modalSel, rowSel, titleSel, requiredJobId, jobPref) {
+      const rows = jobRows(modalRoot(modalSel), rowSel);
+      const btnIn = row => Array.from(row.querySelectorAll("button, a")).find(b => hasText(b, /invite|select|choose/i)) || null;
+      if (requiredJobId) {
+        for (const r of rows) {
+          if (jobId(r) === String(requiredJobId)) {
+            const b = btnIn(r);
+            if (b) return b;
+          }
+        }
+        if (jobPref) {
+          const pref = String(jobPref).toLowerCase();
+          for (const r of rows) {
+            const t = r.querySelector(titleSel);
+            if (textOf(t).toLowerCase().includes(pref)) {
+              const b = btnIn(r);
+              if (b) return b;
+            }
+          }
+        }
+      }
+      return null;
+    },
+  };
+
+  Object.defineProperty(window, "__voicesHelpers", {value: api, configurable: true, writable: true});
+  return VERSION;
+})()